@@ -0,0 +1,188 @@
+import os
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../..')))
+import time
+import queue
+import threading
+import pandas as pd
+from selenium.common.exceptions import WebDriverException
+
+from managers.apply_ledger import ApplyLedger
+from managers.qa_store import QAStore
+from managers.question_queue import QuestionQueue
+from ai_agents.LinkedIn.easy_apply_agent.easy_apply_agent import LinkedInAutoApply
+
+
+class HourlyBudget:
+    """
+    Per-account cap on applications per rolling hour, shared by all workers.
+
+    Submitted applications are counted from the ledger (so the cap holds across
+    restarts) plus the jobs workers are applying to right now.
+    """
+
+    def __init__(self, ledger, per_hour=20, window=3600.0):
+        self.ledger = ledger
+        self.per_hour = per_hour
+        self.window = window
+        self._lock = threading.Lock()
+        self._in_flight = 0
+
+    def acquire(self):
+        """Block until one more application fits in the window, then reserve it."""
+        while True:
+            with self._lock:
+                now = time.time()
+                used, oldest = self.ledger.applied_since(now - self.window)
+                if used + self._in_flight < self.per_hour:
+                    self._in_flight += 1
+                    return
+                wait = (oldest + self.window - now) if oldest else 60.0
+            wait = min(max(wait, 1.0), 300.0)
+            print(f"⏳ Hourly budget of {self.per_hour} applications reached; waiting {wait:.0f}s")
+            time.sleep(wait)
+
+    def release(self):
+        """Drop the reservation (after the outcome is in the ledger)."""
+        with self._lock:
+            self._in_flight -= 1
+
+
+class ApplyExecutor:
+    """
+    Runs Easy Apply on several browsers at once.
+
+    Candidate jobs (Final Opinion > 5) go on a shared queue; each worker thread
+    holds one LinkedInAutoApply with its own browser from the DriverPool and
+    takes jobs until the queue is empty. All workers share the QA store, the
+    question queue, the outcome ledger and the hourly budget. Workers are always
+    unattended: unknown questions park the job instead of prompting.
+
+    A job that fails with an error is retried up to max_attempts times; a worker
+    whose browser dies (apply_job raises WebDriverException) gets a fresh one
+    before the retry. Jobs already applied to or without Easy
+    Apply (per the ledger) and jobs still parked are skipped on re-runs.
+    """
+
+    def __init__(self, username, password, driver_pool, filtered_csv="filtered_jobs.csv", workers=None,
+                 applications_per_hour=20, max_attempts=3, resume_path=None, config_manager=None):
+        self.username = username
+        self.password = password
+        self.driver_pool = driver_pool
+        self.filtered_csv = filtered_csv
+        self.workers = workers or driver_pool.size
+        self.max_attempts = max_attempts
+        self.resume_path = resume_path
+        self.config_manager = config_manager  # shared by every worker's agent (timeouts, pacing)
+
+        self.qa_store = QAStore(f"answers_{username}.json")
+        self.question_queue = QuestionQueue(f"state/pending_questions_{username}.db")
+        self.ledger = ApplyLedger(f"state/apply_ledger_{username}.db")
+        self.applied_csv = f"applied_jobs_{username}.csv"
+        self.ledger.import_applied_csv(self.applied_csv)
+        self.budget = HourlyBudget(self.ledger, per_hour=applications_per_hour)
+
+        self.applied_jobs = []
+        self._results_lock = threading.Lock()
+
+    # ---------------- Planning ----------------
+    def pending_jobs(self):
+        """[(job_id, job_url, row)]: parked jobs that are ready to resume, then new candidates."""
+        known = lambda question, kind, options: self.qa_store.lookup(question, kind=kind, options=options) is not None
+        jobs = self.question_queue.ready_jobs(known)
+
+        df = pd.read_csv(self.filtered_csv, dtype={"Job ID": str, "LinkedIn Job ID": str})
+        jobs += list(LinkedInAutoApply.jobs_to_apply(df, self.ledger, self.question_queue.parked_ids()))
+        return jobs
+
+    # ---------------- Workers ----------------
+    def _start_agent(self):
+        agent = LinkedInAutoApply(
+            self.username, self.password, filtered_csv=self.filtered_csv, driver_pool=self.driver_pool,
+            resume_path=self.resume_path, unattended=True,
+            qa_store=self.qa_store, question_queue=self.question_queue, ledger=self.ledger,
+            config_manager=self.config_manager,
+        )
+        agent.login()
+        return agent
+
+    def _worker(self, worker_id, jobs):
+        agent = None
+        while True:
+            try:
+                job, attempt = jobs.get_nowait()
+            except queue.Empty:
+                break
+            job_id, job_url, row = job
+
+            self.budget.acquire()
+            try:
+                if agent is None:
+                    agent = self._start_agent()
+                outcome = agent.apply_job(job_id, job_url, row)
+            except WebDriverException as e:
+                # Browser died: retry the job on a fresh one
+                print(f"⚠️ Worker {worker_id} lost its browser on {job_id}: {e.msg}")
+                outcome = "error"
+                if agent is not None:
+                    self._retire(agent)
+                    agent = None
+            except Exception as e:
+                print(f"⚠️ Worker {worker_id} failed on {job_id}: {e}")
+                outcome = "error"
+                if agent is not None and not agent.browser_alive():
+                    self._retire(agent)
+                    agent = None
+
+            try:
+                if outcome == "error" and attempt + 1 < self.max_attempts:
+                    jobs.put((job, attempt + 1))
+                    continue
+                self.ledger.record(job_id, job_url, outcome, attempts=attempt + 1)
+                if outcome != "needs_answers":
+                    self.question_queue.mark_resumed(job_id)  # no-op unless the job was parked
+                print(f"🧵 Worker {worker_id}: {job_id} → {outcome}")
+            finally:
+                self.budget.release()
+
+        if agent is not None:
+            self._retire(agent)
+
+    def _retire(self, agent):
+        """Keep the agent's applied jobs and hand its browser back."""
+        with self._results_lock:
+            self.applied_jobs.extend(agent.applied_jobs)
+        try:
+            agent.close()
+        except Exception as e:
+            print(f"⚠️ Could not release browser: {e}")
+
+    # ---------------- Run ----------------
+    def run(self):
+        pending = self.pending_jobs()
+        print(f"🗺️ {len(pending)} jobs to apply to, {self.workers} workers, "
+              f"{self.budget.per_hour} applications/hour. Ledger so far: {self.ledger.counts()}")
+
+        jobs = queue.Queue()
+        for job in pending:
+            jobs.put((job, 0))
+
+        threads = [
+            threading.Thread(target=self._worker, args=(i + 1, jobs), daemon=True)
+            for i in range(min(self.workers, len(pending)))
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.qa_store.compact()
+        if self.applied_jobs:
+            total = self.ledger.export_applied_csv(self.applied_csv)
+            print(f"📊 Applied to {len(self.applied_jobs)} jobs this run; {total} on record in {self.applied_csv}")
+
+        counts = self.question_queue.counts()
+        print(f"✅ Apply run finished. Ledger: {self.ledger.counts()} | parked: {counts['parked']} "
+              f"on {counts['questions']} question(s)")
+        return self.ledger.counts()
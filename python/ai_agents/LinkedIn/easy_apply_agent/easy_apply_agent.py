@@ -2,27 +2,52 @@ import os
 import sys
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../..')))
-import json
 import time
 import re
+import threading
 import pandas as pd
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException
 
 
 from managers.driver_manager import DriverManager
 from managers.config_manager import ConfigManager
+from managers.wait_manager import WaitManager
+from managers.pacing_manager import PacingManager
+from managers.resume_manager import ResumeManager
+from managers.qa_store import QAStore
+from managers.question_queue import QuestionQueue
+from managers.apply_ledger import ApplyLedger, url_keys
+from ai_agents.LinkedIn.easy_apply_agent.form_snapshot import FormSnapshot
+
+JOB_DETAILS_SCRIPT = """
+const text = selector => { const el = document.querySelector(selector); return el ? el.innerText.trim() : ''; };
+return {
+    title: text('h1.top-card-layout__title'), company: text('a.topcard__org-name-link'),
+    location: text('span.topcard__flavor--bullet'), description: text('div.show-more-less-html__markup'),
+};
+"""
+
+# Jobs whose apply button is not Easy Apply, kept for applying by hand
+NO_EASY_APPLY_CSV = "../../../jobs_without_easyapply.csv"
 
 class LinkedInAutoApply:
-    def __init__(self, username, password, filtered_csv="filtered_jobs.csv"):
+    _no_easy_apply_lock = threading.Lock()  # parallel workers append to one CSV
+
+    def __init__(self, username, password, filtered_csv="filtered_jobs.csv", driver_pool=None, resume_path=None,
+                 unattended=False, qa_store=None, question_queue=None, ledger=None, config_manager=None):
         self.username = username
         self.password = password
         self.filtered_csv = filtered_csv
         self.applied_jobs = []
 
+        # --- Config (timeouts and pacing, as for the LinkedIn scraper) ---
+        self.platform = "linkedin"
+        self.platform_config = self.load_platform_config(config_manager, self.platform)
+
         # --- Chrome profiles ---
         self.user_data_dir = "~/Library/Application Support/Google/Chrome"
         self.profiles = ["Default"]  # fallback
@@ -32,22 +57,57 @@ class LinkedInAutoApply:
         self.driver = None
         self.wait = None
 
-        # Selenium / driver setup
-        self.driver_manager = DriverManager(self.user_data_dir, self.profiles[0])
-        self.driver, self.wait = self.driver_manager.get_driver()
+        # Selenium / driver setup (a warm browser from the shared pool when given)
+        self.driver_pool = driver_pool
+        if self.driver_pool:
+            self.driver_manager = self.driver_pool.checkout()
+            self.driver, self.wait = self.driver_manager.driver, self.driver_manager.wait
+        else:
+            self.driver_manager = DriverManager(self.user_data_dir, self.profiles[0])
+            self.driver, self.wait = self.driver_manager.get_driver()
+        self.waits = WaitManager(self.driver, self.platform, self.platform_config.get("timeouts"))
+        self.pacing = PacingManager.from_config(self.platform_config)
+        self.form = FormSnapshot(self.driver)
+
+        # Parsed resume profile (cached per file version); answers years-of-experience questions
+        self.resume = ResumeManager(resume_path) if resume_path else None
 
         # Per-user Q&A file
         self.qa_file = f"answers_{username}.json"
-        if os.path.exists(self.qa_file):
-            with open(self.qa_file, "r") as f:
-                self.qa_data = json.load(f)
-        else:
-            self.qa_data = {}
+        self.qa_data = qa_store or QAStore(self.qa_file)  # shared when several agents run in parallel
+
+        # Unattended mode parks jobs on unknown questions instead of prompting
+        self.unattended = unattended
+        self.queue = question_queue or QuestionQueue(f"state/pending_questions_{username}.db")
+        self._unanswered = []  # (question, kind, options) deferred on the current job
+
+        # Durable record of every application (and other final outcomes), written at each submit
+        self.ledger = ledger or ApplyLedger(f"state/apply_ledger_{username}.db")
+        self.applied_csv = f"applied_jobs_{username}.csv"
+        self.ledger.import_applied_csv(self.applied_csv)  # applications from before the ledger existed
+
+    @staticmethod
+    def load_platform_config(config_manager, platform):
+        """The platform's config.json section; empty (site defaults) when no config file is set up."""
+        if config_manager is None:
+            try:
+                config_manager = ConfigManager(platform)
+            except FileNotFoundError:
+                print("ℹ️ No config file found; using default timeouts and pacing.")
+                return {}
+        return config_manager.get_platform_config(platform)
 
     # ---------------- Login ----------------
     def login(self):
         self.driver.get("https://www.linkedin.com/login")
-        time.sleep(3)
+        # Either the cookie redirect lands on feed/jobs or the login form renders
+        try:
+            self.waits.until(
+                lambda d: "feed" in d.current_url or "jobs" in d.current_url or d.find_elements(By.ID, "username"),
+                kind="page",
+            )
+        except TimeoutException:
+            pass
 
         # Check if already logged in via cookies
         current_url = self.driver.current_url
@@ -73,207 +133,203 @@ class LinkedInAutoApply:
         return "Sample answer generated by LLM"
 
 
-    def handle_easy_apply_form(self, job_id):
+    # ---------------- Form answers ----------------
+    def recall(self, question, kind="text", options=None):
+        """Saved answer for question, or for a reworded version of it that fits the field."""
+        match = self.qa_data.lookup(question, kind=kind, options=options)
+        if match is None:
+            return None
+        if match.confidence < 1:
+            print(f"🧠 {question} ≈ {match.question} (confidence {match.confidence:.2f})")
+        return match.answer
+
+    def defer(self, question, kind, options=None):
+        """Unattended mode: note a question for the queue instead of asking it."""
+        self._unanswered.append((question, kind, options or []))
+        print(f"⏸️ Deferred question: {question}")
+
+    def learn(self, question, answer, kind="text"):
+        """Journal a learned answer; the answers file itself is rewritten at compaction only."""
+        try:
+            self.qa_data.record(question, answer, kind)
+        except Exception as e:
+            print(f"⚠️ Failed to save answer for {question}: {e}")
+
+    def answer_radio(self, field):
+        """Option value to select for a radio group, or None to leave it as is."""
+        question = self.normalize_question(field["question"]) if field["question"] else "Unknown Radio Question"
+        current_value = field["value"]
+        answer = self.recall(question, "choice", field["options"])
+
+        if answer:  # Case 1: prefer QA data answer
+            if current_value.lower() != answer.lower():
+                value = FormSnapshot.match_option(field, answer)
+                if value is not None:
+                    print(f"🔎 Radio Question: {question} → Updated to {answer}")
+                return value
+            return None
+        if current_value:  # Case 2: preselected
+            self.learn(question, current_value, "choice")
+            print(f"📥 Learned radio answer for {question}: {current_value}")
+            return None
+        if self.unattended:
+            return self.defer(question, "choice", field["options"])
+        # Case 3: ask user
+        user_answer = input(f"❓ Radio Question: {question} → Please provide an answer: ")
+        self.learn(question, user_answer, "choice")
+        print(f"📥 Learned radio answer for {question}: {user_answer}")
+        return FormSnapshot.match_option(field, user_answer)
+
+    def answer_text(self, field):
+        """Text to type into an input/textarea, or None to leave it as is."""
+        question = (
+            self.normalize_question(field["question"]) if field["question"]
+            else field["placeholder"] or "Unknown Text Question"
+        )
+        # Detect expected input type
+        expected_type = field["type"]
+        if field["inputmode"] == "numeric" or "number" in expected_type:
+            expected_type = "number"
+        elif field["inputmode"] == "decimal":
+            expected_type = "float"
+
+        current_value = field["value"]
+        answer = self.recall(question, expected_type)
+
+        if answer:  # Case 1: already in qa_data
+            if current_value != answer:
+                print(f"🔎 Text Question: {question} → Updated to {answer}")
+                return answer
+            return None
+        if current_value:  # Case 2: prefilled
+            self.learn(question, current_value, expected_type)
+            print(f"📥 Learned text answer for {question}: {current_value}")
+            return None
+        resume_answer = self.resume.answer_for(question) if self.resume else None
+        if resume_answer:  # Case 3a: from the resume profile (not learned, so fuzzy lookups never reuse it)
+            print(f"📄 Answered {question} from resume: {resume_answer}")
+            return resume_answer
+
+        if self.unattended:
+            return self.defer(question, expected_type)
+        # Case 3: ask user
+        while True:
+            user_answer = input(
+                f"\n❓ Text Question (expects {expected_type}):\n   {question}\n   → Please provide an answer: "
+            ).strip()
+            if expected_type == "number":
+                if user_answer.isdigit():
+                    break
+                print("⚠️ Please enter a valid integer.")
+            elif expected_type == "float":
+                try:
+                    float(user_answer)
+                    break
+                except ValueError:
+                    print("⚠️ Please enter a valid number (float allowed).")
+            else:
+                if user_answer:
+                    break
+                print("⚠️ Answer cannot be empty.")
+
+        self.learn(question, user_answer, expected_type)
+        print(f"📥 Learned text answer for {question}: {user_answer}")
+        return user_answer
+
+    def answer_select(self, field):
+        """Option value to select in a dropdown, or None to leave it as is."""
+        question = self.normalize_question(field["question"]) if field["question"] else "Unknown Dropdown Question"
+        current_value = field["value"]
+        answer = self.recall(question, "choice", field["options"])
+        valid_opts = field["options"]
+
+        if answer and answer.lower() != 'select an option':  # Case 1: use saved
+            if current_value.lower() != answer.lower():
+                value = FormSnapshot.match_option(field, answer)
+                if value is not None:
+                    print(f"🔎 Dropdown Question: {question} → Updated to {answer}")
+                return value
+            return None
+        if current_value and current_value.lower() != "select an option":  # Case 2: prefilled
+            self.learn(question, current_value, "choice")
+            print(f"📥 Learned dropdown answer for {question}: {current_value}")
+            return None
+
+        if self.unattended:
+            return self.defer(question, "choice", valid_opts)
+        # Case 3: ask user
+        print(f"\n❓ Dropdown Question:\n   {question}")
+        print("   Please choose one of the following options:")
+        for idx, o in enumerate(valid_opts, start=1):
+            print(f"     {idx}. {o['text']}")
+
+        while True:
+            choice = input("   → Enter the number of your choice: ").strip()
+            if choice.isdigit() and 1 <= int(choice) <= len(valid_opts):
+                selected = valid_opts[int(choice) - 1]
+                break
+            print("⚠️ Invalid choice. Please enter a valid number.")
+
+        self.learn(question, selected["text"], "choice")
+        print(f"📥 Learned dropdown answer for {question}: {selected['text']}")
+        return selected["value"]
+
+    def handle_easy_apply_form(self, job_id, job_url=None):
+        """Fill and submit the Easy Apply modal; returns "applied", "needs_answers" or "error"."""
+        self._unanswered = []
         try:
             # Wait for Easy Apply modal
             self.wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, ".jobs-easy-apply-modal")))
+            answerers = {"radio": self.answer_radio, "text": self.answer_text, "select": self.answer_select}
 
             while True:  # loop until Submit Application step
                 modal = self.driver.find_element(By.CSS_SELECTOR, ".jobs-easy-apply-modal")
 
-                # === STEP 1: Handle Radio Groups ===
-                radio_groups = modal.find_elements(By.CSS_SELECTOR, "fieldset")
-                for group in radio_groups:
-                    try:
-                        legend_el = group.find_element(By.TAG_NAME, "legend")
-                        question = self.normalize_question(legend_el.text.strip())
-
-                    except:
-                        question = "Unknown Radio Question"
-
-                    options = group.find_elements(By.CSS_SELECTOR, "input[type='radio']")
-                    current_value = next((o.get_attribute("value") for o in options if o.is_selected()), "")
-                    answer = self.qa_data.get(question)
-
-                    if answer: # Case 1
-                        # prefer Qa data answer
-                        if current_value.lower() != answer.lower():
-                              for opt in options:
-                                if (opt.get_attribute("value") or "").lower() == answer.lower():
-                                    self.driver.execute_script("arguments[0].click();", opt)
-                                    print(f"🔎 Radio Question: {question} → Updated to {answer}")
-                                    break
-                    else:
-                       if current_value:  # Case 2
-                        self.qa_data[question] = current_value
-                        self.save_qa_data()
-
-                        print(f"📥 Learned radio answer for {question}: {current_value}")
-                       else:  # Case 3
-                        user_answer = input(f"❓ Radio Question: {question} → Please provide an answer: ")
-                        self.qa_data[question] = user_answer
-                        self.save_qa_data()
-                        print(f"📥 Learned radio answer for {question}: {user_answer}")
-
-                        for opt in options:
-                            if (opt.get_attribute("value") or "").lower() == user_answer.lower():
-                                self.driver.execute_script("arguments[0].click();", opt)
-                                break
-                
-                # === STEP 2: Handle Text Inputs ===
-                text_inputs = modal.find_elements(By.CSS_SELECTOR, "input[type='text'], textarea")
-                for t in text_inputs:
-                    try:
-                        label_el = t.find_element(By.XPATH, "./preceding::label[1]")
-                        question = self.normalize_question(label_el.text.strip())
-                    except:
-                        question = t.get_attribute("placeholder") or "Unknown Text Question"
-
-                    # Detect expected input type
-                    expected_type = t.get_attribute("type") or "text"
-                    input_mode = t.get_attribute("inputmode") or ""
-
-                    if input_mode == "numeric" or "number" in expected_type:
-                        expected_type = "number"
-                    elif input_mode == "decimal":
-                        expected_type = "float"
-
-                    current_value = t.get_attribute("value").strip()
-                    answer = self.qa_data.get(question)
-
-                    if answer:  # Case 1: already in qa_data
-                        if current_value != answer:
-                            t.clear()
-                            t.send_keys(answer)
-                            print(f"🔎 Text Question: {question} → Updated to {answer}")
-                    else:
-                        if current_value:  # Case 2: prefilled
-                            self.qa_data[question] = current_value
-                            self.save_qa_data()
-                            print(f"📥 Learned text answer for {question}: {current_value}")
-                        else:  # Case 3: ask user
-                            while True:
-                                user_answer = input(
-                                    f"\n❓ Text Question (expects {expected_type}):\n   {question}\n   → Please provide an answer: "
-                                ).strip()
-                                if expected_type == "number":
-                                    if user_answer.isdigit():
-                                        break
-                                    print("⚠️ Please enter a valid integer.")
-                                elif expected_type == "float":
-                                    try:
-                                        float(user_answer)
-                                        break
-                                    except ValueError:
-                                        print("⚠️ Please enter a valid number (float allowed).")
-                                else:
-                                    if user_answer:
-                                        break
-                                    print("⚠️ Answer cannot be empty.")
-
-                            self.qa_data[question] = user_answer
-                            self.save_qa_data()
-                            print(f"📥 Learned text answer for {question}: {user_answer}")
-                            t.clear()
-                            t.send_keys(user_answer)
-
-                # === STEP 3: Handle Dropdowns ===
-                dropdowns = modal.find_elements(By.CSS_SELECTOR, "select")
-                for d in dropdowns:
-                    try:
-                        label_el = d.find_element(By.XPATH, "./preceding::label[1]")
-                        span = label_el.find_elements(By.XPATH, ".//span[@aria-hidden='true']")
-                        if span:
-                            question_text = span[0].text.strip()
-                        else:
-                            question_text = label_el.text.strip()
-                        question = self.normalize_question(question_text)
-                    except:
-                        question = "Unknown Dropdown Question"
-
-                    current_value = d.get_attribute("value").strip()
-                    answer = self.qa_data.get(question)
-
-                    options = d.find_elements(By.TAG_NAME, "option")
-                    valid_opts = [o for o in options if o.get_attribute("value")]
-
-                    if answer and answer.lower() != 'select an option':  # Case 1: use saved
-                        if current_value.lower() != answer.lower():
-                            for o in valid_opts:
-                                if o.text.strip().lower() == answer.lower() or o.get_attribute("value").lower() == answer.lower():
-                                    o.click()
-                                    print(f"🔎 Dropdown Question: {question} → Updated to {answer}")
-                                    break
-                    else:
-                        if current_value and current_value.lower() != "select an option":  # Case 2: prefilled
-                            self.qa_data[question] = current_value
-                            self.save_qa_data()
-                            print(f"📥 Learned dropdown answer for {question}: {current_value}")
-                        else:  # Case 3: ask user
-                            print(f"\n❓ Dropdown Question:\n   {question}")
-                            print("   Please choose one of the following options:")
-                            for idx, o in enumerate(valid_opts, start=1):
-                                print(f"     {idx}. {o.text.strip()}")
-
-                            while True:
-                                choice = input("   → Enter the number of your choice: ").strip()
-                                if choice.isdigit() and 1 <= int(choice) <= len(valid_opts):
-                                    selected = valid_opts[int(choice) - 1]
-                                    user_answer = selected.text.strip()
-                                    selected.click()
-                                    break
-                                else:
-                                    print("⚠️ Invalid choice. Please enter a valid number.")
-
-                            self.qa_data[question] = user_answer
-                            self.save_qa_data()
-                            print(f"📥 Learned dropdown answer for {question}: {user_answer}")
+                # === STEP 1-3: Snapshot the step, answer in Python, fill in one script call ===
+                snapshot = self.form.take(modal)
+                fills = []
+                for field in snapshot["fields"]:
+                    value = answerers[field["kind"]](field)
+                    if value is not None:
+                        fills.append((field["id"], value))
+                for (field_id, value), ok in zip(fills, self.form.fill(modal, fills)):
+                    if not ok:
+                        print(f"⚠️ Could not fill field {field_id} with {value}")
+                if self._unanswered:
+                    return "needs_answers"
+                buttons = snapshot["buttons"]
 
                 # === STEP 4: Try to go to next page or submit ===
-                try:
-                    next_btn = modal.find_element(By.CSS_SELECTOR, "button[aria-label='Continue to next step']")
-                    if next_btn.is_enabled():
+                if buttons["next"]:
+                    try:
+                        next_btn = modal.find_element(By.CSS_SELECTOR, "button[aria-label='Continue to next step']")
                         self.driver.execute_script("arguments[0].click();", next_btn)
-                        # self.wait.until(EC.staleness_of(next_btn))  # wait for step change
                         continue
-                except:
-                    pass
+                    except WebDriverException:
+                        pass
 
-                try:
-                    review_btn = modal.find_element(By.CSS_SELECTOR, "button[aria-label='Review your application']")
-                    if review_btn.is_enabled():
+                if buttons["review"]:
+                    try:
+                        review_btn = modal.find_element(By.CSS_SELECTOR, "button[aria-label='Review your application']")
                         self.driver.execute_script("arguments[0].click();", review_btn)
                         self.wait.until(EC.staleness_of(review_btn))
                         continue
-                except:
-                    pass
+                    except WebDriverException:
+                        pass
 
-                try:
-                    submit_btn = modal.find_element(By.CSS_SELECTOR, "button[aria-label='Submit application']")
-                    if submit_btn.is_enabled():
+                if buttons["submit"]:
+                    try:
+                        submit_btn = modal.find_element(By.CSS_SELECTOR, "button[aria-label='Submit application']")
                         self.driver.execute_script("arguments[0].click();", submit_btn)
                         print("✅ Application submitted!")
-                        try:
-                            job_title = self.driver.find_element(By.CSS_SELECTOR, "h1.top-card-layout__title").text.strip()
-                        except:
-                            job_title = "Unknown"
-
-                        try:
-                            company_name = self.driver.find_element(By.CSS_SELECTOR, "a.topcard__org-name-link").text.strip()
-                        except:
-                            company_name = "Unknown"
-
-                        try:
-                            location = self.driver.find_element(By.CSS_SELECTOR, "span.topcard__flavor--bullet").text.strip()
-                        except:
-                            location = "Unknown"
-
-                        try:
-                            description = self.driver.find_element(By.CSS_SELECTOR, "div.show-more-less-html__markup").text.strip()
-                        except:
-                            description = "N/A"
-
-                        self.applied_jobs.append({
+                        # Top card details in one call; missing elements fall back as before
+                        details = self.driver.execute_script(JOB_DETAILS_SCRIPT)
+                        job_title = details["title"] or "Unknown"
+                        company_name = details["company"] or "Unknown"
+                        location = details["location"] or "Unknown"
+                        description = details["description"] or "N/A"
+
+                        applied = {
                             "Job ID": job_id,
                             "Job Title": job_title,
                             "Company": company_name,
@@ -281,78 +337,151 @@ class LinkedInAutoApply:
                             "Description": description,
                             "URL": self.driver.current_url,
                             "Applied At": time.strftime("%Y-%m-%d %H:%M:%S")
-                        })
-                        return
-                except:
-                    pass
+                        }
+                        self.applied_jobs.append(applied)
+                        try:
+                            self.ledger.record_applied(applied, job_url)
+                        except Exception as e:
+                            print(f"⚠️ Could not record application {job_id} in the ledger: {e}")
+                        return "applied"
+                    except WebDriverException:
+                        pass
 
                 # If none of the buttons found, break
                 print("⚠️ Could not find next/review/submit button. Stopping.")
-                break
+                return "error"
 
         except Exception as e:
             print(f"⛔ Error in handle_easy_apply_form: {e}")
+            return "error"
+
+    @staticmethod
+    def jobs_to_apply(df, ledger=None, skip_ids=()):
+        """
+        (job_id, job_url, row) for every job rated above 5 with a URL, selected column-wise.
+        With a ledger, jobs it already holds (by job ID or URL) are removed in one anti-join,
+        as are skip_ids (e.g. parked jobs).
+        """
+        opinion = pd.to_numeric(df["Final Opinion"], errors="coerce")
+        candidates = df[opinion > 5]
+        urls = candidates["Job URL"] if "Job URL" in candidates.columns else pd.Series(index=candidates.index, dtype=object)
+        id_column = next((c for c in ("LinkedIn Job ID", "Job ID") if c in candidates.columns), None)
+        ids = candidates[id_column].astype(object) if id_column else pd.Series(index=candidates.index, dtype=object)
+        ids = ids.where(ids.notna() & (ids.astype(str) != ""), urls)  # fallback to URL if ID missing
+
+        has_url = urls.notna() & (urls.astype(str) != "")
+        for job_id in ids[~has_url]:
+            print(f"⚠️ Job URL missing for {job_id}, skipping.")
+
+        keep = has_url & ~ids.astype(str).isin(set(map(str, skip_ids)))
+        if ledger is not None:
+            done = ledger.done_frame()
+            seen = ids.astype(str).isin(done["job_id"]) | url_keys(urls).isin(done.loc[done["url_key"] != "", "url_key"])
+            if (seen & has_url).any():
+                print(f"⏭️ Skipping {int((seen & has_url).sum())} jobs already in the apply ledger")
+            keep &= ~seen
+        candidates = candidates[keep]
+        return zip(ids[keep].tolist(), urls[keep].tolist(), candidates.to_dict("records"))
+
+    def apply_job(self, job_id, job_url, row):
+        """
+        Open one job and run Easy Apply; returns "applied", "no_easy_apply", "needs_answers" or "error".
+        Raises WebDriverException when the browser is gone, so callers retry the job on a fresh one.
+        """
+        # Open job page
+        self.pacing.pause()
+        self.driver.get(job_url)
+        print(f"➡️ Processing job {job_id}")
+
+        # Check Easy Apply
+        try:
+            #wait till button is present
+            easy_apply_button = self.waits.for_element("button.jobs-apply-button", kind="page")
+            if "Easy Apply" not in easy_apply_button.text:
+                print(f"ℹ️ Easy Apply not available for {job_id}")
+                self.log_without_easy_apply(row)
+                return "no_easy_apply"
+            easy_apply_button.click()
+            outcome = self.handle_easy_apply_form(job_id, job_url)
+        except (NoSuchElementException, TimeoutException):
+            # Possibly just a slow page: "error" is retried, while "no_easy_apply" would exclude the job for good
+            print(f"ℹ️ Easy Apply button not found for {job_id}")
+            return "error"
+
+        if outcome == "error" and not self.browser_alive():
+            # The form swallows WebDriver errors; a dead browser must not count as a job failure
+            raise WebDriverException(f"browser session lost while applying to {job_id}")
+        if outcome == "needs_answers":
+            self.queue.park(job_id, job_url, row, self._unanswered)
+            print(f"🅿️ Parked job {job_id} on {len(self._unanswered)} unanswered question(s)")
+        return outcome
+
+    def log_without_easy_apply(self, row):
+        """Append a job without Easy Apply to NO_EASY_APPLY_CSV."""
+        with self._no_easy_apply_lock:
+            exists = os.path.exists(NO_EASY_APPLY_CSV)
+            pd.DataFrame([row]).to_csv(NO_EASY_APPLY_CSV, mode="a", header=not exists, index=False)
+        print(f"📊 Logged job without Easy Apply to {NO_EASY_APPLY_CSV}")
 
     def apply_jobs(self):
-        df = pd.read_csv(self.filtered_csv)
-        jobs_to_apply = df[df["Final Opinion"] > 5]
-
-        for idx, row in jobs_to_apply.iterrows():
-            job_id = row.get("LinkedIn Job ID") or row.get("Job URL")  # fallback to URL if ID missing
-            job_url = row.get("Job URL")
-            if not job_url:
-                print(f"⚠️ Job URL missing for {job_id}, skipping.")
-                continue
-
-            # Open job page
-            self.driver.get(job_url)
-            time.sleep(10)
-            print(f"➡️ Processing job {job_id}")
-
-            # Check Easy Apply
-            try:
-                #wait till button is present
-                easy_apply_button = self.wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "button.jobs-apply-button")))
-                if "Easy Apply" in easy_apply_button.text:
-                    easy_apply_button.click()
-                    time.sleep(2)
-                    self.handle_easy_apply_form(job_id)
-                else:
-                    print(f"ℹ️ Easy Apply not available for {job_id}")
-            except (NoSuchElementException, TimeoutException):
-                e = sys.exc_info()[1]
-                if isinstance(e, NoSuchElementException):
-                    print(f"ℹ️ Easy Apply button not found for {job_id}")
-                elif isinstance(e, TimeoutException):
-                    print(f"ℹ️ Easy Apply button timed out for {job_id}")
-                    jobs_withoutEasyApply = "../../../jobs_without_easyapply.csv"
-                    if os.path.exists(jobs_withoutEasyApply):
-                        df_no_easy = pd.read_csv(jobs_withoutEasyApply)
-                        df_no_easy.add_row(row)
-                        df_no_easy.to_csv(jobs_withoutEasyApply, index=False)
-                        print(f"📊 Logged job without Easy Apply to {jobs_withoutEasyApply}")
-                    else:
-                        df_no_easy = pd.DataFrame([row])
-                        df_no_easy.to_csv(jobs_withoutEasyApply, index=False)
-                        print(f"📊 Logged job without Easy Apply to {jobs_withoutEasyApply}")
+        df = pd.read_csv(self.filtered_csv, dtype={"Job ID": str, "LinkedIn Job ID": str})
+        # Applied/finished jobs and parked ones (resumed from the queue) are filtered before any browser work
+        for job_id, job_url, row in self.jobs_to_apply(df, self.ledger, self.queue.parked_ids()):
+            self.ledger.record(job_id, job_url, self.apply_job(job_id, job_url, row))
 
         # Save QA data
-        with open(self.qa_file, "w") as f:
-            json.dump(self.qa_data, f, indent=2)
-        print("✅ Saved question-answer data.")
+        self.save_qa_data()
+
+    def resume_parked(self):
+        """Apply to parked jobs whose questions have all been answered since."""
+        if self.unattended:
+            known = lambda question, kind, options: self.qa_data.lookup(question, kind=kind, options=options) is not None
+        else:
+            known = lambda *question: True  # attended runs can still prompt for anything left
+        ready = self.queue.ready_jobs(known)
+        if ready:
+            print(f"▶️ Resuming {len(ready)} parked job(s)")
+        for job_id, job_url, row in ready:
+            outcome = self.apply_job(job_id, job_url, row)
+            self.ledger.record(job_id, job_url, outcome)
+            if outcome != "needs_answers":
+                self.queue.mark_resumed(job_id)
+
+    def answer_pending(self):
+        """Answer every question parked jobs are waiting on, in one batch at the terminal."""
+        return self.queue.answer_interactively(self.qa_data)
 
     # ---------------- Run ----------------
     def run(self):
         self.login()
+        self.resume_parked()
         self.apply_jobs()
+        counts = self.queue.counts()
+        if counts["parked"]:
+            print(f"🅿️ {counts['parked']} job(s) parked on {counts['questions']} question(s); "
+                  f"answer them with answer_pending() and run again to resume")
         if self.applied_jobs:
-            applied_csv = f"applied_jobs_{self.username}.csv"
-            df = pd.DataFrame(self.applied_jobs)
-            df.to_csv(applied_csv, index=False)
-            print(f"📊 Saved {len(self.applied_jobs)} applied jobs to {applied_csv}")
+            # The CSV is an export of the ledger, so earlier runs' applications are kept
+            total = self.ledger.export_applied_csv(self.applied_csv)
+            print(f"📊 Applied to {len(self.applied_jobs)} jobs this run; {total} on record in {self.applied_csv}")
         else:
             print("ℹ️ No jobs applied today.")
-        self.driver.quit()
+        self.close()
+
+    def browser_alive(self):
+        """Whether the browser still answers commands (any call fails once the session is gone)."""
+        try:
+            self.driver.current_url
+            return True
+        except Exception:
+            return False
+
+    def close(self):
+        """Hand the browser back to the pool (or quit it)."""
+        if self.driver_pool:
+            self.driver_pool.checkin(self.driver_manager)
+        else:
+            self.driver.quit()
 
 
     def normalize_question(self, text: str) -> str:
@@ -385,10 +514,9 @@ class LinkedInAutoApply:
         return q
 
     def save_qa_data(self):
-        """Persist learned Q/A data to file."""
+        """Compact journaled Q/A data into the answers file."""
         try:
-            with open(self.qa_file, "w") as f:
-                json.dump(self.qa_data, f, indent=2)
+            self.qa_data.compact()
             print("✅ Saved question-answer data.")
         except Exception as e:
             print(f"⚠️ Failed to save QA data: {e}")
@@ -0,0 +1,115 @@
+# Serialises every question of the current Easy Apply step. Fields are tagged
+# with a data-form-field id (unique across steps via a counter on the modal) so
+# the fill script can find them again without another lookup per element.
+SNAPSHOT_SCRIPT = """
+const modal = arguments[0], buttonLabels = arguments[1];
+let seq = Number(modal.getAttribute('data-form-seq') || 0);
+const fieldId = el => {
+    if (!el.hasAttribute('data-form-field')) el.setAttribute('data-form-field', 'f' + (seq++));
+    return el.getAttribute('data-form-field');
+};
+const text = el => (el ? (el.innerText || el.textContent || '') : '').trim();
+const precedingLabel = el => document.evaluate(
+    './preceding::label[1]', el, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+
+const fields = [];
+modal.querySelectorAll('fieldset').forEach(group => {
+    const radios = [...group.querySelectorAll("input[type='radio']")];
+    if (!radios.length) return;
+    const legend = group.querySelector('legend');
+    const checked = radios.find(r => r.checked);
+    fields.push({
+        id: fieldId(group), kind: 'radio', question: legend ? text(legend) : null,
+        value: checked ? (checked.value || '') : '',
+        options: radios.map(r => ({value: r.value || '', text: r.value || ''})),
+    });
+});
+modal.querySelectorAll("input[type='text'], textarea").forEach(el => {
+    const label = precedingLabel(el);
+    fields.push({
+        id: fieldId(el), kind: 'text', question: label ? text(label) : null,
+        placeholder: el.getAttribute('placeholder') || '',
+        type: el.getAttribute('type') || 'text', inputmode: el.getAttribute('inputmode') || '',
+        value: (el.value || '').trim(),
+    });
+});
+modal.querySelectorAll('select').forEach(el => {
+    const label = precedingLabel(el);
+    const span = label ? label.querySelector("span[aria-hidden='true']") : null;
+    fields.push({
+        id: fieldId(el), kind: 'select', question: label ? text(span || label) : null,
+        value: (el.value || '').trim(),
+        options: [...el.options].filter(o => o.value).map(o => ({value: o.value, text: (o.text || '').trim()})),
+    });
+});
+modal.setAttribute('data-form-seq', seq);
+
+const buttons = {};
+for (const [name, label] of Object.entries(buttonLabels)) {
+    const button = modal.querySelector(`button[aria-label='${label}']`);
+    buttons[name] = button ? !button.disabled : null;  // null: not on this step
+}
+return {fields: fields, buttons: buttons};
+"""
+
+# Applies [field id, value] pairs in one go. Values go through the native setter
+# and fire input/change events so LinkedIn's React state sees them.
+FILL_SCRIPT = """
+const modal = arguments[0], fills = arguments[1];
+const setValue = (el, value) => {
+    const proto = Object.getPrototypeOf(el);
+    Object.getOwnPropertyDescriptor(proto, 'value').set.call(el, value);
+    ['input', 'change', 'blur'].forEach(type => el.dispatchEvent(new Event(type, {bubbles: true})));
+};
+return fills.map(([id, value]) => {
+    const el = modal.querySelector(`[data-form-field='${id}']`);
+    if (!el) return false;
+    if (el.tagName === 'FIELDSET') {
+        const radio = [...el.querySelectorAll("input[type='radio']")].find(r => (r.value || '') === value);
+        if (!radio) return false;
+        radio.click();
+        return true;
+    }
+    el.focus();
+    setValue(el, value);
+    return true;
+});
+"""
+
+
+class FormSnapshot:
+    """
+    One-round-trip view of an Easy Apply modal step.
+
+    take() returns every radio group, text input and dropdown of the step with
+    its question, type, options and current value, plus which navigation buttons
+    are present and enabled; fill() applies all computed answers with a single
+    script call instead of a WebDriver call per element.
+    """
+
+    BUTTONS = {
+        "next": "Continue to next step",
+        "review": "Review your application",
+        "submit": "Submit application",
+    }
+
+    def __init__(self, driver):
+        self.driver = driver
+
+    def take(self, modal):
+        return self.driver.execute_script(SNAPSHOT_SCRIPT, modal, self.BUTTONS)
+
+    def fill(self, modal, fills):
+        """fills: [(field id, value)]; returns a success flag per fill."""
+        if not fills:
+            return []
+        return self.driver.execute_script(FILL_SCRIPT, modal, [list(f) for f in fills])
+
+    @staticmethod
+    def match_option(field, answer):
+        """Value of the option whose text or value equals answer (case-insensitive), or None."""
+        answer = str(answer).strip().lower()
+        for option in field["options"]:
+            if option["text"].lower() == answer or option["value"].lower() == answer:
+                return option["value"]
+        return None
@@ -1,84 +1,25 @@
 import os
 import json
+import hashlib
 import pandas as pd
-import fitz  # PyMuPDF
 from dotenv import load_dotenv
-from openai import OpenAI
+
+from ai_agents.LinkedIn.filter_job_agent.scoring_engine import ScoringEngine, DEFAULT_MODEL
+from ai_agents.LinkedIn.filter_job_agent.score_cache import ScoreCache
+from managers.resume_manager import ResumeManager
 
 # Load API key from .env file
 load_dotenv()
-client = OpenAI(
-    base_url="https://openrouter.ai/api/v1",
-    api_key=os.getenv("OPENROUTER_API_KEY"),  # Put this in your .env file
-)
 
 def extract_text_from_pdf(pdf_path):
-    """Extracts all text from a PDF file."""
-    text = ""
-    with fitz.open(pdf_path) as doc:
-        for page in doc:
-            text += page.get_text()
-    return text
-
-
-def call_llm_bulk(prompts):
-    """Send multiple prompts in one call (if your LLM supports batch)."""
-    results = []
-    for prompt in prompts:
-        try:
-            response = client.chat.completions.create(
-                model="meta-llama/llama-4-maverick:free",
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=800,
-            )
-            results.append(response.choices[0].message.content.strip())
-        except Exception as e:
-            print("❌ LLM call error:", e)
-            results.append("{}")  # fallback empty JSON
-    return results
+    """Extracts all text from a PDF file (parsed once per file version, see ResumeManager)."""
+    return ResumeManager(pdf_path).text
 
 
-def safe_parse_json(text, job_title):
-    """Try parsing JSON safely; return fallback dict on failure."""
-    try:
-        # Clean up common wrappers like ```json ... ```
-        cleaned = text.strip()
-        if cleaned.startswith("```"):
-            # remove triple backticks and optional "json"
-            cleaned = cleaned.strip("`").replace("json", "", 1).strip()
-        
-        return json.loads(cleaned)
-    except Exception as e:
-        print(f"⚠️ Error parsing JSON for job '{job_title}': {e}")
-        print("🔎 Raw output:", repr(text))
-        return {
-            "Skills Matched": "",
-            "Job Description Matched": "",
-            "Work Experience Matched": "",
-            "Reasoning": "",
-            "Final Opinion": ""
-        }
+# Bump when the template below changes, so cached verdicts from the old prompt are not reused
+PROMPT_VERSION = "1"
 
-def process_jobs(resume_text, jobs_csv, output_csv):
-    """Processes all jobs using LLM and saves annotated CSV."""
-    jobs_df = pd.read_csv(jobs_csv)
-
-    # Ensure columns exist and have proper dtype
-    for col in ["Skills Matched", "Job Description Matched", "Work Experience Matched", "Reasoning", "Final Opinion"]:
-        if col not in jobs_df.columns:
-            jobs_df[col] = None
-    jobs_df["Skills Matched"] = jobs_df["Skills Matched"].astype(object)
-    jobs_df["Job Description Matched"] = jobs_df["Job Description Matched"].astype(object)
-    jobs_df["Work Experience Matched"] = jobs_df["Work Experience Matched"].astype(object)
-    jobs_df["Reasoning"] = jobs_df["Reasoning"].astype(object)
-    jobs_df["Final Opinion"] = jobs_df["Final Opinion"].astype(object)
-
-    # Prepare prompts
-    prompts = []
-    for _, row in jobs_df.iterrows():
-        job_title = row.get('Job Title', '')
-        job_desc = row.get('Job Description', '')
-        prompt = f"""
+JOB_PROMPT = """
 You are a job matching assistant. 
 Your ONLY task is to return a valid JSON object. Do not include any text before or after the JSON.
 
@@ -99,28 +40,297 @@ Return JSON in this **exact structure**:
   "Final Opinion": number (1-10)
 }}
 """
-        prompts.append(prompt)
-
-    # Call LLM
-    llm_outputs = call_llm_bulk(prompts)
-
-    # Parse outputs into a dict keyed by row index
-    results = {
-        idx: safe_parse_json(output, row.get('Job Title', ''))
-        for output, (idx, row) in zip(llm_outputs, jobs_df.iterrows())
-    }
-
-    # Fill any missing rows
-    for idx in jobs_df.index:
-        result = results.get(idx, {})
-        if not isinstance(result, dict):
-            result = {}
-        jobs_df.at[idx, "Skills Matched"] = json.dumps(result.get("Skills Matched", []))
-        jobs_df.at[idx, "Job Description Matched"] = result.get("Job Description Matched", "")
-        jobs_df.at[idx, "Work Experience Matched"] = result.get("Work Experience Matched", "")
-        jobs_df.at[idx, "Reasoning"] = result.get("Reasoning", "")
-        jobs_df.at[idx, "Final Opinion"] = result.get("Final Opinion", "")
-
-    # Save annotated CSV
+
+
+def build_prompt(resume_text, job_title, job_desc):
+    return JOB_PROMPT.format(resume_text=resume_text, job_title=job_title, job_desc=job_desc)
+
+
+# Several postings per request, one copy of the resume
+BATCH_PROMPT_VERSION = "batch-1"
+
+BATCH_PROMPT = """
+You are a job matching assistant. 
+Your ONLY task is to return a valid JSON array. Do not include any text before or after the JSON.
+
+Resume:
+\"\"\"{resume_text}\"\"\"
+
+Job Postings:
+{job_blocks}
+Return one object per job posting, in the same order, in this **exact structure**:
+
+[
+  {{
+    "Job": "J1",
+    "Skills Matched": ["skill1", "skill2"],
+    "Job Description Matched": "yes" | "no" | "explanation",
+    "Work Experience Matched": "yes" | "no" | "explanation",
+    "Reasoning": "short reasoning why job is a good/bad match",
+    "Final Opinion": number (1-10)
+  }}
+]
+"""
+
+JOB_BLOCK = """[{label}]
+Title: {job_title}
+Description: {job_desc}
+"""
+
+VERDICT_TOKENS = 250  # output tokens to allow per job in a batch
+
+
+def estimate_tokens(text):
+    """Rough token count (~4 characters per token) for batch sizing."""
+    return len(text) // 4 + 1
+
+
+def plan_batches(resume_text, jobs, token_budget=6000, max_jobs=10):
+    """
+    Group job keys into batches whose prompt stays within token_budget input
+    tokens. jobs: {key: (title, description)}. A job too large for any batch goes alone.
+    """
+    base = estimate_tokens(BATCH_PROMPT.format(resume_text=resume_text, job_blocks=""))
+    batches, current, used = [], [], base
+    for key, (job_title, job_desc) in jobs.items():
+        cost = estimate_tokens(JOB_BLOCK.format(label="J00", job_title=job_title, job_desc=job_desc))
+        if current and (used + cost > token_budget or len(current) >= max_jobs):
+            batches.append(current)
+            current, used = [], base
+        current.append(key)
+        used += cost
+    if current:
+        batches.append(current)
+    return batches
+
+
+def build_batch_prompt(resume_text, jobs, batch):
+    job_blocks = "\n".join(
+        JOB_BLOCK.format(label=f"J{i}", job_title=jobs[key][0], job_desc=jobs[key][1])
+        for i, key in enumerate(batch, 1)
+    )
+    return BATCH_PROMPT.format(resume_text=resume_text, job_blocks=job_blocks)
+
+
+def split_batch_output(text, batch):
+    """{key: verdict} from a batch response, or None if it does not line up with the batch."""
+    try:
+        verdicts = json.loads(_strip_code_fence(text))
+    except Exception:
+        return None
+    if not isinstance(verdicts, list) or len(verdicts) != len(batch) or not all(isinstance(v, dict) for v in verdicts):
+        return None
+    labels = [str(v.get("Job", "")) for v in verdicts]
+    if sorted(labels) == sorted(f"J{i}" for i in range(1, len(batch) + 1)):
+        verdicts = sorted(verdicts, key=lambda v: int(str(v["Job"])[1:]))  # trust labels over order
+    return {key: {k: v for k, v in verdict.items() if k != "Job"} for key, verdict in zip(batch, verdicts)}
+
+
+def score_in_batches(resume_text, jobs, results_path=None, token_budget=6000, max_jobs=10, **engine_kwargs):
+    """
+    Score {key: (title, description)} with several jobs per request and return
+    {key: verdict}. Jobs from a batch whose answer cannot be split are re-sent one by one.
+    """
+    batches = plan_batches(resume_text, jobs, token_budget, max_jobs)
+    print(f"📦 {len(jobs)} jobs packed into {len(batches)} requests.")
+    batch_keys = ["batch-" + hashlib.sha1("|".join(batch).encode("utf-8")).hexdigest()[:16] for batch in batches]
+    batch_kwargs = dict(engine_kwargs)
+    batch_kwargs.setdefault("max_tokens", VERDICT_TOKENS * max_jobs)
+    outputs = call_llm_bulk(
+        [build_batch_prompt(resume_text, jobs, batch) for batch in batches],
+        keys=batch_keys, results_path=results_path, **batch_kwargs,
+    )
+
+    verdicts, retry = {}, []
+    for batch, output in zip(batches, outputs):
+        split = split_batch_output(output, batch)
+        if split is None:
+            retry.extend(batch)
+        else:
+            verdicts.update(split)
+
+    if retry:
+        print(f"⚠️ {len(retry)} jobs came back in unparseable batches; scoring them one by one.")
+        outputs = call_llm_bulk(
+            [build_prompt(resume_text, *jobs[key]) for key in retry],
+            keys=retry, results_path=results_path, **engine_kwargs,
+        )
+        for key, output in zip(retry, outputs):
+            verdicts[key] = safe_parse_json(output, jobs[key][0])
+    return verdicts
+
+
+def call_llm_bulk(prompts, keys=None, results_path=None, **engine_kwargs):
+    """
+    Score prompts concurrently (see ScoringEngine) and return outputs in prompt order.
+    With results_path, answers are written as they arrive and an interrupted run resumes.
+    """
+    keys = [str(k) for k in keys] if keys is not None else [str(i) for i in range(len(prompts))]
+    engine = ScoringEngine(results_path=results_path, **engine_kwargs)
+    outputs = engine.run(list(zip(keys, prompts)))
+    return [outputs.get(key, "{}") for key in keys]
+
+
+def _strip_code_fence(text):
+    """Clean up common wrappers like ```json ... ```"""
+    cleaned = text.strip()
+    if cleaned.startswith("```"):
+        # remove triple backticks and optional "json"
+        cleaned = cleaned.strip("`").replace("json", "", 1).strip()
+    return cleaned
+
+
+def safe_parse_json(text, job_title):
+    """Try parsing JSON safely; return fallback dict on failure."""
+    try:
+        return json.loads(_strip_code_fence(text))
+    except Exception as e:
+        print(f"⚠️ Error parsing JSON for job '{job_title}': {e}")
+        print("🔎 Raw output:", repr(text))
+        return {
+            "Skills Matched": "",
+            "Job Description Matched": "",
+            "Work Experience Matched": "",
+            "Reasoning": "",
+            "Final Opinion": ""
+        }
+
+RESULT_COLUMNS = ["Skills Matched", "Job Description Matched", "Work Experience Matched", "Reasoning", "Final Opinion"]
+
+
+def build_prompts(resume_text, titles, descriptions):
+    """JOB_PROMPT for every (title, description) pair, built with column-wise string ops."""
+    head, rest = JOB_PROMPT.split("{job_title}")
+    middle, tail = rest.split("{job_desc}")
+    return head.format(resume_text=resume_text) + titles + middle.format() + descriptions + tail.format()
+
+
+def _text_column(jobs_df, *names):
+    for name in names:
+        if name in jobs_df.columns:
+            return jobs_df[name].fillna("").astype(str)
+    return pd.Series("", index=jobs_df.index)
+
+
+def apply_verdicts(jobs_df, row_keys, verdicts):
+    """
+    Fill RESULT_COLUMNS column-wise. row_keys: Series of verdict keys aligned to
+    jobs_df (NaN for rows without one); verdicts: {key: verdict dict}.
+    """
+    parsed = pd.DataFrame.from_dict(
+        {key: verdict for key, verdict in verdicts.items() if isinstance(verdict, dict)}, orient="index"
+    )
+    parsed = parsed.reindex(columns=RESULT_COLUMNS).reindex(row_keys.to_numpy())
+    parsed.index = jobs_df.index
+
+    skills = parsed["Skills Matched"].astype(object)
+    skills = skills.where(skills.notna(), None)
+    jobs_df["Skills Matched"] = [json.dumps(s if s is not None else []) for s in skills]
+    for col in RESULT_COLUMNS[1:]:
+        jobs_df[col] = parsed[col].astype(object).where(parsed[col].notna(), "")
+    return jobs_df
+
+
+def process_jobs(resume_text, jobs_csv, output_csv, cache=None, prefilter=None, batch_tokens=None,
+                 similarity=None, similarity_top_k=None, result_manager=None, stage="filter", **engine_kwargs):
+    """
+    Processes all jobs using LLM and saves annotated CSV.
+    With a PreFilter, jobs it rejects are not sent to the LLM and get a Final Opinion of 0.
+    With a SimilarityIndex, new jobs are added to it and every row gets a Similarity
+    Score against the resume; with similarity_top_k as well, only that many of the
+    most similar remaining jobs are sent to the LLM (the others get a Final Opinion of 0).
+    With batch_tokens, several jobs share one request (and one copy of the resume)
+    of up to that many input tokens.
+    With a ResultManager, only jobs stored since `stage` last ran are read (not
+    jobs_csv); their rows are appended to output_csv and the stage's cursor moves
+    forward only once output_csv is written.
+    """
+    if result_manager is not None:
+        new_jobs, cursor = result_manager.read_new(stage)
+        if not new_jobs:
+            print(f"✅ No new jobs since the last {stage} run.")
+            return
+        jobs_df = pd.DataFrame(new_jobs)
+        print(f"🆕 {len(jobs_df)} new jobs since the last {stage} run.")
+    else:
+        jobs_df = pd.read_csv(jobs_csv)
+    skip_reasons = {}  # row index -> Reasoning for jobs kept away from the LLM
+
+    # Cheap local pass first: obvious mismatches never reach the LLM
+    if prefilter is not None:
+        prefilter_scores = prefilter.score(jobs_df)
+        keep = prefilter.select(jobs_df, prefilter_scores)
+        jobs_df["Prefilter Score"] = prefilter_scores["Prefilter Score"].round(3)
+        for idx, score in jobs_df.loc[~keep, "Prefilter Score"].items():
+            skip_reasons[idx] = f"Skipped by local pre-filter (score {score})"
+        print(f"🧹 Pre-filter kept {int(keep.sum())}/{len(jobs_df)} jobs ({int((~keep).sum())} LLM calls avoided).")
+    else:
+        keep = pd.Series(True, index=jobs_df.index)
+
+    # Embedding rank against the resume: one matrix-vector product over the on-disk index
+    if similarity is not None:
+        texts = _text_column(jobs_df, "Job Title") + "\n" + _text_column(jobs_df, "Job Description", "Description")
+        index_keys = texts.map(lambda text: hashlib.sha1(text.encode("utf-8")).hexdigest())
+        added = similarity.add(index_keys, texts)
+        jobs_df["Similarity Score"] = pd.Series(similarity.scores_for(index_keys, resume_text), index=jobs_df.index).round(3)
+        if similarity_top_k is not None and keep.sum() > similarity_top_k:
+            order = jobs_df.loc[keep, "Similarity Score"].rank(method="first", ascending=False)
+            dropped = order.index[order > similarity_top_k]
+            keep[dropped] = False
+            for idx, score in jobs_df.loc[dropped, "Similarity Score"].items():
+                skip_reasons[idx] = f"Skipped by similarity ranking (score {score})"
+        print(f"🧭 Similarity index: {added} jobs added, {len(similarity)} indexed, {int(keep.sum())} sent on to scoring.")
+
+    # Key jobs by content so those scored before are served from the cache
+    cache = cache or ScoreCache()
+    model = engine_kwargs.get("model", DEFAULT_MODEL)
+    prompt_version = BATCH_PROMPT_VERSION if batch_tokens else PROMPT_VERSION
+    titles = _text_column(jobs_df, "Job Title")[keep]
+    descriptions = _text_column(jobs_df, "Job Description", "Description")[keep]
+    keys = pd.Series(
+        [ScoreCache.make_key(resume_text, f"{t}\n{d}", model, prompt_version) for t, d in zip(titles, descriptions)],
+        index=titles.index, dtype=object,
+    )
+
+    verdicts = cache.get_many(keys)
+    todo = ~keys.isin(list(verdicts)) & ~keys.duplicated()
+    missing = keys[todo].tolist()
+    print(f"🗄️ {keys.nunique() - len(missing)} jobs already scored, {len(missing)} sent to the LLM.")
+
+    # Call LLM; partial results live next to the output until the CSV is written
+    results_path = os.path.splitext(output_csv)[0] + ".scores.jsonl"
+    if batch_tokens:
+        jobs = dict(zip(missing, zip(titles[todo], descriptions[todo])))
+        scored = score_in_batches(resume_text, jobs, results_path, token_budget=batch_tokens, **engine_kwargs)
+    else:
+        llm_outputs = call_llm_bulk(
+            build_prompts(resume_text, titles[todo], descriptions[todo]).tolist(),
+            keys=missing, results_path=results_path, **engine_kwargs,
+        )
+        scored = {key: safe_parse_json(output, title) for key, output, title in zip(missing, llm_outputs, titles[todo])}
+
+    fresh = {}
+    for key, verdict in scored.items():
+        if isinstance(verdict, dict) and verdict.get("Final Opinion") not in (None, ""):
+            fresh[key] = verdict  # only cache real verdicts, so failures are retried next run
+        verdicts[key] = verdict
+    if fresh:
+        cache.put_many(fresh)
+    print("🗄️ Score cache:", cache.stats())
+
+    # Assign results column-wise; rows skipped before the LLM get their own verdict
+    row_keys = keys.reindex(jobs_df.index)
+    for idx, reason in skip_reasons.items():
+        row_keys[idx] = f"skipped-{idx}"
+        verdicts[f"skipped-{idx}"] = {"Reasoning": reason, "Final Opinion": 0}
+    apply_verdicts(jobs_df, row_keys, verdicts)
+
+    # Save annotated CSV (earlier runs' rows kept when only new jobs were scored)
+    if result_manager is not None and os.path.exists(output_csv):
+        jobs_df = pd.concat([pd.read_csv(output_csv, dtype={"Job ID": str}), jobs_df], ignore_index=True)
     jobs_df.to_csv(output_csv, index=False)
     print(f"✅ Output written to {output_csv}")
+    if result_manager is not None:
+        result_manager.advance(stage, cursor)
+    if os.path.exists(results_path):
+        os.remove(results_path)
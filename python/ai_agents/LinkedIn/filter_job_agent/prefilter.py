@@ -0,0 +1,116 @@
+import re
+import numpy as np
+import pandas as pd
+
+from managers.config_manager import ConfigManager
+from managers.resume_manager import resume_years
+
+# Words too common in resumes and job posts to say anything about fit
+STOPWORDS = {
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "in", "into", "is", "it", "of", "on",
+    "or", "our", "the", "to", "we", "with", "you", "your", "will", "this", "that", "have", "has", "using",
+    "used", "use", "work", "working", "worked", "team", "teams", "experience", "years", "year", "role",
+    "skills", "skill", "ability", "strong", "good", "knowledge", "project", "projects", "company", "job",
+    "developed", "development", "building", "built", "based", "across", "etc", "including", "new", "high",
+    "responsible", "responsibilities", "requirements", "about", "who", "all", "more", "other", "also",
+    "email", "phone", "linkedin", "github", "india", "present", "university", "college", "b", "tech",
+}
+
+TOKEN_PATTERN = re.compile(r"[a-z][a-z0-9+#.\-]*[a-z0-9+#]|[a-z]")
+EXPERIENCE_PATTERN = r"(\d+(?:\.\d+)?)"
+
+
+def resume_terms(resume_text):
+    """Distinct meaningful tokens of the resume (skills, tools, domains)."""
+    tokens = TOKEN_PATTERN.findall((resume_text or "").lower())
+    return {t for t in tokens if t not in STOPWORDS and len(t) > 1}
+
+
+class PreFilter:
+    """
+    Cheap local scoring of jobs before any LLM call.
+
+    Three signals, each in [0, 1], computed column-wise over the whole frame:
+      - Skill Overlap: distinct resume terms found in the job title/description,
+        saturating at `saturation` terms.
+      - Experience Fit: 1 when the first number in "Experience Required" is within
+        the resume's years plus `experience_slack`; unknown requirements count as a fit.
+      - Title Match: 1 for an enabled config title, 0 for a title the config
+        disables, 0.5 otherwise.
+
+    Jobs are kept when their weighted score reaches `threshold`, or, with top_k,
+    the top_k best scores are kept.
+    """
+
+    WEIGHTS = {"Skill Overlap": 0.5, "Experience Fit": 0.2, "Title Match": 0.3}
+
+    def __init__(self, resume_text, titles=None, threshold=0.45, top_k=None,
+                 saturation=30, experience_slack=2, weights=None):
+        self.terms = resume_terms(resume_text)
+        self.years = resume_years(resume_text)
+        self.titles = titles or {}
+        self.threshold = threshold
+        self.top_k = top_k
+        self.saturation = saturation
+        self.experience_slack = experience_slack
+        self.weights = weights or self.WEIGHTS
+
+        # Longest first so "machine learning" wins over "machine"
+        terms = sorted(self.terms, key=len, reverse=True)
+        self._term_regex = r"(?<![a-z0-9])(?:" + "|".join(map(re.escape, terms)) + r")(?![a-z0-9])" if terms else None
+        enabled = [t for t, on in self.titles.items() if on]
+        self._enabled_regex = r"\b(?:" + "|".join(map(re.escape, enabled)) + r")\b" if enabled else None
+        self._disabled = {t.strip().lower() for t, on in self.titles.items() if not on and t.strip()}
+
+    @classmethod
+    def from_config(cls, resume_text, platform="linkedin", **kwargs):
+        """Pre-filter using the title rules in config.json."""
+        return cls(resume_text, titles=ConfigManager(platform).get_titles_dict(), **kwargs)
+
+    @staticmethod
+    def _column(jobs_df, *names):
+        for name in names:
+            if name in jobs_df.columns:
+                return jobs_df[name].fillna("").astype(str)
+        return pd.Series("", index=jobs_df.index)
+
+    def score(self, jobs_df):
+        """DataFrame of the three signals plus "Prefilter Score", aligned to jobs_df."""
+        titles = self._column(jobs_df, "Job Title")
+        text = (titles + " " + self._column(jobs_df, "Job Description", "Description")).str.lower()
+
+        if self._term_regex:
+            matched = text.str.findall(self._term_regex).map(lambda found: len(set(found)))
+            skill = np.minimum(matched.to_numpy(dtype=float) / self.saturation, 1.0)
+        else:
+            skill = np.zeros(len(jobs_df))
+
+        required = pd.to_numeric(
+            self._column(jobs_df, "Experience Required").str.extract(EXPERIENCE_PATTERN, expand=False),
+            errors="coerce",
+        ).to_numpy()
+        if self.years is None:
+            experience = np.ones(len(jobs_df))
+        else:
+            experience = np.where(np.isnan(required) | (required <= self.years + self.experience_slack), 1.0, 0.0)
+
+        title_match = np.full(len(jobs_df), 0.5)
+        if self._disabled:
+            title_match[titles.str.strip().str.lower().isin(self._disabled).to_numpy()] = 0.0
+        if self._enabled_regex:
+            title_match[titles.str.contains(self._enabled_regex, case=False, regex=True).to_numpy()] = 1.0
+
+        scores = pd.DataFrame(
+            {"Skill Overlap": skill, "Experience Fit": experience, "Title Match": title_match},
+            index=jobs_df.index,
+        )
+        scores["Prefilter Score"] = sum(scores[name] * weight for name, weight in self.weights.items())
+        return scores
+
+    def select(self, jobs_df, scores=None):
+        """Boolean Series: True for jobs worth sending to the LLM."""
+        scores = self.score(jobs_df) if scores is None else scores
+        total = scores["Prefilter Score"]
+        if self.top_k is not None:
+            return pd.Series(total.index.isin(total.nlargest(self.top_k).index), index=total.index) & (total > 0)
+        return total >= self.threshold
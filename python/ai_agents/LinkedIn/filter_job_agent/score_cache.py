@@ -0,0 +1,108 @@
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+
+
+class ScoreCache:
+    """
+    Persistent, content-addressed cache of parsed LLM verdicts.
+
+    The key is a sha256 of (resume text, job description, model, prompt version),
+    so a verdict is reused for as long as none of those change, and goes stale on
+    its own when any of them does. Entries expire after ttl_days; above
+    max_entries the least recently used ones are evicted.
+    """
+
+    def __init__(self, db_path="state/score_cache.db", max_entries=50000, ttl_days=30):
+        self.db_path = db_path
+        self.max_entries = max_entries
+        self.ttl = ttl_days * 86400 if ttl_days else None
+        os.makedirs(os.path.dirname(self.db_path) or ".", exist_ok=True)
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS verdicts (
+                key TEXT PRIMARY KEY,
+                verdict TEXT NOT NULL,
+                created REAL NOT NULL,
+                accessed REAL NOT NULL
+            )
+        """)
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_verdicts_accessed ON verdicts(accessed)")
+        self.conn.commit()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(resume_text, job_description, model, prompt_version):
+        digest = hashlib.sha256()
+        for part in (resume_text, job_description, model, prompt_version):
+            digest.update(str(part or "").encode("utf-8"))
+            digest.update(b"\x00")  # separator so ("ab", "c") != ("a", "bc")
+        return digest.hexdigest()
+
+    # ---------------- Reads ----------------
+    def get_many(self, keys):
+        """{key: verdict} for the keys that are cached and not expired; counts hits and misses."""
+        keys = list(dict.fromkeys(keys))
+        now = time.time()
+        found = {}
+        with self._lock:
+            for start in range(0, len(keys), 500):  # stay under SQLite's bound-parameter limit
+                chunk = keys[start:start + 500]
+                rows = self.conn.execute(
+                    f"SELECT key, verdict, created FROM verdicts WHERE key IN ({','.join('?' * len(chunk))})", chunk
+                ).fetchall()
+                for key, verdict, created in rows:
+                    if self.ttl is None or now - created < self.ttl:
+                        found[key] = json.loads(verdict)
+            if found:
+                self.conn.executemany("UPDATE verdicts SET accessed = ? WHERE key = ?", [(now, k) for k in found])
+                self.conn.commit()
+        self.hits += len(found)
+        self.misses += len(keys) - len(found)
+        return found
+
+    def get(self, key):
+        return self.get_many([key]).get(key)
+
+    # ---------------- Writes ----------------
+    def put_many(self, verdicts):
+        """Store {key: verdict dict}, then apply TTL and LRU eviction."""
+        now = time.time()
+        with self._lock:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO verdicts (key, verdict, created, accessed) VALUES (?, ?, ?, ?)",
+                [(k, json.dumps(v, ensure_ascii=False), now, now) for k, v in verdicts.items()],
+            )
+            self._evict(now)
+            self.conn.commit()
+
+    def put(self, key, verdict):
+        self.put_many({key: verdict})
+
+    def _evict(self, now):
+        if self.ttl is not None:
+            self.conn.execute("DELETE FROM verdicts WHERE created < ?", (now - self.ttl,))
+        if self.max_entries:
+            self.conn.execute(
+                "DELETE FROM verdicts WHERE key IN (SELECT key FROM verdicts ORDER BY accessed DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+
+    # ---------------- Stats ----------------
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": self.conn.execute("SELECT COUNT(*) FROM verdicts").fetchone()[0],
+        }
+
+    def close(self):
+        self.conn.close()
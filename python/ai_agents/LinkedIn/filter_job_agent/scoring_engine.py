@@ -0,0 +1,179 @@
+import os
+import json
+import time
+import random
+import asyncio
+import threading
+from urllib.parse import urlparse
+from dotenv import load_dotenv
+import openai
+from openai import AsyncOpenAI
+
+load_dotenv()
+
+DEFAULT_BASE_URL = os.getenv("LLM_BASE_URL", "https://openrouter.ai/api/v1")
+DEFAULT_MODEL = "meta-llama/llama-4-maverick:free"
+
+
+class TokenBucket:
+    """
+    Token bucket: `rate` tokens per second, bursts up to `capacity`.
+
+    State is guarded by a threading.Lock rather than an asyncio.Lock, so one
+    bucket can be shared by engines running under different event loops (each
+    asyncio.run starts a new one). acquire() reserves its tokens under the lock,
+    letting the balance go negative, and sleeps off the debt outside it.
+    """
+
+    def __init__(self, rate, capacity=None):
+        self.rate = rate
+        self.capacity = capacity or max(1.0, rate)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens=1):
+        """Take tokens now; returns how many seconds to wait before using them."""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= tokens
+            return max(0.0, -self.tokens / self.rate)
+
+    async def acquire(self, tokens=1):
+        wait = self.reserve(tokens)
+        if wait:
+            await asyncio.sleep(wait)
+
+
+class ScoringEngine:
+    """
+    Concurrent LLM caller for job scoring.
+
+    Prompts are sent through an AsyncOpenAI client with bounded concurrency, a
+    token-bucket rate limit per provider (API host), and retries with jittered
+    exponential backoff on 429/5xx and connection errors. Every completed
+    answer is appended to a JSONL results file and fsynced straight away, so an
+    interrupted run resumes with only the missing prompts.
+
+    Point base_url at any OpenAI-compatible server (e.g. a local stub) to test it.
+    """
+
+    RETRYABLE = (openai.RateLimitError, openai.APIConnectionError, openai.APITimeoutError, openai.InternalServerError)
+
+    # One bucket per provider host, shared by every engine (and event loop) in the process
+    _buckets = {}
+    _buckets_lock = threading.Lock()
+
+    def __init__(self, model=DEFAULT_MODEL, base_url=DEFAULT_BASE_URL, api_key=None,
+                 concurrency=8, requests_per_minute=20, max_retries=5, max_tokens=800,
+                 results_path=None, timeout=120):
+        self.model = model
+        self.base_url = base_url
+        self.api_key = api_key or os.getenv("OPENROUTER_API_KEY") or "not-needed"
+        self.concurrency = concurrency
+        self.requests_per_minute = requests_per_minute
+        self.max_retries = max_retries
+        self.max_tokens = max_tokens
+        self.results_path = results_path
+        self.timeout = timeout
+
+    def _bucket(self):
+        host = urlparse(self.base_url).netloc
+        with self._buckets_lock:
+            if host not in self._buckets:
+                self._buckets[host] = TokenBucket(self.requests_per_minute / 60.0)
+            return self._buckets[host]
+
+    # ---------------- Results File ----------------
+    def load_results(self):
+        """{key: output} already written by an earlier (possibly interrupted) run."""
+        done = {}
+        if not self.results_path or not os.path.exists(self.results_path):
+            return done
+        with open(self.results_path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # torn last line
+                done[record["key"]] = record["output"]
+        return done
+
+    def _append_result(self, key, output):
+        """Append one answer (one batch of jobs when scoring in batches) and fsync it, as ResultSink does."""
+        if not self.results_path:
+            return
+        with open(self.results_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps({"key": key, "output": output}, ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    # ---------------- Calls ----------------
+    def _retry_delay(self, attempt, error):
+        """Full-jitter exponential backoff, honouring Retry-After when the server sends it."""
+        response = getattr(error, "response", None)
+        retry_after = response.headers.get("retry-after") if response is not None else None
+        if retry_after:
+            try:
+                return float(retry_after) + random.uniform(0, 1)
+            except ValueError:
+                pass
+        return random.uniform(0, min(60.0, 2 ** attempt))
+
+    async def _call(self, client, prompt):
+        for attempt in range(self.max_retries + 1):
+            await self._bucket().acquire()
+            try:
+                response = await client.chat.completions.create(
+                    model=self.model,
+                    messages=[{"role": "user", "content": prompt}],
+                    max_tokens=self.max_tokens,
+                )
+                return (response.choices[0].message.content or "").strip()
+            except self.RETRYABLE as e:
+                if attempt == self.max_retries:
+                    raise
+                delay = self._retry_delay(attempt, e)
+                print(f"⏳ LLM {type(e).__name__}, retrying in {delay:.1f}s ({attempt + 1}/{self.max_retries})")
+                await asyncio.sleep(delay)
+
+    async def score_all(self, items):
+        """
+        items: list of (key, prompt). Returns {key: output}; failed prompts map to "{}".
+        Keys already present in the results file are not sent again.
+        """
+        results = self.load_results()
+        pending = [(key, prompt) for key, prompt in items if key not in results]
+        if len(pending) < len(items):
+            print(f"♻️ Resuming: {len(items) - len(pending)} prompts already answered.")
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+        client = AsyncOpenAI(base_url=self.base_url, api_key=self.api_key, timeout=self.timeout, max_retries=0)
+        completed = 0
+
+        async def worker(key, prompt):
+            nonlocal completed
+            async with semaphore:
+                try:
+                    output = await self._call(client, prompt)
+                except Exception as e:
+                    print("❌ LLM call error:", e)
+                    results[key] = "{}"  # fallback empty JSON, not persisted so a re-run retries it
+                    return
+            results[key] = output
+            self._append_result(key, output)
+            completed += 1
+            if completed % 25 == 0:
+                print(f"🤖 Scored {completed}/{len(pending)} jobs...")
+
+        try:
+            await asyncio.gather(*(worker(key, prompt) for key, prompt in pending))
+        finally:
+            await client.close()
+        return results
+
+    def run(self, items):
+        """Blocking wrapper around score_all."""
+        return asyncio.run(self.score_all(items))
@@ -0,0 +1,224 @@
+import os
+import re
+import json
+import zlib
+import numpy as np
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9][a-z0-9+#.]*[a-z0-9+#]|[a-z0-9]")
+
+
+class HashingEmbedder:
+    """
+    Dependency-free text vectors: unigrams and bigrams hashed (crc32, signed) into
+    `dim` buckets with log-scaled term frequency, L2-normalised. IDF is not baked
+    in, so vectors never need recomputing as the corpus grows; the index applies
+    it to the query instead.
+    """
+
+    name = "hashing"
+    uses_idf = True
+
+    def __init__(self, dim=1024):
+        self.dim = dim
+
+    def _features(self, text):
+        tokens = TOKEN_PATTERN.findall((text or "").lower())
+        return tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+
+    def embed(self, texts):
+        rows, hashes = [], []
+        for row, text in enumerate(texts):
+            features = self._features(text)
+            rows.extend([row] * len(features))
+            hashes.extend(zlib.crc32(feature.encode("utf-8")) for feature in features)
+        hashes = np.array(hashes, dtype=np.uint32)
+        signs = np.where(hashes & 0x80000000, 1.0, -1.0).astype(np.float32)
+
+        vectors = np.zeros((len(texts), self.dim), dtype=np.float32)
+        np.add.at(vectors, (np.array(rows, dtype=np.int64), (hashes % self.dim).astype(np.int64)), signs)
+        vectors = np.sign(vectors) * np.log1p(np.abs(vectors))
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors / np.maximum(norms, 1e-12)
+
+
+class SentenceEmbedder:
+    """
+    CPU sentence-transformers model (optional dependency); vectors are normalised.
+    The model is downloaded on first use unless it is already in the local cache.
+    """
+
+    name = "sentence-transformers"
+    uses_idf = False
+
+    def __init__(self, model_name="all-MiniLM-L6-v2"):
+        from sentence_transformers import SentenceTransformer
+        self.model = SentenceTransformer(model_name, device="cpu")
+        self.name = f"sentence-transformers/{model_name}"
+        self.dim = self.model.get_sentence_embedding_dimension()
+
+    def embed(self, texts):
+        return self.model.encode(list(texts), normalize_embeddings=True, convert_to_numpy=True).astype(np.float32)
+
+
+EMBEDDERS = {"hashing": HashingEmbedder, "sentence-transformers": SentenceEmbedder}
+
+
+def make_embedder(name="hashing", **kwargs):
+    """Embedder by name (see EMBEDDERS); never falls back to another one silently."""
+    if name not in EMBEDDERS:
+        raise ValueError(f"Unknown embedder {name!r}; expected one of {sorted(EMBEDDERS)}")
+    return EMBEDDERS[name](**kwargs)
+
+
+class SimilarityIndex:
+    """
+    On-disk job/resume similarity index.
+
+    Job vectors live in a float32 file memory-mapped as an (n, dim) array; keys
+    and metadata sit next to it. Adding jobs appends only the new vectors, and
+    ranking every job against a resume is a single matrix-vector product, so it
+    takes milliseconds for thousands of jobs and needs no network.
+
+        index = SimilarityIndex()
+        index.add(job_ids, descriptions)
+        index.rank(resume_text, top_k=50)   # [(job_id, score), ...]
+
+    The embedder is an explicit choice: an instance or a name from EMBEDDERS.
+    The default is the offline hashing embedder; sentence-transformers is only
+    used when asked for.
+    """
+
+    def __init__(self, path="state/similarity", embedder="hashing"):
+        self.path = path
+        os.makedirs(self.path, exist_ok=True)
+        self.vectors_path = os.path.join(self.path, "vectors.f32")
+        self.keys_path = os.path.join(self.path, "keys.jsonl")
+        self.df_path = os.path.join(self.path, "df.npy")
+        self.meta_path = os.path.join(self.path, "meta.json")
+
+        self.embedder = make_embedder(embedder) if isinstance(embedder, str) else embedder
+        self.dim = self.embedder.dim
+        self.keys, self.df = [], np.zeros(self.dim, dtype=np.float64)
+        self.vectors = None
+        self._load()
+
+    # ---------------- Storage ----------------
+    def _load(self):
+        try:
+            with open(self.meta_path, "r") as f:
+                meta = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            meta = None
+        if not meta or meta["embedder"] != self.embedder.name or meta["dim"] != self.dim:
+            # Different model (or nothing yet): start over rather than mix vector spaces
+            self._reset()
+            return
+
+        count = meta["count"]
+        row_bytes = self.dim * 4
+        lines = []
+        if os.path.exists(self.keys_path):
+            with open(self.keys_path, "r", encoding="utf-8") as f:
+                lines = f.readlines()
+        vector_rows = os.path.getsize(self.vectors_path) // row_bytes if os.path.exists(self.vectors_path) else 0
+        if min(len(lines), vector_rows) < count:
+            # Keys or vectors missing or shorter than the committed count: they no longer line up
+            print(f"⚠️ Similarity index at {self.path} is missing keys or vectors; rebuilding it")
+            self._reset()
+            return
+
+        self.keys = [json.loads(line) for line in lines[:count]]
+        if len(lines) > count:
+            with open(self.keys_path, "w", encoding="utf-8") as f:
+                f.writelines(lines[:count])
+        # Drop anything appended after the last committed count (interrupted add)
+        if os.path.exists(self.vectors_path) and os.path.getsize(self.vectors_path) > count * row_bytes:
+            with open(self.vectors_path, "r+b") as f:
+                f.truncate(count * row_bytes)
+        if os.path.exists(self.df_path):
+            self.df = np.load(self.df_path)
+        self._map()
+
+    def _reset(self):
+        for path in (self.vectors_path, self.keys_path, self.df_path):
+            if os.path.exists(path):
+                os.remove(path)
+        self.keys, self.df = [], np.zeros(self.dim, dtype=np.float64)
+        self._save_meta()
+        self._map()
+
+    def _map(self):
+        self.vectors = (
+            np.memmap(self.vectors_path, dtype=np.float32, mode="r", shape=(len(self.keys), self.dim))
+            if self.keys else np.zeros((0, self.dim), dtype=np.float32)
+        )
+        self._positions = {key: i for i, key in enumerate(self.keys)}
+
+    def _save_meta(self):
+        tmp_path = self.meta_path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({"embedder": self.embedder.name, "dim": self.dim, "count": len(self.keys)}, f)
+        os.replace(tmp_path, self.meta_path)
+
+    def __len__(self):
+        return len(self.keys)
+
+    def __contains__(self, key):
+        return str(key) in self._positions
+
+    # ---------------- Writes ----------------
+    def add(self, keys, texts):
+        """Embed and append jobs whose key is not indexed yet; returns how many were added."""
+        new = {}
+        for key, text in zip(keys, texts):
+            key = str(key)
+            if key not in self._positions and key not in new:
+                new[key] = text
+        if not new:
+            return 0
+
+        vectors = self.embedder.embed(list(new.values())).astype(np.float32)
+        with open(self.vectors_path, "ab") as f:
+            f.write(vectors.tobytes())
+            f.flush()
+            os.fsync(f.fileno())
+        with open(self.keys_path, "a", encoding="utf-8") as f:
+            f.writelines(json.dumps(key) + "\n" for key in new)
+        self.keys.extend(new)
+        self._save_meta()  # the commit point: rows beyond the stored count are discarded on load
+
+        self.df += (vectors != 0).sum(axis=0)
+        with open(self.df_path + ".tmp", "wb") as f:
+            np.save(f, self.df)
+        os.replace(self.df_path + ".tmp", self.df_path)
+        self._map()
+        return len(new)
+
+    # ---------------- Ranking ----------------
+    def _query_vector(self, text):
+        query = self.embedder.embed([text])[0]
+        if self.embedder.uses_idf and len(self.keys):
+            query = query * (np.log((1 + len(self.keys)) / (1 + self.df)) + 1).astype(np.float32)
+            query /= max(np.linalg.norm(query), 1e-12)
+        return query
+
+    def scores(self, text):
+        """Similarity of every indexed job to `text`, in index order."""
+        if not len(self.keys):
+            return np.zeros(0, dtype=np.float32)
+        return self.vectors @ self._query_vector(text)
+
+    def rank(self, text, top_k=None):
+        """[(key, score)] best first, for the top_k jobs (or all)."""
+        scores = self.scores(text)
+        if top_k is not None and top_k < len(scores):
+            order = np.argpartition(-scores, top_k)[:top_k]
+            order = order[np.argsort(-scores[order])]
+        else:
+            order = np.argsort(-scores)
+        return [(self.keys[i], float(scores[i])) for i in order]
+
+    def scores_for(self, keys, text):
+        """Similarity of the given keys to `text` (NaN for keys not in the index)."""
+        scores = self.scores(text)
+        return np.array([scores[self._positions[str(k)]] if str(k) in self._positions else np.nan for k in keys])
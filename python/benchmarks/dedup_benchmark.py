@@ -0,0 +1,103 @@
+import os
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import csv
+import time
+import random
+from itertools import combinations
+
+from managers.dedup_manager import DedupIndex, normalize_company, normalize_title
+from managers.result_manager import ResultManager
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+JOBS_CSV = os.path.join(ROOT, "job_results.csv")
+SCALE = 50  # synthetic copies of the checked-in jobs for the timing run
+TITLE_EDITS = [
+    lambda t: t + " - Remote",
+    lambda t: t.replace("Engineer", "Engineer II"),
+    lambda t: t.replace("/", " / ").upper(),
+    lambda t: "Sr. " + t,
+    lambda t: t + " (Immediate Joiner)",
+]
+
+
+def load_jobs(path):
+    """job_results.csv as dicts, realigning 14-value rows written under the old 13-name header."""
+    with open(path, "r", newline="", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        return [dict(zip(ResultManager.HEADERS if len(row) == len(ResultManager.HEADERS) > len(header) else header, row))
+                for row in reader]
+
+
+def exact_jaccard(a, b):
+    return len(a & b) / len(a | b) if a | b else 0.0
+
+
+def brute_force_pairs(jobs, index):
+    """Pairs the exact (all-pairs) version of the DedupIndex rule would call duplicates."""
+    prepared = [
+        (normalize_company(j.get("Company")), index._title_shingles(normalize_title(j.get("Job Title"))),
+         index._description_shingles(j.get("Description")))
+        for j in jobs
+    ]
+    pairs = set()
+    for (i, a), (k, b) in combinations(enumerate(prepared), 2):
+        if a[0] != b[0] or exact_jaccard(a[1], b[1]) < index.title_threshold:
+            continue
+        if a[2] and b[2] and exact_jaccard(a[2], b[2]) < index.description_threshold:
+            continue
+        pairs.add((i, k))
+    return pairs
+
+
+def synthetic_reposts(jobs, copies, seed=7):
+    """Each job `copies` times under a distinct company, plus one reworded repost of each copy."""
+    rng = random.Random(seed)
+    out, expected = [], 0
+    for c in range(copies):
+        for i, job in enumerate(jobs):
+            original = dict(job, **{"Company": f"{job['Company']} {c}", "Job ID": f"{c}-{i}", "Company-Title Hash": ""})
+            repost = dict(original, **{
+                "Job Title": rng.choice(TITLE_EDITS)(original["Job Title"]),
+                "Job ID": f"{c}-{i}-repost",
+                "Description": original.get("Description", "") + " Apply now, we are hiring urgently.",
+            })
+            out += [original, repost]
+            expected += 1
+    rng.shuffle(out)
+    return out, expected
+
+
+def main():
+    jobs = load_jobs(JOBS_CSV)
+    exact = len(jobs) - len({DedupIndex.company_title_hash(j) for j in jobs})
+
+    index = DedupIndex()
+    start = time.perf_counter()
+    kept = index.collapse(jobs)
+    elapsed = time.perf_counter() - start
+    brute = brute_force_pairs(jobs, DedupIndex())
+    print(f"{JOBS_CSV}: {len(jobs)} rows | exact company-title duplicates: {exact} | "
+          f"MinHash/LSH keeps {len(kept)} ({len(jobs) - len(kept)} collapsed) in {elapsed * 1000:.1f} ms | "
+          f"all-pairs rule finds {len(brute)} near-duplicate pairs")
+
+    synthetic, expected = synthetic_reposts(jobs, SCALE)
+    index = DedupIndex()
+    start = time.perf_counter()
+    kept = index.collapse(synthetic)
+    elapsed = time.perf_counter() - start
+    caught = len(synthetic) - len(kept)
+    print(f"synthetic: {len(synthetic)} rows with {expected} reworded reposts | collapsed {caught} "
+          f"({caught / expected:.0%}) in {elapsed:.2f}s ({elapsed * 1e6 / len(synthetic):.0f} µs/job)")
+
+    start = time.perf_counter()
+    brute = brute_force_pairs(synthetic, DedupIndex())
+    brute_seconds = time.perf_counter() - start
+    print(f"all-pairs exact-Jaccard rule on the same rows: {len(brute)} duplicate pairs in {brute_seconds:.2f}s "
+          f"(MinHash/LSH recall vs it: {caught / max(len(brute), 1):.0%})")
+
+
+if __name__ == "__main__":
+    main()
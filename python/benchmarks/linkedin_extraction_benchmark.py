@@ -0,0 +1,72 @@
+import os
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import time
+from selenium import webdriver
+from selenium.webdriver.common.by import By
+
+from scrappers.linked_in import read_job_details_script, read_job_details_webdriver, parse_job_details
+
+FIXTURE = os.path.join(os.path.dirname(__file__), "fixtures", "linkedin_search_page.html")
+ROUNDS = 25
+
+
+class RoundTripCounter:
+    """Counts WebDriver commands by wrapping driver.execute (every protocol call goes through it)."""
+
+    def __init__(self, driver):
+        self.count = 0
+        self._execute = driver.execute
+
+        def counted(*args, **kwargs):
+            self.count += 1
+            return self._execute(*args, **kwargs)
+
+        driver.execute = counted
+
+
+def run(driver, counter, reader):
+    """Read every card's detail pane ROUNDS times; return (round trips per card, ms per card)."""
+    cards = driver.find_elements(By.CSS_SELECTOR, "li[data-occludable-job-id]")
+    counter.count = 0
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        for card in cards:
+            parse_job_details(reader(driver, card))
+    elapsed = time.perf_counter() - start
+    reads = ROUNDS * len(cards)
+    return counter.count / reads, elapsed * 1000 / reads
+
+
+def main():
+    options = webdriver.ChromeOptions()
+    options.add_argument("--headless=new")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    driver = webdriver.Chrome(options=options)
+    try:
+        driver.get(f"file://{FIXTURE}")
+        counter = RoundTripCounter(driver)
+
+        # Both paths must agree (modulo whitespace) before timing means anything
+        cards = driver.find_elements(By.CSS_SELECTOR, "li[data-occludable-job-id]")
+        for card in cards:
+            via_script = parse_job_details(read_job_details_script(driver, card))
+            via_webdriver = parse_job_details(read_job_details_webdriver(driver, card))
+            for key in via_script:
+                assert " ".join(via_script[key].split()) == " ".join(via_webdriver[key].split()), key
+
+        legacy_trips, legacy_ms = run(driver, counter, read_job_details_webdriver)
+        script_trips, script_ms = run(driver, counter, read_job_details_script)
+
+        print(f"{'mode':<10} {'round trips/job':>16} {'ms/job':>10}")
+        print(f"{'webdriver':<10} {legacy_trips:>16.1f} {legacy_ms:>10.2f}")
+        print(f"{'script':<10} {script_trips:>16.1f} {script_ms:>10.2f}")
+        print(f"⚡ {legacy_trips / script_trips:.1f}x fewer round trips, {legacy_ms / script_ms:.1f}x faster per job")
+    finally:
+        driver.quit()
+
+
+if __name__ == "__main__":
+    main()
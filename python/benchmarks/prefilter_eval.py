@@ -0,0 +1,93 @@
+import os
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import time
+import pandas as pd
+
+from ai_agents.LinkedIn.filter_job_agent.filter_job_agent import extract_text_from_pdf
+from ai_agents.LinkedIn.filter_job_agent.prefilter import PreFilter
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+JOBS_CSV = os.path.join(ROOT, "filtered_jobs.csv")  # jobs already scored by the full LLM run
+RESUME = os.path.join(ROOT, "Mohammad_Ansari_Resume_SDe.pdf")
+os.environ.setdefault("CONFIG_PATH", os.path.join(ROOT, "config.json"))
+
+THRESHOLDS = [0.3, 0.4, 0.45, 0.5, 0.6]
+TOP_KS = [10, 25, 50]
+POSITIVE_OPINION = 5  # apply_jobs applies to Final Opinion > 5
+
+
+def load_scored_jobs(path):
+    """
+    Read a process_jobs output. Files written from the old 13-name LinkedIn header
+    lost "Job Title" to the pandas index and are shifted one column left up to
+    "Job ID"; realign them (the title itself is gone).
+    """
+    jobs_df = pd.read_csv(path)
+    if "Apply Link" in jobs_df.columns and jobs_df["Apply Link"].isin(["LINKEDIN", "NAUKRI", "INDEED"]).any():
+        shifted = ["Job Title", "Company", "Location", "Footer", "Easy Apply", "Job Type",
+                   "Description", "Experience Required", "Salary Mentioned", "Apply Link"]
+        jobs_df = jobs_df.rename(columns=dict(zip(shifted, shifted[1:] + ["Scrap From"])))
+        jobs_df.insert(0, "Job Title", "")
+    return jobs_df
+
+
+def evaluate(keep, positive):
+    """(kept, avoided, precision, recall) of a keep-mask against the LLM's positives."""
+    kept = int(keep.sum())
+    true_positives = int((keep & positive).sum())
+    precision = true_positives / kept if kept else float("nan")
+    recall = true_positives / int(positive.sum()) if positive.any() else float("nan")
+    return kept, len(keep) - kept, precision, recall
+
+
+def main(jobs_csv=JOBS_CSV, resume_path=RESUME):
+    jobs_df = load_scored_jobs(jobs_csv)
+    opinion = pd.to_numeric(jobs_df.get("Final Opinion"), errors="coerce")
+    labelled = opinion.notna()
+    if resume_path.endswith(".txt"):
+        with open(resume_path, "r", encoding="utf-8") as f:
+            resume_text = f.read()
+    else:
+        resume_text = extract_text_from_pdf(resume_path)
+
+    prefilter = PreFilter.from_config(resume_text)
+    start = time.perf_counter()
+    scores = prefilter.score(jobs_df)
+    elapsed = time.perf_counter() - start
+    print(f"Scored {len(jobs_df)} jobs locally in {elapsed * 1000:.1f} ms "
+          f"({len(prefilter.terms)} resume terms, resume years: {prefilter.years})")
+    print(scores.describe().round(3).to_string())
+
+    if not labelled.any():
+        print(f"\n⚠️ {jobs_csv} has no Final Opinion values, so precision/recall cannot be computed. "
+              "Re-run process_jobs without a pre-filter to produce labels, then run this again, or pass a "
+              "labelled CSV and resume, e.g. tests/fixtures/prefilter_labelled_jobs.csv "
+              "tests/fixtures/prefilter_resume.txt.")
+        for threshold in THRESHOLDS:
+            prefilter.threshold, prefilter.top_k = threshold, None
+            keep = prefilter.select(jobs_df, scores)
+            print(f"threshold {threshold:.2f}: keeps {int(keep.sum())}/{len(jobs_df)}, avoids {int((~keep).sum())} calls")
+        return
+
+    jobs_df, scores, opinion = jobs_df[labelled], scores[labelled], opinion[labelled]
+    positive = opinion > POSITIVE_OPINION
+    print(f"\n{len(jobs_df)} labelled jobs, {int(positive.sum())} rated > {POSITIVE_OPINION} by the LLM")
+
+    rows = [("full LLM",) + evaluate(pd.Series(True, index=jobs_df.index), positive)]
+    for threshold in THRESHOLDS:
+        prefilter.threshold, prefilter.top_k = threshold, None
+        rows.append((f"threshold {threshold:.2f}",) + evaluate(prefilter.select(jobs_df, scores), positive))
+    for top_k in TOP_KS:
+        prefilter.top_k = top_k
+        rows.append((f"top {top_k}",) + evaluate(prefilter.select(jobs_df, scores), positive))
+
+    print(f"{'mode':<16}{'LLM calls':>10}{'avoided':>9}{'precision':>11}{'recall':>8}")
+    for mode, kept, avoided, precision, recall in rows:
+        print(f"{mode:<16}{kept:>10}{avoided:>9}{precision:>11.2f}{recall:>8.2f}")
+
+
+if __name__ == "__main__":
+    # Optional: a labelled jobs CSV and a resume (.pdf or .txt) instead of the defaults
+    main(*sys.argv[1:3])
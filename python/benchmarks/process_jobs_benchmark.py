@@ -0,0 +1,99 @@
+import os
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import json
+import time
+import random
+import pandas as pd
+
+from ai_agents.LinkedIn.filter_job_agent.filter_job_agent import (
+    build_prompt, build_prompts, apply_verdicts, _text_column, RESULT_COLUMNS,
+)
+
+SIZES = [10_000, 100_000]
+RESUME = "Python, SQL, AWS Lambda, ETL pipelines, Generative AI, MongoDB. " * 20
+
+
+def synthetic_jobs(n):
+    rng = random.Random(n)
+    words = ["python", "aws", "etl", "react", "java", "ml", "sql", "docker", "spark", "llm"]
+    return pd.DataFrame({
+        "Job Title": [f"Engineer {i}" for i in range(n)],
+        "Description": [" ".join(rng.choices(words, k=60)) for _ in range(n)],
+        "Job ID": [str(4_000_000_000 + i) for i in range(n)],
+        "Job URL": [f"https://www.linkedin.com/jobs/view/{i}" for i in range(n)],
+    })
+
+
+def synthetic_verdicts(keys):
+    rng = random.Random(len(keys))
+    return {key: {
+        "Skills Matched": ["python", "aws"],
+        "Job Description Matched": "yes",
+        "Work Experience Matched": "no",
+        "Reasoning": "synthetic",
+        "Final Opinion": rng.randint(1, 10),
+    } for key in keys}
+
+
+def legacy(jobs_df, verdicts_by_idx):
+    """The iterrows / .at version of process_jobs (prompts + result assignment)."""
+    for col in RESULT_COLUMNS:
+        jobs_df[col] = None
+    prompts = []
+    for _, row in jobs_df.iterrows():
+        prompts.append(build_prompt(RESUME, row.get("Job Title", ""), row.get("Description", "")))
+    results = {idx: verdicts_by_idx[idx] for idx, _ in jobs_df.iterrows()}
+    for idx in jobs_df.index:
+        result = results.get(idx, {})
+        jobs_df.at[idx, "Skills Matched"] = json.dumps(result.get("Skills Matched", []))
+        jobs_df.at[idx, "Job Description Matched"] = result.get("Job Description Matched", "")
+        jobs_df.at[idx, "Work Experience Matched"] = result.get("Work Experience Matched", "")
+        jobs_df.at[idx, "Reasoning"] = result.get("Reasoning", "")
+        jobs_df.at[idx, "Final Opinion"] = result.get("Final Opinion", "")
+    return prompts, jobs_df
+
+
+def vectorized(jobs_df, verdicts_by_key):
+    prompts = build_prompts(RESUME, _text_column(jobs_df, "Job Title"), _text_column(jobs_df, "Description"))
+    return prompts.tolist(), apply_verdicts(jobs_df, jobs_df["Job ID"], verdicts_by_key)
+
+
+def legacy_selection(jobs_df):
+    return [(row.get("Job ID"), row.get("Job URL")) for _, row in jobs_df[jobs_df["Final Opinion"] > 5].iterrows()]
+
+
+def vectorized_selection(jobs_df):
+    candidates = jobs_df[pd.to_numeric(jobs_df["Final Opinion"], errors="coerce") > 5]
+    return list(zip(candidates["Job ID"].tolist(), candidates["Job URL"].tolist()))
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    for n in SIZES:
+        jobs = synthetic_jobs(n)
+        verdicts = synthetic_verdicts(jobs["Job ID"])
+        by_idx = dict(zip(jobs.index, verdicts.values()))
+
+        (old_prompts, old_df), old_seconds = timed(legacy, jobs.copy(), by_idx)
+        (new_prompts, new_df), new_seconds = timed(vectorized, jobs.copy(), verdicts)
+        assert old_prompts == new_prompts
+        assert old_df[RESULT_COLUMNS].astype(str).equals(new_df[RESULT_COLUMNS].astype(str))
+
+        old_sel, old_sel_seconds = timed(legacy_selection, new_df)
+        new_sel, new_sel_seconds = timed(vectorized_selection, new_df)
+        assert old_sel == new_sel
+
+        print(f"{n:>7} rows | process_jobs: iterrows {old_seconds:7.2f}s, vectorized {new_seconds:6.2f}s "
+              f"({old_seconds / new_seconds:5.1f}x) | apply selection: iterrows {old_sel_seconds:6.2f}s, "
+              f"vectorized {new_sel_seconds:6.3f}s ({old_sel_seconds / new_sel_seconds:5.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
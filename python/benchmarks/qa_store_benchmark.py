@@ -0,0 +1,71 @@
+import os
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import time
+import random
+import tempfile
+
+from managers.qa_store import QAStore
+
+SIZES = [1_000, 10_000, 50_000]
+QUERIES = 2_000
+SKILLS = [f"{base}{suffix}" for base in [
+    "python", "java", "aws", "sql", "react", "docker", "kubernetes", "spark", "django", "fastapi", "node",
+    "mongodb", "mysql", "etl", "airflow", "pandas", "tensorflow", "pytorch", "llm", "azure", "gcp", "c++",
+    "golang", "rust", "kafka", "redis", "terraform", "linux", "git", "jenkins",
+] for suffix in ["", " development", " administration", " testing", " architecture", " migration", " support"]]
+TEMPLATES = [
+    ("How many years of work experience do you have with {s}?", "number"),
+    ("Are you comfortable working with {s} on a daily basis?", "choice"),
+    ("Rate your proficiency in {s} from 1 to 10", "number"),
+    ("Have you led a team doing {s} at {c}?", "choice"),
+    ("Describe a project where you used {s} for {c}", "text"),
+]
+REWORDINGS = [
+    lambda q: q.replace("How many years of work experience do you have with", "How many years of experience with"),
+    lambda q: q.replace("?", "").strip() + " Required",
+    lambda q: q.lower(),
+    lambda q: q.replace("Are you comfortable", "Are you comfortable,"),
+]
+
+
+def synthetic_questions(n, seed=3):
+    rng = random.Random(seed)
+    out = {}
+    while len(out) < n:
+        template, kind = rng.choice(TEMPLATES)
+        question = template.format(s=rng.choice(SKILLS), c=f"client {rng.randrange(n // 50 + 1)}")
+        out[question] = ("7" if kind == "number" else "Yes" if kind == "choice" else "Built a pipeline", kind)
+    return out
+
+
+def main():
+    for n in SIZES:
+        questions = synthetic_questions(n)
+        with tempfile.TemporaryDirectory() as path:
+            store = QAStore(os.path.join(path, "answers.json"))
+            start = time.perf_counter()
+            for question, (answer, kind) in questions.items():
+                store.put(question, answer, kind)
+            build_seconds = time.perf_counter() - start
+
+            rng = random.Random(n)
+            sample = rng.sample(list(questions), min(QUERIES, n))
+            reworded = [rng.choice(REWORDINGS)(q) for q in sample]
+            start = time.perf_counter()
+            matches = [store.lookup(q) for q in reworded]
+            lookup_us = (time.perf_counter() - start) * 1e6 / len(reworded)
+            hits = sum(m is not None and m.question == q for m, q in zip(matches, sample))
+            wrong = sum(m is not None and m.question != q for m, q in zip(matches, sample))
+
+            # A question about a skill that is not stored must not borrow another skill's answer
+            unseen = [q.replace(q.split(" with ")[-1], "cobol?") for q in sample if " with " in q][:500]
+            false_matches = sum(store.lookup(q) is not None for q in unseen)
+
+            print(f"{n:>6} questions | build {build_seconds:5.2f}s | reworded lookup {lookup_us:7.1f} µs | "
+                  f"matched {hits / len(sample):.0%}, wrong {wrong} | unseen-skill false matches {false_matches}/{len(unseen)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+import os
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import time
+import random
+import tempfile
+import numpy as np
+
+from ai_agents.LinkedIn.filter_job_agent.similarity_index import SimilarityIndex, HashingEmbedder
+
+SIZES = [1_000, 10_000, 50_000]
+INCREMENT = 500
+RANK_ROUNDS = 20
+RESUME = ("Machine Learning & Software Engineer. Python, SQL, AWS Lambda, S3, SQS, SNS, Step Functions, "
+          "ETL pipelines, Azure Data Lake, MongoDB, MySQL, Generative AI, LLMs, chatbots, Docker, Pandas.")
+WORDS = ["python", "aws", "etl", "react", "java", "machine", "learning", "sql", "docker", "spark", "llm",
+         "kubernetes", "frontend", "css", "node", "mongodb", "lambda", "pipelines", "sales", "marketing"]
+
+
+def synthetic_jobs(n, offset=0):
+    rng = random.Random(n + offset)
+    return [f"job-{offset + i}" for i in range(n)], [" ".join(rng.choices(WORDS, k=80)) for _ in range(n)]
+
+
+def main():
+    for n in SIZES:
+        with tempfile.TemporaryDirectory() as path:
+            index = SimilarityIndex(path, embedder=HashingEmbedder())
+            keys, texts = synthetic_jobs(n)
+            start = time.perf_counter()
+            index.add(keys, texts)
+            build_seconds = time.perf_counter() - start
+
+            more_keys, more_texts = synthetic_jobs(INCREMENT, offset=n)
+            start = time.perf_counter()
+            added = index.add(keys[:INCREMENT] + more_keys, texts[:INCREMENT] + more_texts)
+            append_seconds = time.perf_counter() - start
+            assert added == INCREMENT  # already-indexed jobs are skipped, not re-embedded
+
+            reopened = SimilarityIndex(path, embedder=HashingEmbedder())
+            assert len(reopened) == n + INCREMENT and isinstance(reopened.vectors, np.memmap)
+
+            reopened.rank(RESUME, top_k=50)  # warm the page cache
+            start = time.perf_counter()
+            for _ in range(RANK_ROUNDS):
+                top = reopened.rank(RESUME, top_k=50)
+            rank_ms = (time.perf_counter() - start) * 1000 / RANK_ROUNDS
+
+            print(f"{n:>6} jobs | build {build_seconds:6.2f}s | +{INCREMENT} incremental {append_seconds:5.2f}s "
+                  f"| rank all vs resume {rank_ms:6.2f} ms | top score {top[0][1]:.3f}")
+
+
+if __name__ == "__main__":
+    main()
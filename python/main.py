@@ -2,9 +2,17 @@ from scrappers.naukri import NaukriScraper
 from scrappers.indeed import IndeedScraper
 from utility.logger import logger
 from scrappers.linked_in import LinkedInScraper
+# from scrappers.linked_in_crawler import LinkedInCrawler
 # from scrappers.naukri import NaukriScraper
 from ai_agents.LinkedIn.filter_job_agent.filter_job_agent import extract_text_from_pdf, process_jobs
+# from ai_agents.LinkedIn.filter_job_agent.prefilter import PreFilter
+# from ai_agents.LinkedIn.filter_job_agent.similarity_index import SimilarityIndex
 from ai_agents.LinkedIn.easy_apply_agent.easy_apply_agent import LinkedInAutoApply
+# from ai_agents.LinkedIn.easy_apply_agent.apply_executor import ApplyExecutor
+from managers.driver_manager import DriverPool
+# from managers.resume_manager import ResumeManager
+# from managers.qa_store import QAStore
+# from managers.question_queue import QuestionQueue
 
 # import PyPDF2
 import os
@@ -28,40 +36,66 @@ def main():
     PASSWORD = os.getenv("NAUKRI_PASSWORD")
     print("🚀 Job Scraper Started")
 
-    # Run LinkedIn Scraper
-    linkedin = LinkedInScraper()
-    linkedin.run()
+    # Warm browsers shared by the scrape and apply stages (closing prints startup-latency stats)
+    driver_pool = DriverPool(
+        size=1,
+        user_data_dir=os.path.expanduser("~/Library/Application Support/Google/Chrome"),
+        profile_name="Default",
+    )
 
-    # # Run Indeed Scraper
-    # indeed = IndeedScraper()
-    # indeed.run()
+    try:
+        # Run LinkedIn Scraper
+        linkedin = LinkedInScraper(driver_pool=driver_pool)
+        linkedin.run()
 
-    # Run Naukri Scraper
-    # naukri = NaukriScraper()
-    # naukri.run()
+        # Run LinkedIn parallel crawl (title x location x page units on a pool of browsers)
+        # crawler = LinkedInCrawler(workers=3, pages=5)
+        # crawler.save_results(crawler.run())
 
-    print("✅ All scrapers finished.")
+        # # Run Indeed Scraper
+        # indeed = IndeedScraper()
+        # indeed.run()
 
-    # print("✅ LLM job filtering started.")
+        # Run Naukri Scraper
+        # naukri = NaukriScraper()
+        # naukri.run()
 
-    # # --- Call LLM job filter agent ---
-    # resume_path = os.path.abspath("Mohammad_Ansari_Resume_SDe.pdf")
-    # job_postings_csv = os.path.abspath("job_results.csv")
-    # output_file = os.path.abspath("filtered_jobs.csv")
+        print("✅ All scrapers finished.")
 
-    # # Extract resume text
-    # resume_text = extract_text_from_pdf(resume_path)
-    # # Call LLM agent to process jobs
-    # process_jobs(resume_text, job_postings_csv, output_file)
+        # print("✅ LLM job filtering started.")
 
-    # print("✅ LLM job filtering finished.")
+        # # --- Call LLM job filter agent ---
+        # resume_path = os.path.abspath("Mohammad_Ansari_Resume_SDe.pdf")
+        # job_postings_csv = os.path.abspath("job_results.csv")
+        # output_file = os.path.abspath("filtered_jobs.csv")
 
-    # print("✅ Auto Apply started.")
+        # # Parse the resume once (cached by file hash)
+        # resume = ResumeManager(resume_path)
+        # # Call LLM agent to process jobs (the local pre-filter drops obvious mismatches first;
+        # # the compact profile stands in for the full resume text in prompts)
+        # process_jobs(resume.prompt_component(), job_postings_csv, output_file, prefilter=PreFilter.from_config(resume.text))
+        # # Optionally rank by embedding similarity first and send only the closest jobs to the LLM
+        # process_jobs(resume.prompt_component(), job_postings_csv, output_file,
+        #              prefilter=PreFilter.from_config(resume.text), similarity=SimilarityIndex(), similarity_top_k=200)
+        # # Or score only jobs stored since the last filter run (appended to filtered_jobs.csv)
+        # process_jobs(resume.prompt_component(), None, output_file, result_manager=linkedin.result_manager)
+
+        # print("✅ LLM job filtering finished.")
+
+        # print("✅ Auto Apply started.")
 
     
-    # auto_apply = LinkedInAutoApply(USERNAME, PASSWORD, filtered_csv="filtered_jobs.csv")
-    # auto_apply.run()
-    # print("✅ Auto Apply finished.")
+        # auto_apply = LinkedInAutoApply(USERNAME, PASSWORD, filtered_csv="filtered_jobs.csv", driver_pool=driver_pool, resume_path=resume_path)
+        # auto_apply.run()
+        # Or apply on every pooled browser at once, capped per hour, with outcomes kept in a ledger
+        # ApplyExecutor(USERNAME, PASSWORD, driver_pool, filtered_csv="filtered_jobs.csv", applications_per_hour=20, resume_path=resume_path).run()
+        # Unattended: unknown questions park the job instead of prompting (unattended=True above);
+        # answer them in one batch later, no browser needed, and the next run resumes the parked jobs
+        # QuestionQueue(f"state/pending_questions_{USERNAME}.db").answer_interactively(QAStore(f"answers_{USERNAME}.json"))
+        # print("✅ Auto Apply finished.")
+    finally:
+        # Quit pooled browsers even when a stage fails
+        driver_pool.close()
    
 
 if __name__ == "__main__":
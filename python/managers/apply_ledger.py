@@ -0,0 +1,189 @@
+import os
+import re
+import sqlite3
+import threading
+import time
+from datetime import datetime
+import pandas as pd
+
+# Outcomes after which a job is never opened again
+DONE_OUTCOMES = ("applied", "no_easy_apply")
+# LinkedIn job ID inside search (?currentJobId=) and view (/jobs/view/[slug-]ID) URLs
+JOB_ID_IN_URL = r"(?:currentJobId=|/jobs/view/(?:[^/?#]*-)?)(\d+)"
+APPLIED_COLUMNS = {
+    "job_id": "Job ID", "title": "Job Title", "company": "Company", "location": "Location",
+    "description": "Description", "job_url": "URL", "applied_at": "Applied At",
+}
+
+
+def url_key(url):
+    """Identity of a job URL: the LinkedIn job ID when present, else the URL without query and fragment."""
+    if url is None or (isinstance(url, float) and url != url):
+        return ""
+    url = str(url)
+    match = re.search(JOB_ID_IN_URL, url)
+    if match:
+        return f"linkedin:{match.group(1)}"
+    return re.split(r"[?#]", url, maxsplit=1)[0].rstrip("/").lower()
+
+
+def url_keys(urls):
+    """url_key over a Series, column-wise."""
+    urls = urls.fillna("").astype(str)
+    ids = urls.str.extract(JOB_ID_IN_URL, expand=False)
+    stripped = urls.str.split(r"[?#]", n=1, regex=True).str[0].str.rstrip("/").str.lower()
+    return ("linkedin:" + ids).where(ids.notna(), stripped)
+
+
+class ApplyLedger:
+    """
+    Persistent SQLite (WAL) record of the last Easy Apply outcome per job:
+    applied, no_easy_apply, needs_answers or error, with the attempt count.
+
+    Every outcome is committed as soon as it is known, so a re-run skips
+    finished jobs (done_frame) and an interrupted run loses nothing. The
+    applied timestamps also back the per-account hourly budget.
+
+    Submitted applications are also kept in full (title, company, URL, time) in
+    the applied table, written in one transaction at each submit and keyed by
+    job ID and by URL (url_key), so a job reached under another ID or a
+    different search URL is still recognised. done_frame() gives the keys as a
+    DataFrame for a column-wise anti-join against candidate jobs.
+    """
+
+    def __init__(self, db_path="state/apply_ledger.db"):
+        self.db_path = db_path
+        os.makedirs(os.path.dirname(self.db_path) or ".", exist_ok=True)
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS outcomes (
+                job_id TEXT PRIMARY KEY,
+                job_url TEXT,
+                outcome TEXT NOT NULL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                detail TEXT,
+                updated_at REAL NOT NULL,
+                updated TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_outcomes_outcome ON outcomes(outcome, updated_at);
+            CREATE TABLE IF NOT EXISTS applied (
+                job_id TEXT PRIMARY KEY,
+                url_key TEXT NOT NULL,
+                job_url TEXT,
+                title TEXT,
+                company TEXT,
+                location TEXT,
+                description TEXT,
+                applied_at TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_applied_url_key ON applied(url_key);
+        """)
+        self.conn.commit()
+
+    # ---------------- Writes ----------------
+    def record(self, job_id, job_url, outcome, attempts=1, detail=None):
+        """Store a job's latest outcome; attempts add up across runs."""
+        now = time.time()
+        with self._lock:
+            self.conn.execute(
+                "INSERT INTO outcomes (job_id, job_url, outcome, attempts, detail, updated_at, updated) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(job_id) DO UPDATE SET job_url = excluded.job_url, outcome = excluded.outcome, "
+                "attempts = outcomes.attempts + excluded.attempts, detail = excluded.detail, "
+                "updated_at = excluded.updated_at, updated = excluded.updated",
+                (str(job_id), job_url, outcome, attempts, detail, now,
+                 datetime.fromtimestamp(now).isoformat(timespec="seconds")),
+            )
+            self.conn.commit()
+
+    def record_applied(self, job, job_url=None):
+        """
+        Store a submitted application (a dict keyed like the applied-jobs CSV) and
+        its "applied" outcome in one transaction.
+        """
+        now = time.time()
+        job_id = str(job.get("Job ID"))
+        values = (
+            job_id, url_key(job_url or job.get("URL")), job.get("URL"), job.get("Job Title"), job.get("Company"),
+            job.get("Location"), job.get("Description"),
+            job.get("Applied At") or datetime.fromtimestamp(now).isoformat(sep=" ", timespec="seconds"),
+        )
+        with self._lock, self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO applied (job_id, url_key, job_url, title, company, location, description, "
+                "applied_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                values,
+            )
+            self.conn.execute(
+                "INSERT INTO outcomes (job_id, job_url, outcome, attempts, updated_at, updated) "
+                "VALUES (?, ?, 'applied', 0, ?, ?) "
+                "ON CONFLICT(job_id) DO UPDATE SET outcome = 'applied', job_url = excluded.job_url, "
+                "updated_at = excluded.updated_at, updated = excluded.updated",
+                (job_id, job_url or job.get("URL"), now, datetime.fromtimestamp(now).isoformat(timespec="seconds")),
+            )
+
+    def import_applied_csv(self, path):
+        """Load an applied-jobs CSV from earlier runs (existing job IDs win); returns rows added."""
+        if not os.path.exists(path):
+            return 0
+        df = pd.read_csv(path, dtype=str).fillna("")
+        if df.empty or "Job ID" not in df.columns:
+            return 0
+        df = df.reindex(columns=list(APPLIED_COLUMNS.values()), fill_value="")
+        keys = url_keys(df["URL"].where(df["URL"] != "", df["Job ID"]))
+        rows = list(zip(df["Job ID"], keys, *(df[c] for c in list(APPLIED_COLUMNS.values())[1:])))
+        with self._lock, self.conn:
+            before = self.conn.total_changes
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO applied (job_id, url_key, title, company, location, description, job_url, "
+                "applied_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            added = self.conn.total_changes - before
+        if added:
+            print(f"📥 Imported {added} applied jobs from {path} into the ledger")
+        return added
+
+    def export_applied_csv(self, path):
+        """Write every application on record (all runs) to path; returns the row count."""
+        df = pd.read_sql_query(
+            f"SELECT {', '.join(APPLIED_COLUMNS)} FROM applied ORDER BY applied_at", self.conn
+        ).rename(columns=APPLIED_COLUMNS)
+        df.to_csv(path, index=False)
+        return len(df)
+
+    # ---------------- Reads ----------------
+    def done_frame(self):
+        """DataFrame (job_id, url_key) of every finished job: applications plus final outcomes."""
+        applied = pd.read_sql_query("SELECT job_id, url_key FROM applied", self.conn)
+        placeholders = ", ".join("?" * len(DONE_OUTCOMES))
+        outcomes = pd.read_sql_query(
+            f"SELECT job_id, job_url FROM outcomes WHERE outcome IN ({placeholders})", self.conn, params=DONE_OUTCOMES
+        )
+        outcomes = pd.DataFrame({"job_id": outcomes["job_id"], "url_key": url_keys(outcomes["job_url"])})
+        done = pd.concat([applied, outcomes], ignore_index=True)
+        return done.drop_duplicates()
+
+    def outcome(self, job_id):
+        row = self.conn.execute("SELECT outcome FROM outcomes WHERE job_id = ?", (str(job_id),)).fetchone()
+        return row["outcome"] if row else None
+
+    def applied_since(self, since):
+        """(count, oldest timestamp) of applications submitted after the epoch time since."""
+        row = self.conn.execute(
+            "SELECT COUNT(*) AS n, MIN(updated_at) AS oldest FROM outcomes WHERE outcome = 'applied' AND updated_at > ?",
+            (since,),
+        ).fetchone()
+        return row["n"], row["oldest"]
+
+    def counts(self):
+        return {r["outcome"]: r["n"] for r in self.conn.execute(
+            "SELECT outcome, COUNT(*) AS n FROM outcomes GROUP BY outcome"
+        )}
+
+    def close(self):
+        self.conn.close()
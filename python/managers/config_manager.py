@@ -1,14 +1,35 @@
 import json
 import os
+import atexit
+import threading
+import weakref
+from contextlib import contextmanager
 from dotenv import load_dotenv
 
+try:
+    import fcntl
+except ImportError:  # Windows: the in-process lock still applies
+    fcntl = None
+
+from managers.title_matcher import TitleMatcher
+
 
 class ConfigManager:
     """
     Handles loading, updating, and saving configuration for scrapers.
+
+    Title updates are kept in memory and marked dirty; save_config() only
+    schedules a flush, so every title seen within flush_interval seconds is
+    written in one go. A flush merges the pending titles into the file as it is
+    on disk under an exclusive file lock and replaces it atomically, so
+    concurrent scrapers do not lose each other's titles. Pending changes are
+    also flushed at interpreter exit, by one handler for every live instance.
     """
 
-    def __init__(self, platform):
+    _save_lock = threading.Lock()  # crawler workers share one ConfigManager
+    _instances = weakref.WeakSet()  # flushed at exit without keeping them alive
+
+    def __init__(self, platform, flush_interval=5.0):
         load_dotenv()
         self.config_path = os.getenv("CONFIG_PATH")
         
@@ -16,6 +37,14 @@ class ConfigManager:
             raise FileNotFoundError(f"Config Path not set or file does not exist: {self.config_path}")
         
         self.config = self.load_config(platform)
+        self.titles_version = 0  # bumped whenever the set of enabled titles changes
+        self._title_matcher = None
+
+        self.flush_interval = flush_interval
+        self._pending = {}  # title -> enabled, not yet on disk
+        self._state_lock = threading.Lock()
+        self._timer = None
+        self._instances.add(self)
 
      
     def load_config(self, platform):
@@ -47,20 +76,101 @@ class ConfigManager:
         """
         Get the dictionary of job titles (enabled/disabled) for all platforms.
         """
-        return self.config.get("titles", {})
+        return self.config.setdefault("titles", {})
 
     def update_title(self, title, enabled=False):
         """
         Add a new job title or update existing one.
         """
-        if "titles" not in self.config:
-            self.config["titles"] = {}
-        self.config["titles"][title] = enabled
+        self._set_title(title, enabled)
+        with self._state_lock:
+            self._pending[title] = enabled
+
+    def _set_title(self, title, enabled):
+        titles = self.get_titles_dict()
+        if enabled or titles.get(title):
+            self.titles_version += 1  # only enabled titles are compiled into the matcher
+        titles[title] = enabled
+
+    def title_matcher(self):
+        """
+        Shared TitleMatcher for the enabled titles, recompiled only after the
+        enabled set changed through update_title.
+        """
+        matcher = self._title_matcher
+        if matcher is None or matcher.version != self.titles_version:
+            matcher = TitleMatcher(self.get_titles_dict(), version=self.titles_version)
+            self._title_matcher = matcher
+        return matcher
 
     def save_config(self):
         """
-        Write the current config object back to config.json.
+        Schedule a write of pending changes; it happens flush_interval seconds
+        after the first unsaved change (immediately when the interval is 0).
         """
-        with open(self.config_path, "w") as f:
-            json.dump(self.config, f, indent=2)
-        print(f"✅ Config saved to {self.config_path}")
+        with self._state_lock:
+            if not self._pending or self._timer is not None:
+                return
+            if self.flush_interval > 0:
+                self._timer = threading.Timer(self.flush_interval, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+                return
+        self.flush()
+
+    @contextmanager
+    def _file_lock(self):
+        """Exclusive lock shared by every process writing this config."""
+        with open(f"{self.config_path}.lock", "a") as lock_file:
+            if fcntl:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    @classmethod
+    def flush_all(cls):
+        """Flush every live instance (registered once with atexit)."""
+        for manager in list(cls._instances):
+            manager.flush()
+
+    def flush(self):
+        """Write pending title updates to config.json now."""
+        with self._state_lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            pending, self._pending = self._pending, {}
+        if not pending:
+            return
+
+        try:
+            with self._save_lock, self._file_lock():
+                with open(self.config_path, "r") as f:
+                    on_disk = json.load(f)
+                titles = on_disk.setdefault("titles", {})
+                titles.update(pending)
+
+                tmp_path = f"{self.config_path}.{os.getpid()}.tmp"
+                with open(tmp_path, "w") as f:
+                    json.dump(on_disk, f, indent=2)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, self.config_path)
+        except Exception as e:
+            with self._state_lock:
+                self._pending = {**pending, **self._pending}  # retried on the next flush
+            print(f"⚠️ Failed to save config: {e}")
+            return
+
+        # Titles other processes added meanwhile
+        known = self.get_titles_dict()
+        for title, enabled in titles.items():
+            if title not in known:
+                self._set_title(title, enabled)
+        print(f"✅ Config saved to {self.config_path} ({len(pending)} title updates)")
+
+
+atexit.register(ConfigManager.flush_all)
@@ -0,0 +1,214 @@
+import re
+import zlib
+import hashlib
+from collections import defaultdict
+import numpy as np
+
+PRIME = (1 << 31) - 1
+LEGAL_SUFFIXES = {
+    "pvt", "private", "ltd", "limited", "inc", "llc", "llp", "corp", "corporation", "co", "company",
+    "gmbh", "plc", "sa", "ag", "bv", "the",
+}
+MISSING = {"", "n/a", "na", "none", "nan"}
+# Words reposts add or drop without changing the job
+TITLE_NOISE = {
+    "remote", "hybrid", "onsite", "wfh", "immediate", "immediately", "joiner", "joiners", "urgent",
+    "urgently", "hiring", "opening", "openings", "contract", "fulltime", "permanent", "india",
+}
+
+
+def normalize_company(company):
+    tokens = re.findall(r"[a-z0-9]+", str(company or "").lower())
+    return " ".join(t for t in tokens if t not in LEGAL_SUFFIXES)
+
+
+def normalize_title(title):
+    return " ".join(t for t in re.findall(r"[a-z0-9+#]+", str(title or "").lower()) if t not in TITLE_NOISE)
+
+
+class DedupIndex:
+    """
+    Near-duplicate job detection with MinHash and LSH banding.
+
+    Each job gets two MinHash signatures: character 3-grams of its normalised
+    title, and word 3-grams of its description. Title signatures are split into
+    bands and bucketed per normalised company, so only postings of the same
+    company that agree on at least one band are compared. A candidate is a
+    duplicate when the estimated title Jaccard reaches title_threshold and, if
+    both postings have a description, the description Jaccard reaches
+    description_threshold. This catches reposts with reworded titles and the
+    same job scraped from LinkedIn and Naukri (which has no description).
+
+    absorb() returns a job's signatures as a record that can be stored and
+    restore()d into a later index without hashing the job again; `version`
+    tells which settings the stored signatures are valid for.
+    """
+
+    def __init__(self, num_perm=128, bands=32, title_threshold=0.6, description_threshold=0.5, seed=1):
+        assert num_perm % bands == 0, "num_perm must split evenly into bands"
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.title_threshold = title_threshold
+        self.description_threshold = description_threshold
+        self.seed = seed
+        rng = np.random.RandomState(seed)
+        self._a = rng.randint(1, PRIME, size=(num_perm, 1), dtype=np.int64)
+        self._b = rng.randint(0, PRIME, size=(num_perm, 1), dtype=np.int64)
+
+        self._buckets = defaultdict(list)  # (company, band, band bytes) -> keys
+        self._entries = {}                 # key -> (company-title hash, title signature, description signature)
+
+    # ---------------- Signatures ----------------
+    @property
+    def version(self):
+        """Settings that stored signatures (and duplicate verdicts) depend on."""
+        return (f"minhash-{self.num_perm}-{self.bands}-{self.seed}-"
+                f"{self.title_threshold}-{self.description_threshold}")
+
+    @staticmethod
+    def pack(signature):
+        return None if signature is None else signature.astype(np.int64).tobytes()
+
+    @staticmethod
+    def unpack(blob):
+        return None if blob is None else np.frombuffer(blob, dtype=np.int64)
+
+    def _signature(self, shingles):
+        if not shingles:
+            return None
+        hashes = np.fromiter((zlib.crc32(s.encode("utf-8")) for s in shingles), dtype=np.int64, count=len(shingles))
+        return ((self._a * (hashes % PRIME) + self._b) % PRIME).min(axis=1)
+
+    @staticmethod
+    def _title_shingles(title):
+        padded = f" {title} "
+        return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+    @staticmethod
+    def _description_shingles(description, max_words=400):
+        text = str(description or "")
+        if text.strip().lower() in MISSING:
+            return set()
+        words = re.findall(r"[a-z0-9+#]+", text.lower())[:max_words]
+        return {" ".join(words[i:i + 3]) for i in range(max(len(words) - 2, 0))}
+
+    @staticmethod
+    def job_key(job):
+        """Same identity the JobStore uses: job ID, else the company-title hash."""
+        job_id = job.get("Job ID")
+        if job_id not in (None, "", "N/A") and str(job_id) != "nan":
+            return str(job_id)
+        return job.get("Company-Title Hash") or DedupIndex.company_title_hash(job)
+
+    @staticmethod
+    def company_title_hash(job):
+        return hashlib.md5(f"{job.get('Company')}-{job.get('Job Title')}".encode("utf-8")).hexdigest()
+
+    def _prepare(self, job):
+        company = normalize_company(job.get("Company"))
+        title_sig = self._signature(self._title_shingles(normalize_title(job.get("Job Title"))))
+        description = job.get("Description", job.get("Job Description"))
+        return company, title_sig, self._signature(self._description_shingles(description))
+
+    def _band_keys(self, company, title_sig):
+        return [
+            (company, band, title_sig[band * self.rows:(band + 1) * self.rows].tobytes())
+            for band in range(self.bands)
+        ]
+
+    # ---------------- Queries ----------------
+    def _match(self, company, title_sig, description_sig):
+        if title_sig is None:
+            return None
+        seen = set()
+        for bucket in self._band_keys(company, title_sig):
+            for key in self._buckets.get(bucket, ()):
+                if key in seen:
+                    continue
+                seen.add(key)
+                _, other_title, other_description = self._entries[key]
+                if np.mean(title_sig == other_title) < self.title_threshold:
+                    continue
+                if description_sig is not None and other_description is not None \
+                        and np.mean(description_sig == other_description) < self.description_threshold:
+                    continue
+                return key
+        return None
+
+    def _identity(self, job):
+        return self.job_key(job), job.get("Company-Title Hash") or self.company_title_hash(job)
+
+    def _duplicate_of(self, job, prepared):
+        match = self._match(*prepared)
+        if match is None:
+            return None
+        key, ct_hash = self._identity(job)
+        if match == key or self._entries[match][0] == ct_hash:
+            return None  # a re-scrape of the same job, which the JobStore merges anyway
+        return match
+
+    def _insert(self, job, prepared, key=None):
+        self._index(key or self.job_key(job), self._identity(job)[1], *prepared)
+
+    def _index(self, key, ct_hash, company, title_sig, description_sig):
+        if key in self._entries or title_sig is None:
+            return
+        self._entries[key] = (ct_hash, title_sig, description_sig)
+        for bucket in self._band_keys(company, title_sig):
+            self._buckets[bucket].append(key)
+
+    def find(self, job):
+        """Key of an indexed near-duplicate of job, or None."""
+        return self._match(*self._prepare(job))
+
+    def check(self, job):
+        """
+        Key of the indexed job that job near-duplicates, when it is a different
+        job (job ID and company-title hash both differ); None otherwise.
+        """
+        return self._duplicate_of(job, self._prepare(job))
+
+    def is_duplicate(self, job):
+        return self.check(job) is not None
+
+    # ---------------- Writes ----------------
+    def add(self, job, key=None):
+        """Index job under key (default job_key); returns the key of a different job it near-duplicates, or None."""
+        prepared = self._prepare(job)
+        match = self._duplicate_of(job, prepared)
+        self._insert(job, prepared, key)
+        return match
+
+    def absorb(self, job, key=None):
+        """
+        collapse() for one job, indexed under key (default job_key): index it
+        unless it near-duplicates a different indexed job. Returns (key of that
+        job or None, record), where record is (key, company-title hash, company,
+        packed title and description signatures).
+        """
+        prepared = self._prepare(job)
+        match = self._duplicate_of(job, prepared)
+        job_key, ct_hash = self._identity(job)
+        key = key or job_key
+        if match is None:
+            self._index(key, ct_hash, *prepared)
+        company, title_sig, description_sig = prepared
+        return match, (key, ct_hash, company, self.pack(title_sig), self.pack(description_sig))
+
+    def restore(self, key, ct_hash, company, title_blob, description_blob):
+        """Index a job from a record absorb() returned earlier, without re-hashing it."""
+        self._index(key, ct_hash, company, self.unpack(title_blob), self.unpack(description_blob))
+
+    def collapse(self, jobs):
+        """jobs with near-duplicates removed (first occurrence wins); indexes the survivors."""
+        unique = []
+        for job in jobs:
+            prepared = self._prepare(job)
+            if self._duplicate_of(job, prepared) is None:
+                unique.append(job)
+                self._insert(job, prepared)
+        return unique
+
+    def __len__(self):
+        return len(self._entries)
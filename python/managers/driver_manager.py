@@ -1,31 +1,49 @@
 import os
+import json
 import platform
 import psutil
+import queue
+import re
+import subprocess
 import tempfile
+import threading
 import time
 import shutil
+from contextlib import contextmanager
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.support.ui import WebDriverWait
 from webdriver_manager.chrome import ChromeDriverManager
 
+from managers.profile_manager import ProfileSnapshotManager
+
 class DriverManager:
-    def __init__(self, user_data_dir=None, profile_name="Default", headless=False, enable_debugger=False):
+    # chromedriver paths resolved by webdriver_manager, keyed by installed Chrome version
+    DRIVER_CACHE_PATH = "state/chromedriver_cache.json"
+    # Parallel launches (crawler workers, pools) share one profile snapshot
+    _snapshot_lock = threading.Lock()
+
+    def __init__(self, user_data_dir=None, profile_name="Default", headless=False, enable_debugger=False, offline=None):
         self.driver = None
         self.wait = None
+        self.startup_seconds = None  # wall time of the last get_driver() cold start
+        self.temp_profile = None       # private user-data-dir of the running browser
         self.system_platform = platform.system()
         self.enable_debugger = enable_debugger
         self.headless = headless or self._detect_docker()
         self.profile_name = profile_name
+        # Offline: never call webdriver_manager, use the cached chromedriver straight away
+        self.offline = offline if offline is not None else \
+            os.getenv("CHROMEDRIVER_OFFLINE", "").lower() in ("1", "true", "yes")
 
         # Original Chrome profile
         self.user_data_dir = user_data_dir or os.path.expanduser(
             "~/Library/Application Support/Google/Chrome"
         )
 
-        # Chrome binary (macOS only)
-        self.chrome_binary = None
-        if self.system_platform == "Darwin":
+        # Chrome binary (CHROME_BIN, e.g. Chromium in Docker, or the macOS app bundle)
+        self.chrome_binary = os.getenv("CHROME_BIN") if os.path.exists(os.getenv("CHROME_BIN", "")) else None
+        if not self.chrome_binary and self.system_platform == "Darwin":
             mac_chrome_path = "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome"
             if os.path.exists(mac_chrome_path):
                 self.chrome_binary = mac_chrome_path
@@ -54,6 +72,7 @@ class DriverManager:
         time.sleep(1)
 
     def get_driver(self):
+        started = time.perf_counter()
         options = webdriver.ChromeOptions()
 
         # Common flags
@@ -81,36 +100,281 @@ class DriverManager:
         if self.enable_debugger:
             options.add_argument("--remote-debugging-port=9222")
 
-        # Profile handling
+        # Profile handling: a private working copy of a session-only profile snapshot
+        ProfileSnapshotManager.collect_garbage()
         if self._detect_docker():
-            temp_profile = tempfile.mkdtemp()
-            options.add_argument(f"--user-data-dir={temp_profile}")
+            self.temp_profile = tempfile.mkdtemp(prefix=ProfileSnapshotManager.TEMP_PREFIX)
+            options.add_argument(f"--user-data-dir={self.temp_profile}")
         else:
-            # Make a temporary copy of the selected profile
-            profile_path = os.path.join(self.user_data_dir, self.profile_name)
-            temp_profile = tempfile.mkdtemp()
+            snapshots = ProfileSnapshotManager(self.user_data_dir, self.profile_name)
             try:
-                shutil.copytree(profile_path, os.path.join(temp_profile, self.profile_name), dirs_exist_ok=True)
+                with self._snapshot_lock:
+                    snapshots.prepare()
+                    self.temp_profile, copy_report = snapshots.launch_copy()
+                print(f"🗂️ Profile copy: {copy_report['bytes'] / 1e6:.1f} MB in {copy_report['seconds']:.2f}s")
             except Exception as e:
-                print(f"⚠️ Could not copy profile, starting fresh: {e}")
-            options.add_argument(f"--user-data-dir={temp_profile}")
-            # Skip --profile-directory, since the copied profile is already isolated
+                print(f"⚠️ Could not snapshot profile, starting fresh: {e}")
+                self.temp_profile = tempfile.mkdtemp(prefix=ProfileSnapshotManager.TEMP_PREFIX)
+            options.add_argument(f"--user-data-dir={self.temp_profile}")
+            options.add_argument(f"--profile-directory={self.profile_name}")
 
         # Chrome binary
         if self.chrome_binary:
             options.binary_location = self.chrome_binary
 
         # Start Chrome
-        driver_path = ChromeDriverManager().install()
+        driver_path = self._resolve_driver_path()
         service = Service(driver_path)
         self.driver = webdriver.Chrome(service=service, options=options)
         self.wait = WebDriverWait(self.driver, 20)
+        self.startup_seconds = time.perf_counter() - started
 
-        print(f"✅ Chrome started (headless={self.headless}) {'inside Docker' if self._detect_docker() else 'on host'}")
+        print(f"✅ Chrome started in {self.startup_seconds:.2f}s (headless={self.headless}) "
+              f"{'inside Docker' if self._detect_docker() else 'on host'}")
         return self.driver, self.wait
 
+    # ---------------- Driver Resolution ----------------
+    def _chrome_version(self):
+        """Installed Chrome version (e.g. '141.0.7390.54'), or None if it cannot be determined."""
+        candidates = [self.chrome_binary] if self.chrome_binary else []
+        candidates += ["google-chrome", "google-chrome-stable", "chromium", "chromium-browser", "chrome"]
+        for binary in candidates:
+            binary_path = binary if os.path.isabs(binary) else shutil.which(binary)
+            if not binary_path:
+                continue
+            try:
+                output = subprocess.run(
+                    [binary_path, "--version"], capture_output=True, text=True, timeout=10
+                ).stdout
+            except Exception:
+                continue
+            match = re.search(r"(\d+\.\d+\.\d+\.\d+)", output)
+            if match:
+                return match.group(1)
+        return None
+
+    def _load_driver_cache(self):
+        try:
+            with open(self.DRIVER_CACHE_PATH, "r") as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def _save_driver_cache(self, cache):
+        os.makedirs(os.path.dirname(self.DRIVER_CACHE_PATH), exist_ok=True)
+        tmp_path = self.DRIVER_CACHE_PATH + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(cache, f, indent=2)
+        os.replace(tmp_path, self.DRIVER_CACHE_PATH)
+
+    def _resolve_driver_path(self):
+        """
+        chromedriver path without a webdriver_manager network check on every launch.
+        CHROMEDRIVER_BIN wins; otherwise the cached path for the installed Chrome version;
+        webdriver_manager is only asked when Chrome's version changed (never in offline mode).
+        """
+        env_path = os.getenv("CHROMEDRIVER_BIN")
+        if env_path and os.path.exists(env_path):
+            return env_path
+
+        cache = self._load_driver_cache()
+        version = self._chrome_version()
+        cached = cache.get(version) if version else None
+        if cached and os.path.exists(cached):
+            return cached
+
+        last = cache.get("last")
+        if self.offline:
+            if last and os.path.exists(last):
+                print(f"⚠️ Offline: no cached chromedriver for Chrome {version}, using {last}")
+                return last
+            raise RuntimeError("Offline mode and no cached chromedriver; run once with network access.")
+
+        try:
+            driver_path = ChromeDriverManager().install()
+        except Exception as e:
+            if last and os.path.exists(last):
+                print(f"⚠️ Could not resolve chromedriver ({e}), falling back to {last}")
+                return last
+            raise
+
+        if version:
+            cache[version] = driver_path
+        cache["last"] = driver_path
+        self._save_driver_cache(cache)
+        print(f"✅ Cached chromedriver for Chrome {version}: {driver_path}")
+        return driver_path
+
     def quit(self):
         if self.driver:
             self.driver.quit()
             self.driver = None
             print("✅ Chrome driver quit successfully.")
+        if self.temp_profile:
+            ProfileSnapshotManager.release(self.temp_profile)
+            self.temp_profile = None
+
+
+class DriverPool:
+    """
+    Pre-launched Chrome instances that pipeline stages check out and back in,
+    so scrape, filter and apply can share warm browsers instead of cold-starting each time.
+
+    Usage:
+        pool = DriverPool(size=2, user_data_dir=..., profile_name="Default")
+        with pool.lease() as manager:
+            manager.driver.get(...)
+        pool.close()
+    """
+
+    def __init__(self, size=1, prelaunch=True, **driver_kwargs):
+        self.size = size
+        self.driver_kwargs = driver_kwargs
+        self._idle = queue.Queue()
+        self._all = []
+        self._launching = 0  # slots reserved by launches in progress, counted against size
+        self._lock = threading.Lock()
+
+        # Metrics
+        self.startup_times = []   # seconds per cold start
+        self.checkouts = 0
+        self.warm_checkouts = 0   # checkouts served by an already-running browser
+
+        if prelaunch:
+            self.start()
+
+    # ---------------- Lifecycle ----------------
+    def _reserve(self):
+        """Claim a launch slot if the pool is not full; the caller must then _launch()."""
+        with self._lock:
+            if len(self._all) + self._launching < self.size:
+                self._launching += 1
+                return True
+            return False
+
+    def _launch(self):
+        """Start a browser on a slot claimed with _reserve() (released again if the launch fails)."""
+        try:
+            manager = DriverManager(**self.driver_kwargs)
+            manager.get_driver()
+        except BaseException:
+            with self._lock:
+                self._launching -= 1
+            raise
+        with self._lock:
+            self._launching -= 1
+            self._all.append(manager)
+            self.startup_times.append(manager.startup_seconds)
+        return manager
+
+    def start(self):
+        """Launch browsers until the pool holds `size` instances."""
+        while self._reserve():
+            self._idle.put(self._launch())
+
+    def close(self):
+        """Quit every browser in the pool."""
+        with self._lock:
+            managers, self._all = self._all, []
+        for manager in managers:
+            try:
+                manager.quit()
+            except Exception as e:
+                print(f"⚠️ Could not quit pooled driver: {e}")
+        print(f"✅ Driver pool closed. {self.stats()}")
+
+    # ---------------- Checkout / Checkin ----------------
+    def checkout(self, timeout=None):
+        """
+        Take a healthy browser from the pool (launching one if the pool is not full yet).
+        Blocks up to timeout seconds when all browsers are in use.
+        """
+        with self._lock:
+            self.checkouts += 1
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            try:
+                manager = self._idle.get_nowait()
+            except queue.Empty:
+                if self._reserve():
+                    return self._launch()
+                # Wake up now and then: a discarded browser frees a slot to launch into
+                wait = 1.0 if deadline is None else min(1.0, deadline - time.monotonic())
+                if wait <= 0:
+                    raise
+                try:
+                    manager = self._idle.get(timeout=wait)
+                except queue.Empty:
+                    continue
+
+            if self.is_healthy(manager):
+                with self._lock:
+                    self.warm_checkouts += 1
+                return manager
+            self._discard(manager)
+
+    def checkin(self, manager, reset=True):
+        """Return a browser to the pool, resetting tabs and storage first."""
+        if reset:
+            try:
+                self.reset(manager)
+            except Exception as e:
+                print(f"⚠️ Could not reset pooled driver, discarding it: {e}")
+                self._discard(manager)
+                return
+        self._idle.put(manager)
+
+    @contextmanager
+    def lease(self, timeout=None):
+        manager = self.checkout(timeout)
+        try:
+            yield manager
+        finally:
+            self.checkin(manager)
+
+    # ---------------- Health / Reset ----------------
+    def is_healthy(self, manager):
+        """A browser is healthy if it answers a cheap command."""
+        if manager.driver is None:
+            return False
+        try:
+            return bool(manager.driver.window_handles)
+        except Exception:
+            return False
+
+    def reset(self, manager):
+        """Close extra tabs and clear web storage; cookies are kept so logins survive."""
+        driver = manager.driver
+        handles = driver.window_handles
+        for handle in handles[1:]:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(handles[0])
+        try:
+            driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+        except Exception:
+            pass  # about:blank and similar have no storage
+        driver.get("about:blank")
+
+    def _discard(self, manager):
+        with self._lock:
+            if manager in self._all:
+                self._all.remove(manager)
+        try:
+            manager.quit()
+        except Exception:
+            pass
+
+    # ---------------- Metrics ----------------
+    def stats(self):
+        cold = len(self.startup_times)
+        avg = sum(self.startup_times) / cold if cold else 0.0
+        return {
+            "browsers": len(self._all),
+            "cold_starts": cold,
+            "avg_startup_seconds": round(avg, 2),
+            "checkouts": self.checkouts,
+            "warm_checkouts": self.warm_checkouts,
+            "startup_seconds_saved": round(avg * self.warm_checkouts, 2),
+        }
+
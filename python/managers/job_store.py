@@ -0,0 +1,194 @@
+import json
+import os
+import sqlite3
+import threading
+import hashlib
+from datetime import datetime
+
+
+class JobStore:
+    """
+    Persistent SQLite (WAL) store of scraped jobs.
+
+    Rows are upserted as they are scraped, keyed by job ID and falling back to
+    the company-title hash, so history accumulates across runs instead of being
+    rewritten. Each row gets a monotonically increasing seq; pipeline stages keep
+    a cursor per stage and only read rows newer than it.
+
+    The signatures table keeps each job's near-duplicate signatures (see
+    DedupIndex.absorb) under the same identity, so the dedup index is rebuilt
+    from it instead of re-hashing the whole history on every run.
+    """
+
+    def __init__(self, db_path="state/jobs.db"):
+        self.db_path = db_path
+        os.makedirs(os.path.dirname(self.db_path) or ".", exist_ok=True)
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS jobs (
+                seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                job_id TEXT,
+                company_title_hash TEXT NOT NULL,
+                platform TEXT,
+                data TEXT NOT NULL,
+                first_seen TEXT NOT NULL,
+                last_seen TEXT NOT NULL
+            );
+            CREATE UNIQUE INDEX IF NOT EXISTS idx_jobs_job_id ON jobs(job_id) WHERE job_id IS NOT NULL;
+            CREATE INDEX IF NOT EXISTS idx_jobs_hash ON jobs(company_title_hash);
+            CREATE TABLE IF NOT EXISTS cursors (
+                stage TEXT PRIMARY KEY,
+                last_seq INTEGER NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS signatures (
+                job_key TEXT PRIMARY KEY,
+                version TEXT NOT NULL,
+                company_title_hash TEXT,
+                company TEXT,
+                title BLOB,
+                description BLOB,
+                duplicate_of TEXT
+            );
+        """)
+        self.conn.commit()
+
+    @staticmethod
+    def company_title_hash(company, title):
+        """Same hash the LinkedIn scraper writes to the Company-Title Hash column."""
+        return hashlib.md5(f"{company}-{title}".encode("utf-8")).hexdigest()
+
+    # ---------------- Writes ----------------
+    def upsert(self, job):
+        """
+        Insert or update one job (a dict keyed by CSV header).
+        Returns True if the job is new, False if it updated an existing row.
+        """
+        with self._lock:
+            new = self._upsert(job)
+            self.conn.commit()
+        return new
+
+    def upsert_many(self, jobs):
+        """Upsert several jobs in one transaction; returns how many were new."""
+        return len(self.upsert_batch(jobs))
+
+    def upsert_batch(self, jobs):
+        """
+        Upsert several jobs in one transaction; returns the jobs that were new. The
+        lock is held until the commit (or the rollback, if a job fails), so no other
+        writer commits half the batch.
+        """
+        with self._lock, self.conn:
+            new_jobs = [job for job in jobs if self._upsert(job)]
+        return new_jobs
+
+    def _upsert(self, job):
+        """upsert() without the lock or the commit."""
+        job_id = job.get("Job ID")
+        job_id = str(job_id) if job_id not in (None, "", "N/A") and str(job_id) != "nan" else None
+        ct_hash = job.get("Company-Title Hash") or self.company_title_hash(job.get("Company"), job.get("Job Title"))
+        job = dict(job, **{"Company-Title Hash": ct_hash})
+        now = datetime.now().isoformat(timespec="seconds")
+        data = json.dumps(job, ensure_ascii=False)
+
+        existing = None
+        if job_id:
+            existing = self.conn.execute("SELECT seq FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+        if existing is None:
+            existing = self.conn.execute(
+                "SELECT seq FROM jobs WHERE company_title_hash = ? ORDER BY seq LIMIT 1", (ct_hash,)
+            ).fetchone()
+
+        if existing:
+            self.conn.execute(
+                "UPDATE jobs SET data = ?, last_seen = ?, job_id = COALESCE(job_id, ?) WHERE seq = ?",
+                (data, now, job_id, existing["seq"]),
+            )
+        else:
+            self.conn.execute(
+                "INSERT INTO jobs (job_id, company_title_hash, platform, data, first_seen, last_seen) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (job_id, ct_hash, job.get("Scrap From"), data, now, now),
+            )
+        return existing is None
+
+    def save_signatures(self, version, records):
+        """Store [(duplicate_of, (key, company-title hash, company, title blob, description blob))] in one transaction."""
+        with self._lock:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO signatures (job_key, version, company_title_hash, company, title, description, "
+                "duplicate_of) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [(key, version, ct_hash, company, title, description, duplicate_of)
+                 for duplicate_of, (key, ct_hash, company, title, description) in records],
+            )
+            self.conn.commit()
+
+    # ---------------- Reads ----------------
+    # A job's identity, as used for signatures: its job ID, else its company-title hash
+    _JOIN_SIGNATURES = (
+        "FROM jobs j LEFT JOIN signatures s "
+        "ON s.job_key = COALESCE(j.job_id, j.company_title_hash) AND s.version = ?"
+    )
+
+    def signatures(self, version):
+        """Stored records (key, company-title hash, company, title blob, description blob) of non-duplicate jobs."""
+        return self.conn.execute(
+            "SELECT job_key, company_title_hash, company, title, description FROM signatures "
+            "WHERE version = ? AND duplicate_of IS NULL", (version,)
+        ).fetchall()
+
+    def unsigned(self, version):
+        """[(key, job)] without a stored signature for version (imported, or stored before signatures were kept)."""
+        return [(r["job_key"], json.loads(r["data"])) for r in self.conn.execute(
+            f"SELECT COALESCE(j.job_id, j.company_title_hash) AS job_key, j.data {self._JOIN_SIGNATURES} "
+            "WHERE s.job_key IS NULL ORDER BY j.seq", (version,)
+        )]
+
+    def unique(self, version):
+        """Every job except those recorded as near-duplicates of an earlier one, oldest first."""
+        return [json.loads(r["data"]) for r in self.conn.execute(
+            f"SELECT j.data {self._JOIN_SIGNATURES} WHERE s.duplicate_of IS NULL ORDER BY j.seq", (version,)
+        )]
+
+    def all(self):
+        return [json.loads(r["data"]) for r in self.conn.execute("SELECT data FROM jobs ORDER BY seq")]
+
+    def count(self):
+        return self.conn.execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
+
+    def max_seq(self):
+        return self.conn.execute("SELECT COALESCE(MAX(seq), 0) FROM jobs").fetchone()[0]
+
+    def rows_after(self, seq):
+        """Jobs inserted after seq, oldest first."""
+        return [json.loads(r["data"]) for r in self.conn.execute(
+            "SELECT data FROM jobs WHERE seq > ? ORDER BY seq", (seq,)
+        )]
+
+    def read_new(self, stage):
+        """
+        (jobs added since `stage` last advanced its cursor, seq to advance it to).
+        Call advance(stage, seq) once the jobs are processed, so an interrupted
+        stage reads them again.
+        """
+        row = self.conn.execute("SELECT last_seq FROM cursors WHERE stage = ?", (stage,)).fetchone()
+        last_seq = row["last_seq"] if row else 0
+        rows = self.conn.execute("SELECT seq, data FROM jobs WHERE seq > ? ORDER BY seq", (last_seq,)).fetchall()
+        return [json.loads(r["data"]) for r in rows], rows[-1]["seq"] if rows else last_seq
+
+    def advance(self, stage, seq):
+        """Move the stage's cursor forward to seq."""
+        with self._lock:
+            self.conn.execute(
+                "INSERT INTO cursors (stage, last_seq) VALUES (?, ?) "
+                "ON CONFLICT(stage) DO UPDATE SET last_seq = MAX(last_seq, excluded.last_seq)",
+                (stage, seq),
+            )
+            self.conn.commit()
+
+    def close(self):
+        self.conn.close()
@@ -0,0 +1,39 @@
+import random
+import time
+
+
+class PacingManager:
+    """
+    Human-like pauses, kept apart from condition waits.
+
+    Each pause is a random delay in [min_delay, max_delay] drawn from a per-run
+    jitter budget; once the budget is spent, pauses become no-ops. Configure it
+    per platform in config.json:
+
+        "pacing": {"enabled": true, "min_delay": 0.5, "max_delay": 2.0, "budget": 120}
+    """
+
+    def __init__(self, enabled=True, min_delay=0.5, max_delay=2.0, budget=120.0):
+        self.enabled = enabled
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.budget = budget
+        self.spent = 0.0
+
+    @classmethod
+    def from_config(cls, platform_config):
+        """Build from the platform's "pacing" section (all keys optional)."""
+        return cls(**platform_config.get("pacing", {}))
+
+    @property
+    def remaining(self):
+        return max(0.0, self.budget - self.spent)
+
+    def pause(self, scale=1.0):
+        """Sleep for a jittered delay (times scale) if budget remains; returns the seconds slept."""
+        if not self.enabled or self.remaining <= 0:
+            return 0.0
+        delay = min(random.uniform(self.min_delay, self.max_delay) * scale, self.remaining)
+        time.sleep(delay)
+        self.spent += delay
+        return delay
@@ -0,0 +1,177 @@
+import os
+import json
+import hashlib
+import shutil
+import tempfile
+import time
+import psutil
+
+
+class ProfileSnapshotManager:
+    """
+    Copies only the parts of a Chrome profile a scraping session needs (cookies,
+    Local State, Preferences, Local Storage) into a prepared snapshot, and reuses
+    that snapshot until the source profile changes.
+
+    Change detection is two-step: mtime/size first, then a content hash for files
+    whose mtime moved, so touching a file without changing it does not trigger a
+    rebuild. Each launch gets its own small working copy of the snapshot (Chrome
+    needs a writable, unshared user-data-dir); stale copies are garbage-collected.
+    """
+
+    # Relative to the profile directory (e.g. .../Chrome/Default)
+    PROFILE_ENTRIES = [
+        "Cookies", "Cookies-journal",
+        "Network/Cookies", "Network/Cookies-journal",
+        "Preferences", "Secure Preferences",
+        "Local Storage",
+    ]
+    # Relative to the user-data-dir; Local State holds the key that decrypts cookies
+    ROOT_ENTRIES = ["Local State"]
+
+    TEMP_PREFIX = "jobsearch-profile-"
+    OWNER_FILE = ".jobsearch-owner"
+
+    def __init__(self, user_data_dir, profile_name="Default", snapshots_dir="state/profiles"):
+        self.user_data_dir = user_data_dir
+        self.profile_name = profile_name
+        slug = hashlib.md5(os.path.join(user_data_dir, profile_name).encode("utf-8")).hexdigest()[:12]
+        self.snapshot_dir = os.path.join(snapshots_dir, slug)
+        self.manifest_path = os.path.join(self.snapshot_dir, "manifest.json")
+
+    # ---------------- Source Files ----------------
+    def _source_files(self):
+        """{relative path inside the user-data-dir: absolute source path} for every tracked file."""
+        files = {}
+        entries = [os.path.join(self.profile_name, e) for e in self.PROFILE_ENTRIES] + self.ROOT_ENTRIES
+        for entry in entries:
+            source = os.path.join(self.user_data_dir, entry)
+            if os.path.isfile(source):
+                files[entry] = source
+            elif os.path.isdir(source):
+                for root, _, names in os.walk(source):
+                    for name in names:
+                        if name == "LOCK":
+                            continue  # leveldb lock held by a running Chrome
+                        path = os.path.join(root, name)
+                        files[os.path.relpath(path, self.user_data_dir)] = path
+        return files
+
+    def _hash_file(self, path):
+        digest = hashlib.sha1()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def _load_manifest(self):
+        try:
+            with open(self.manifest_path, "r") as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    # ---------------- Snapshot ----------------
+    def prepare(self):
+        """
+        Bring the snapshot up to date with the source profile, copying only changed files.
+        Returns {"rebuilt", "copied_files", "seconds", "bytes"}.
+        """
+        started = time.perf_counter()
+        manifest = self._load_manifest()
+        sources = self._source_files()
+        new_manifest, copied = {}, 0
+
+        for rel, source in sources.items():
+            stat = os.stat(source)
+            entry = manifest.get(rel)
+            target = os.path.join(self.snapshot_dir, rel)
+            if entry and entry["mtime"] == stat.st_mtime and entry["size"] == stat.st_size and os.path.exists(target):
+                new_manifest[rel] = entry
+                continue
+
+            digest = self._hash_file(source)
+            if entry and entry["sha1"] == digest and os.path.exists(target):
+                new_manifest[rel] = dict(entry, mtime=stat.st_mtime)
+                continue
+
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            shutil.copy2(source, target)
+            new_manifest[rel] = {"mtime": stat.st_mtime, "size": stat.st_size, "sha1": digest}
+            copied += 1
+
+        # Files that disappeared from the source
+        for rel in set(manifest) - set(new_manifest):
+            try:
+                os.remove(os.path.join(self.snapshot_dir, rel))
+            except FileNotFoundError:
+                pass
+
+        os.makedirs(self.snapshot_dir, exist_ok=True)
+        tmp_path = self.manifest_path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(new_manifest, f)
+        os.replace(tmp_path, self.manifest_path)
+
+        report = {
+            "rebuilt": copied > 0 or set(manifest) != set(new_manifest),
+            "copied_files": copied,
+            "seconds": time.perf_counter() - started,
+            "bytes": sum(e["size"] for e in new_manifest.values()),
+        }
+        print(f"🗂️ Profile snapshot {'updated' if report['rebuilt'] else 'reused'}: "
+              f"{report['copied_files']} files copied, {report['bytes'] / 1e6:.1f} MB, {report['seconds']:.2f}s")
+        return report
+
+    def launch_copy(self):
+        """
+        A fresh, private user-data-dir seeded from the snapshot for one browser launch.
+        Returns (path, {"seconds", "bytes"}).
+        """
+        started = time.perf_counter()
+        temp_dir = tempfile.mkdtemp(prefix=self.TEMP_PREFIX)
+        size = 0
+        if os.path.isdir(self.snapshot_dir):
+            shutil.copytree(
+                self.snapshot_dir, temp_dir, dirs_exist_ok=True,
+                ignore=shutil.ignore_patterns("manifest.json*"),
+            )
+            size = sum(e["size"] for e in self._load_manifest().values())
+        with open(os.path.join(temp_dir, self.OWNER_FILE), "w") as f:
+            f.write(str(os.getpid()))
+        return temp_dir, {"seconds": time.perf_counter() - started, "bytes": size}
+
+    @classmethod
+    def release(cls, path):
+        """Delete a working copy once its browser has quit."""
+        if path and os.path.basename(path).startswith(cls.TEMP_PREFIX):
+            shutil.rmtree(path, ignore_errors=True)
+
+    @classmethod
+    def collect_garbage(cls, max_age_hours=12):
+        """
+        Remove working copies left behind by crashed runs: those whose owning
+        process is gone, or that have no owner and are older than max_age_hours.
+        Returns the count removed.
+        """
+        removed = 0
+        temp_root = tempfile.gettempdir()
+        now = time.time()
+        for name in os.listdir(temp_root):
+            if not name.startswith(cls.TEMP_PREFIX):
+                continue
+            path = os.path.join(temp_root, name)
+            try:
+                with open(os.path.join(path, cls.OWNER_FILE), "r") as f:
+                    owner = int(f.read().strip() or 0)
+            except (OSError, ValueError):
+                owner = 0
+            if owner and psutil.pid_exists(owner):
+                continue  # a live process (maybe this one) still uses it
+            if not owner and now - os.path.getmtime(path) < max_age_hours * 3600:
+                continue  # no owner recorded yet; only reap once it is clearly abandoned
+            shutil.rmtree(path, ignore_errors=True)
+            removed += 1
+        if removed:
+            print(f"🧹 Removed {removed} stale temp profiles.")
+        return removed
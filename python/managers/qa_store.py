@@ -0,0 +1,234 @@
+import os
+import re
+import json
+import math
+import threading
+from collections import defaultdict, namedtuple
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9+#]+")
+# Filler that does not change what a question asks; negations are kept on purpose
+STOPWORDS = {
+    "a", "an", "the", "of", "to", "in", "on", "for", "with", "and", "or", "is", "are", "do", "does", "did",
+    "you", "your", "have", "has", "please", "what", "which", "how", "many", "much", "this", "that", "be",
+    "at", "as", "by", "can", "will", "would", "if", "any", "we", "our", "us", "i", "my", "it", "from",
+    "enter", "select", "provide", "currently", "required", "work",
+}
+# A question negated on one side only asks the opposite ("n't" tokenises to a trailing "t")
+NEGATIONS = {"not", "no", "never", "t", "cannot", "dont", "doesnt", "didnt", "cant", "wont", "isnt", "arent"}
+ANSWER_TYPES = ("text", "number", "float", "choice")
+Match = namedtuple("Match", ["question", "answer", "kind", "confidence"])
+
+
+def _stem(token):
+    return token[:-1] if len(token) > 3 and token.endswith("s") and not token.endswith("ss") else token
+
+
+def question_tokens(question):
+    return frozenset(_stem(t) for t in TOKEN_PATTERN.findall(str(question or "").lower()) if t not in STOPWORDS)
+
+
+class QAStore:
+    """
+    Learned Easy Apply answers with fuzzy lookup.
+
+    Questions are indexed by normalised tokens (an inverted index token -> question
+    ids). A lookup that misses the exact question scores candidates sharing a token
+    by IDF-weighted Jaccard similarity and returns the best one whose confidence
+    reaches `threshold`, that is negated exactly when the question is (see
+    NEGATIONS), and whose answer fits the field (an integer for number
+    fields, one of the offered options for choices). Rare tokens drive candidate
+    generation, so lookups stay fast with tens of thousands of questions.
+
+    The file format stays the flat {question: answer} JSON; typed answers are
+    stored as {"answer": ..., "type": ...}, plain strings load as text and bare
+    JSON numbers as number/float.
+
+    Learned answers are appended to `<path>.journal` (one JSON line each, fsynced)
+    and folded into the snapshot file every `compact_every` entries or on
+    compact(). Loading replays the journal over the snapshot, so an answer
+    survives a crash as soon as record() returns.
+    """
+
+    def __init__(self, path, threshold=0.8, max_postings=1000, top_candidates=20, compact_every=200):
+        self.path = path
+        self.journal_path = path + ".journal"
+        self.compact_every = compact_every
+        self._journal_entries = 0
+        self.threshold = threshold
+        self.max_postings = max_postings  # tokens this common only rescore candidates, never generate them
+        self.top_candidates = top_candidates
+
+        self.entries = {}                  # question -> {"answer": str, "type": str}
+        self._ids = {}                     # question -> id
+        self._questions = []               # id -> question
+        self._tokens = []                  # id -> token set
+        self._postings = defaultdict(set)  # token -> ids
+        self._lock = threading.RLock()     # parallel apply workers share one store
+        self._load()
+
+    # ---------------- Storage ----------------
+    def _load(self):
+        if os.path.exists(self.path):
+            with open(self.path, "r") as f:
+                data = json.load(f)
+            for question, value in data.items():
+                if isinstance(value, dict):
+                    self.put(question, value.get("answer", ""), value.get("type", "text"))
+                elif isinstance(value, (int, float)) and not isinstance(value, bool):
+                    self.put(question, value, "number" if isinstance(value, int) else "float")
+                else:
+                    self.put(question, value)
+
+        if os.path.exists(self.journal_path):
+            with open(self.journal_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        break  # torn last line from a crash mid-append
+                    self.put(entry["q"], entry["a"], entry.get("t", "text"))
+                    self._journal_entries += 1
+            if self._journal_entries:
+                print(f"♻️ Recovered {self._journal_entries} journaled answers for {self.path}")
+                self.compact()
+
+    def to_dict(self):
+        """Flat-compatible form: plain strings for text answers."""
+        return {
+            q: e["answer"] if e["type"] == "text" else {"answer": e["answer"], "type": e["type"]}
+            for q, e in self.entries.items()
+        }
+
+    def compact(self):
+        """Fold the journal into the snapshot (atomic replace), then empty the journal."""
+        with self._lock:
+            self._compact()
+
+    def _compact(self):
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(self.to_dict(), f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+        # A crash before this truncate only replays answers the snapshot already has
+        open(self.journal_path, "w").close()
+        self._journal_entries = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, question):
+        return question in self.entries
+
+    # ---------------- Writes ----------------
+    def record(self, question, answer, kind="text"):
+        """put() and persist: one journal line now, a snapshot rewrite every compact_every answers."""
+        with self._lock:
+            self.put(question, answer, kind)
+            entry = self.entries[question]
+            with open(self.journal_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps({"q": question, "a": entry["answer"], "t": entry["type"]}) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            self._journal_entries += 1
+            if self._journal_entries >= self.compact_every:
+                self._compact()
+
+    def put(self, question, answer, kind="text"):
+        kind = kind if kind in ANSWER_TYPES else "text"
+        with self._lock:
+            self.entries[question] = {"answer": "" if answer is None else str(answer), "type": kind}
+            if question in self._ids:
+                return
+            qid = len(self._questions)
+            tokens = question_tokens(question)
+            self._ids[question] = qid
+            self._questions.append(question)
+            self._tokens.append(tokens)
+            for token in tokens:
+                self._postings[token].add(qid)
+
+    # ---------------- Lookups ----------------
+    def get(self, question, default=None):
+        """Exact-question answer (dict-style)."""
+        entry = self.entries.get(question)
+        return entry["answer"] if entry else default
+
+    def _idf(self, token):
+        return math.log((1 + len(self._questions)) / (1 + len(self._postings.get(token, ())))) + 1
+
+    @staticmethod
+    def fits(answer, kind=None, options=None):
+        """Whether a stored answer can fill a field of this kind/options."""
+        answer = str(answer).strip()
+        if not answer:
+            return False
+        if kind == "number":
+            return answer.isdigit()
+        if kind == "float":
+            try:
+                float(answer)
+                return True
+            except ValueError:
+                return False
+        if kind == "choice" and options:
+            answer = answer.lower()
+            return any(answer in (str(o.get("text", "")).lower(), str(o.get("value", "")).lower()) for o in options)
+        return True
+
+    def candidates(self, question):
+        """[(confidence, question id)] best first, for stored questions sharing a token."""
+        tokens = question_tokens(question)
+        if not tokens:
+            return []
+        weights = {t: self._idf(t) for t in tokens}
+        rare = [t for t in tokens if 0 < len(self._postings.get(t, ())) <= self.max_postings]
+        common = [t for t in tokens if len(self._postings.get(t, ())) > self.max_postings]
+
+        shared = defaultdict(float)
+        for token in rare or common:
+            for qid in self._postings[token]:
+                shared[qid] += weights[token]
+        if rare:
+            # Common tokens only add weight to candidates the rare ones produced
+            for token in common:
+                postings = self._postings[token]
+                for qid in shared:
+                    if qid in postings:
+                        shared[qid] += weights[token]
+        # Jaccard <= shared / query weight, so weaker candidates cannot reach the threshold
+        floor = self.threshold * sum(weights.values())
+        top = sorted((q for q in shared if shared[q] >= floor), key=shared.get, reverse=True)[:self.top_candidates]
+
+        negated = not tokens.isdisjoint(NEGATIONS)
+        scored = []
+        for qid in top:
+            other = self._tokens[qid]
+            if negated == other.isdisjoint(NEGATIONS):
+                continue  # same words, opposite question
+            union = sum(weights.get(t) or self._idf(t) for t in tokens | other)
+            scored.append((min(shared[qid] / union, 1.0), qid))
+        scored.sort(reverse=True)
+        return scored
+
+    def lookup(self, question, kind=None, options=None):
+        """
+        Match for question: the exact entry (confidence 1.0), else the most
+        similar stored question at or above threshold whose answer fits; None otherwise.
+        """
+        with self._lock:
+            return self._lookup(question, kind, options)
+
+    def _lookup(self, question, kind, options):
+        entry = self.entries.get(question)
+        if entry:
+            return Match(question, entry["answer"], entry["type"], 1.0)
+        for confidence, qid in self.candidates(question):
+            if confidence < self.threshold:
+                break
+            stored = self._questions[qid]
+            entry = self.entries[stored]
+            if self.fits(entry["answer"], kind, options):
+                return Match(stored, entry["answer"], entry["type"], confidence)
+        return None
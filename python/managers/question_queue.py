@@ -0,0 +1,185 @@
+import json
+import os
+import sqlite3
+import threading
+from datetime import datetime
+
+
+class QuestionQueue:
+    """
+    Persistent SQLite (WAL) queue of Easy Apply jobs parked on unanswered questions.
+
+    In unattended mode the apply agent parks a job with the questions it could
+    not answer and moves on instead of blocking on input(). The questions are
+    answered later in one batch (answer_interactively); jobs whose questions are
+    all answered come back from ready_jobs() and are resumed by the agent.
+    """
+
+    def __init__(self, db_path="state/pending_questions.db"):
+        self.db_path = db_path
+        os.makedirs(os.path.dirname(self.db_path) or ".", exist_ok=True)
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS parked_jobs (
+                job_id TEXT PRIMARY KEY,
+                job_url TEXT NOT NULL,
+                data TEXT NOT NULL,
+                status TEXT NOT NULL DEFAULT 'parked',
+                parked_at TEXT NOT NULL,
+                resumed_at TEXT
+            );
+            CREATE TABLE IF NOT EXISTS questions (
+                question TEXT PRIMARY KEY,
+                kind TEXT NOT NULL,
+                options TEXT NOT NULL,
+                answer TEXT,
+                first_seen TEXT NOT NULL,
+                answered_at TEXT
+            );
+            CREATE TABLE IF NOT EXISTS job_questions (
+                job_id TEXT NOT NULL,
+                question TEXT NOT NULL,
+                PRIMARY KEY (job_id, question)
+            );
+            CREATE INDEX IF NOT EXISTS idx_parked_status ON parked_jobs(status);
+        """)
+        self.conn.commit()
+
+    @staticmethod
+    def _now():
+        return datetime.now().isoformat(timespec="seconds")
+
+    # ---------------- Writes ----------------
+    def park(self, job_id, job_url, row, questions):
+        """Park a job on questions: [(question, kind, options)]; re-parking replaces its questions."""
+        now = self._now()
+        data = json.dumps(row or {}, ensure_ascii=False, default=str)
+        with self._lock:
+            self.conn.execute(
+                "INSERT INTO parked_jobs (job_id, job_url, data, status, parked_at) VALUES (?, ?, ?, 'parked', ?) "
+                "ON CONFLICT(job_id) DO UPDATE SET job_url = excluded.job_url, data = excluded.data, "
+                "status = 'parked', parked_at = excluded.parked_at, resumed_at = NULL",
+                (str(job_id), job_url, data, now),
+            )
+            self.conn.execute("DELETE FROM job_questions WHERE job_id = ?", (str(job_id),))
+            for question, kind, options in questions:
+                self.conn.execute(
+                    "INSERT OR IGNORE INTO questions (question, kind, options, first_seen) VALUES (?, ?, ?, ?)",
+                    (question, kind, json.dumps(options or []), now),
+                )
+                self.conn.execute(
+                    "INSERT OR IGNORE INTO job_questions (job_id, question) VALUES (?, ?)", (str(job_id), question)
+                )
+            self.conn.commit()
+
+    def answer(self, question, answer):
+        with self._lock:
+            self.conn.execute(
+                "UPDATE questions SET answer = ?, answered_at = ? WHERE question = ?",
+                (str(answer), self._now(), question),
+            )
+            self.conn.commit()
+
+    def mark_resumed(self, job_id):
+        with self._lock:
+            self.conn.execute(
+                "UPDATE parked_jobs SET status = 'resumed', resumed_at = ? WHERE job_id = ?", (self._now(), str(job_id))
+            )
+            self.conn.commit()
+
+    # ---------------- Reads ----------------
+    def parked_ids(self):
+        """IDs of jobs currently parked (resumed ones excluded)."""
+        return {r["job_id"] for r in self.conn.execute("SELECT job_id FROM parked_jobs WHERE status = 'parked'")}
+
+    def pending_questions(self):
+        """Unanswered questions of parked jobs, most-blocking first."""
+        rows = self.conn.execute("""
+            SELECT q.question, q.kind, q.options, COUNT(p.job_id) AS jobs
+            FROM questions q
+            JOIN job_questions jq ON jq.question = q.question
+            JOIN parked_jobs p ON p.job_id = jq.job_id AND p.status = 'parked'
+            WHERE q.answer IS NULL
+            GROUP BY q.question
+            ORDER BY jobs DESC, q.first_seen
+        """).fetchall()
+        return [
+            {"question": r["question"], "kind": r["kind"], "options": json.loads(r["options"]), "jobs": r["jobs"]}
+            for r in rows
+        ]
+
+    def ready_jobs(self, known=None):
+        """
+        [(job_id, job_url, row)] of parked jobs with every question answered, here
+        or according to known(question, kind, options) (e.g. the QA store).
+        """
+        blocking = {}
+        for r in self.conn.execute("""
+            SELECT jq.job_id, q.question, q.kind, q.options
+            FROM job_questions jq JOIN questions q ON q.question = jq.question
+            WHERE q.answer IS NULL
+        """):
+            blocking.setdefault(r["job_id"], []).append((r["question"], r["kind"], json.loads(r["options"])))
+
+        ready = []
+        for r in self.conn.execute("SELECT job_id, job_url, data FROM parked_jobs WHERE status = 'parked' ORDER BY parked_at"):
+            open_questions = blocking.get(r["job_id"], [])
+            if all(known and known(*q) for q in open_questions):
+                ready.append((r["job_id"], r["job_url"], json.loads(r["data"])))
+        return ready
+
+    def counts(self):
+        row = self.conn.execute(
+            "SELECT SUM(status = 'parked') AS parked, SUM(status = 'resumed') AS resumed FROM parked_jobs"
+        ).fetchone()
+        return {"parked": row["parked"] or 0, "resumed": row["resumed"] or 0, "questions": len(self.pending_questions())}
+
+    # ---------------- Batch answering ----------------
+    def answer_interactively(self, qa_store):
+        """
+        Ask the operator every pending question once (no browser needed), record
+        the answers in qa_store and here; returns how many were answered.
+        """
+        answered = 0
+        pending = self.pending_questions()
+        print(f"📝 {len(pending)} pending questions across {self.counts()['parked']} parked jobs")
+        for item in pending:
+            question, kind, options = item["question"], item["kind"], item["options"]
+            match = qa_store.lookup(question, kind=kind, options=options)
+            if match is not None:  # learned meanwhile (another job or an earlier batch)
+                self.answer(question, match.answer)
+                answered += 1
+                continue
+
+            print(f"\n❓ {question}  (blocks {item['jobs']} job(s), expects {kind})")
+            for idx, option in enumerate(options, start=1):
+                print(f"     {idx}. {option['text']}")
+            while True:
+                reply = input("   → Answer (blank to skip): ").strip()
+                if not reply:
+                    break
+                if kind == "choice" and options:
+                    if reply.isdigit() and 1 <= int(reply) <= len(options):
+                        reply = options[int(reply) - 1]["text"]
+                    if qa_store.fits(reply, kind, options):
+                        break
+                    print("⚠️ Please enter the number of one of the options.")
+                elif qa_store.fits(reply, kind):
+                    break
+                else:
+                    print(f"⚠️ Please enter a valid {kind}.")
+            if not reply:
+                continue
+            qa_store.record(question, reply, kind)
+            self.answer(question, reply)
+            answered += 1
+        qa_store.compact()
+        print(f"✅ Answered {answered} of {len(pending)} pending questions")
+        return answered
+
+    def close(self):
+        self.conn.close()
@@ -1,37 +1,371 @@
 import csv
+import io
 import os
 import json
+import hashlib
+import threading
+import time
+
+from managers.job_store import JobStore
+from managers.dedup_manager import DedupIndex
+
 
 class ResultManager:
     """
     Handles saving scraping results to CSV and JSON files.
+
+    Rows go into a persistent JobStore first (upserted by job ID / company-title
+    hash), and the CSV/JSON files are exported from it, so earlier runs' results
+    are kept instead of being overwritten.
+
+    With dedupe on, near-duplicates of stored jobs (reposts with reworded titles,
+    the same job on another platform; see DedupIndex) are dropped before they are
+    stored, and exports collapse any that are already in the store. Signatures
+    are stored with the jobs, so only jobs stored without one are hashed when the
+    index is loaded.
     """
 
-    def __init__(self, csv_path="job_results.csv", json_path=None):
+    HEADERS = [
+        "Job Title", "Company", "Location", "Footer",
+        "Easy Apply", "Job Type", "Description",
+        "Experience Required", "Salary Mentioned", "Apply Link",
+        "Scrap From", "Job ID", "Job URL", "Company-Title Hash"
+    ]
+
+    def __init__(self, csv_path="job_results.csv", json_path=None, db_path="state/jobs.db", dedupe=True):
         self.csv_path = csv_path
         self.json_path = json_path or os.path.splitext(csv_path)[0] + ".json"
+        self.checkpoint_path = self.csv_path + ".ckpt"
         os.makedirs(os.path.dirname(self.csv_path) or ".", exist_ok=True)
+        self.store = JobStore(db_path)
+        if self.store.count() == 0 and os.path.exists(self.csv_path):
+            self.import_csv(self.csv_path)
+
+        self.dedup = DedupIndex() if dedupe else None
+        self.duplicates = 0
+        self._signatures = []  # records of admitted jobs, stored with the next write
+        self._lock = threading.RLock()  # crawler workers share one manager (and so one dedup index)
+        if self.dedup is not None:
+            self._load_dedup()
+
+    def _as_dict(self, row, headers=None):
+        if isinstance(row, dict):
+            return row
+        return dict(zip(headers or self.HEADERS, row))
+
+    # ---------------- Store ----------------
+    def _load_dedup(self):
+        """Index stored signatures; hash only jobs stored without one (imported, or older than signatures)."""
+        version = self.dedup.version
+        for record in self.store.signatures(version):
+            self.dedup.restore(*record)
+        records = [self.dedup.absorb(job, key) for key, job in self.store.unsigned(version)]
+        if records:
+            self.store.save_signatures(version, records)
+            print(f"♊ Indexed {len(records)} stored jobs for near-duplicate detection")
+
+    def admit(self, job):
+        """
+        False (and counted) if job near-duplicates a different job already kept;
+        otherwise index it, so later near-duplicates of it are caught, and return True.
+        """
+        if self.dedup is None:
+            return True
+        with self._lock:
+            match, record = self.dedup.absorb(job)
+            if match is not None:
+                self.duplicates += 1
+                print(f"♊ Skipping near-duplicate: {job.get('Job Title')} @ {job.get('Company')} (matches {match})")
+                return False
+            self._signatures.append((None, record))
+            return True
+
+    def _save_signatures(self):
+        with self._lock:
+            records, self._signatures = self._signatures, []
+        if records:
+            self.store.save_signatures(self.dedup.version, records)
+
+    def add(self, row, headers=None):
+        """Upsert a single scraped row right away; returns True if the job is new (False for near-duplicates)."""
+        job = self._as_dict(row, headers)
+        with self._lock:
+            if not self.admit(job):
+                return False
+            new = self.store.upsert(job)
+            self._save_signatures()
+        return new
+
+    def import_csv(self, path):
+        """Seed the store from an existing results CSV (e.g. one written before the store existed)."""
+        with open(path, "r", newline="", encoding="utf-8") as f:
+            reader = csv.reader(f)
+            file_headers = next(reader, [])
+            # Older LinkedIn files wrote 14-value rows under a 13-name header (no "Scrap From")
+            new = self.store.upsert_many(
+                dict(zip(self.HEADERS if len(row) == len(self.HEADERS) > len(file_headers) else file_headers, row))
+                for row in reader
+            )
+        print(f"🗃️ Imported {new} jobs from {path}")
 
+    def read_new(self, stage):
+        """
+        (rows added since `stage` (e.g. "filter") last advanced, cursor seq); later
+        stages only process these and call advance() once their output is written.
+        """
+        return self.store.read_new(stage)
+
+    def advance(self, stage, seq):
+        self.store.advance(stage, seq)
+
+    def open_sink(self, flush_rows=20, flush_seconds=10.0):
+        """Streaming sink for scrapers to push rows into as they are produced (see ResultSink)."""
+        return ResultSink(self, flush_rows=flush_rows, flush_seconds=flush_seconds)
+
+    # ---------------- Export ----------------
     def save_to_csv(self, results, headers=None):
         """
-        Save results to a CSV file.
+        Upsert results into the store, then export the full history to CSV.
         """
-        headers = headers or [
-            "Job Title", "Company", "Location", "Footer",
-            "Easy Apply", "Job Type", "Description",
-            "Experience Required", "Salary Mentioned", "Apply Link",
-            "Job ID", "Job URL", "Company-Title Hash"
-        ]
-        with open(self.csv_path, "w", newline="", encoding="utf-8") as f:
-            writer = csv.writer(f)
-            writer.writerow(headers)
-            writer.writerows(results)
-        print(f"✅ Saved results to CSV: {self.csv_path}")
+        headers = headers or self.HEADERS
+        jobs = [job for job in (self._as_dict(row, headers) for row in results) if self.admit(job)]
+        new = self.store.upsert_many(jobs)
+        self._save_signatures()
+        print(f"🗃️ {new} new / {len(jobs) - new} updated jobs in {self.store.db_path}"
+              f"{f', {len(results) - len(jobs)} near-duplicates skipped' if len(jobs) < len(results) else ''}")
+        self.export_csv()
+
+    def unique_jobs(self):
+        """Every stored job, with near-duplicates collapsed (first stored wins)."""
+        return self.store.unique(self.dedup.version) if self.dedup is not None else self.store.all()
 
-    def save_to_json(self, results):
+    def export_csv(self, path=None, rows=None, headers=None):
         """
-        Save results to a JSON file.
+        Write rows (default: every stored job, near-duplicates collapsed) to CSV.
+        Rewriting the results CSV drops the streaming checkpoint, whose offsets no
+        longer apply; the next ResultSink starts from a full export.
         """
+        path = path or self.csv_path
+        rows = self.unique_jobs() if rows is None else rows
+        headers = headers or self._headers_for(rows)
+        if os.path.abspath(path) == os.path.abspath(self.csv_path) and os.path.exists(self.checkpoint_path):
+            os.remove(self.checkpoint_path)
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=headers, extrasaction="ignore")
+            writer.writeheader()
+            writer.writerows(rows)
+        print(f"✅ Saved results to CSV: {path}")
+
+    def save_to_json(self, results=None):
+        """
+        Save results (default: every stored job, near-duplicates collapsed) to a JSON file.
+        """
+        results = self.unique_jobs() if results is None else results
         with open(self.json_path, "w", encoding="utf-8") as f:
             json.dump(results, f, indent=2, ensure_ascii=False)
         print(f"✅ Saved results to JSON: {self.json_path}")
+
+    def _headers_for(self, rows):
+        """Default headers first, then any extra keys (e.g. platform-specific columns) in first-seen order."""
+        headers = list(self.HEADERS)
+        for row in rows:
+            for key in row:
+                if key not in headers:
+                    headers.append(key)
+        return headers
+
+
+class ResultSink:
+    """
+    Buffered, crash-safe streaming writer fed by the scrapers.
+
+    Pushed rows are buffered and flushed every flush_rows rows or flush_seconds
+    seconds (a background thread covers slow crawls). A flush upserts the batch
+    into the JobStore in one transaction, appends the jobs that are new to the CSV
+    and to a JSON Lines file, fsyncs both and records a checkpoint. Memory stays
+    bounded by the buffer, however long the crawl runs.
+
+    On open, files are truncated back to the last checkpoint (dropping a torn
+    tail) and any jobs the store committed after it are replayed into the files,
+    so a crash at job 99 loses at most the unflushed buffer. The checkpoint also
+    holds a hash of the bytes just before each offset; if a file no longer
+    matches (rewritten or edited since), it is re-exported instead of truncated.
+
+    Re-scraped jobs that update a stored row cannot be appended in place: the
+    checkpoint is marked stale and the files are re-exported on close (or on
+    the next open, after a crash).
+
+        with result_manager.open_sink() as sink:
+            sink.push(row)
+    """
+
+    def __init__(self, result_manager, flush_rows=20, flush_seconds=10.0):
+        self.result_manager = result_manager
+        self.store = result_manager.store
+        self.csv_path = result_manager.csv_path
+        self.jsonl_path = os.path.splitext(result_manager.json_path)[0] + ".jsonl"
+        self.checkpoint_path = result_manager.checkpoint_path
+        self.headers = list(ResultManager.HEADERS)
+        self.flush_rows = flush_rows
+        self.flush_seconds = flush_seconds
+
+        self._buffer = []
+        self._lock = threading.RLock()
+        self._last_flush = time.monotonic()
+        self._closed = threading.Event()
+        self.pushed = 0
+        self.written = 0
+        self.updated = 0
+        self._stale = False
+
+        self._recover()
+        self._timer = threading.Thread(target=self._flush_periodically, daemon=True)
+        self._timer.start()
+
+    # ---------------- Recovery ----------------
+    def _load_checkpoint(self):
+        try:
+            with open(self.checkpoint_path, "r") as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+    @staticmethod
+    def _tail_hash(path, offset, length=256):
+        """Hash of the bytes just before offset (None if the file is shorter than offset)."""
+        try:
+            with open(path, "rb") as f:
+                if os.fstat(f.fileno()).st_size < offset:
+                    return None
+                f.seek(max(offset - length, 0))
+                return hashlib.md5(f.read(min(offset, length))).hexdigest()
+        except FileNotFoundError:
+            return None
+
+    def _save_checkpoint(self):
+        checkpoint = {"seq": self.store.max_seq(), "stale": self._stale}
+        for name, path in (("csv", self.csv_path), ("jsonl", self.jsonl_path)):
+            size = os.path.getsize(path)
+            checkpoint[name] = size
+            checkpoint[name + "_tail"] = self._tail_hash(path, size)
+        tmp_path = self.checkpoint_path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(checkpoint, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.checkpoint_path)
+
+    def _csv_header(self):
+        try:
+            with open(self.csv_path, "r", newline="", encoding="utf-8") as f:
+                return next(csv.reader(f), None)
+        except FileNotFoundError:
+            return None
+
+    def _matches(self, checkpoint):
+        """Whether both files still start with what the checkpoint recorded."""
+        return all(
+            checkpoint.get(name + "_tail") is not None
+            and self._tail_hash(path, checkpoint[name]) == checkpoint[name + "_tail"]
+            for name, path in (("csv", self.csv_path), ("jsonl", self.jsonl_path))
+        )
+
+    def _rewrite(self):
+        """Full export of the store to CSV and JSONL, then a fresh checkpoint."""
+        jobs = self.result_manager.unique_jobs()
+        self.result_manager.export_csv(rows=jobs, headers=self.headers)
+        with open(self.jsonl_path, "w", encoding="utf-8") as f:
+            for job in jobs:
+                f.write(json.dumps(job, ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        self._stale = False
+        self._save_checkpoint()
+
+    def _recover(self):
+        checkpoint = self._load_checkpoint()
+        if checkpoint is None or checkpoint.get("stale") or self._csv_header() != self.headers \
+                or not self._matches(checkpoint):
+            # First streaming run, a file from before streaming or rewritten since the
+            # checkpoint, or updated rows never exported: start from a full export
+            self._rewrite()
+            return
+
+        # Drop anything written after the last checkpoint (torn tail from a crash)
+        for path, offset in ((self.csv_path, checkpoint["csv"]), (self.jsonl_path, checkpoint["jsonl"])):
+            if os.path.exists(path) and os.path.getsize(path) > offset:
+                with open(path, "r+b") as f:
+                    f.truncate(offset)
+
+        # Jobs the store committed but the files never got
+        missed = self.store.rows_after(checkpoint["seq"])
+        if missed:
+            self._append_files(missed)
+            print(f"♻️ Recovered {len(missed)} jobs into {self.csv_path} after an interrupted run.")
+        self._save_checkpoint()
+
+    # ---------------- Writing ----------------
+    def push(self, row, headers=None):
+        """Queue one scraped row (list in `headers` order, or dict); flushes when the buffer is full."""
+        with self._lock:
+            job = self.result_manager._as_dict(row, headers)
+            self.pushed += 1
+            if not self.result_manager.admit(job):  # indexed now, so a near-duplicate later in the buffer is caught
+                return
+            self._buffer.append(job)
+            if len(self._buffer) >= self.flush_rows:
+                self.flush()
+
+    def flush(self):
+        """Persist the buffer: store transaction, append new jobs to CSV/JSONL, fsync, checkpoint."""
+        with self._lock:
+            if not self._buffer:
+                self._last_flush = time.monotonic()
+                return
+            batch, self._buffer = self._buffer, []
+            new_jobs = self.store.upsert_batch(batch)
+            self.result_manager._save_signatures()
+            updated = len(batch) - len(new_jobs)
+
+            if new_jobs:
+                self._append_files(new_jobs)
+            if updated:
+                self._stale = True  # re-exported on close
+            if new_jobs or updated:
+                self._save_checkpoint()
+            self.written += len(new_jobs)
+            self.updated += updated
+            self._last_flush = time.monotonic()
+
+    def _append_files(self, jobs):
+        csv_buffer = io.StringIO()
+        writer = csv.DictWriter(csv_buffer, fieldnames=self.headers, extrasaction="ignore")
+        writer.writerows(jobs)
+        jsonl = "".join(json.dumps(job, ensure_ascii=False) + "\n" for job in jobs)
+
+        for path, text in ((self.csv_path, csv_buffer.getvalue()), (self.jsonl_path, jsonl)):
+            with open(path, "a", newline="", encoding="utf-8") as f:
+                f.write(text)
+                f.flush()
+                os.fsync(f.fileno())
+
+    def _flush_periodically(self):
+        while not self._closed.wait(self.flush_seconds):
+            if time.monotonic() - self._last_flush >= self.flush_seconds:
+                self.flush()
+
+    def close(self):
+        self._closed.set()
+        self.flush()
+        with self._lock:
+            if self._stale:
+                self._rewrite()
+        print(f"✅ Streamed {self.written} new jobs, {self.updated} updated ({self.pushed} pushed, "
+              f"{self.result_manager.duplicates} near-duplicates skipped) to {self.csv_path}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
@@ -0,0 +1,172 @@
+import os
+import re
+import json
+import hashlib
+from datetime import date
+import fitz  # PyMuPDF
+
+MONTHS = {m: i for i, m in enumerate(["jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"], 1)}
+DATE_RANGE_PATTERN = re.compile(
+    r"\b([a-z]{3})[a-z]*\.?\s+(\d{4})\s*[–—-]\s*(?:([a-z]{3})[a-z]*\.?\s+(\d{4})|(present|current|now))"
+)
+# "Company – Title (Jan 2025 – Present)"
+ROLE_PATTERN = re.compile(r"^(.+?)\s+[–—-]\s+(.+?)\s*\(\s*[A-Za-z]{3,9}\.?\s+\d{4}\s*[–—-]", re.MULTILINE)
+SKILL_SECTION_PATTERN = re.compile(r"^\s*(?:technical\s+)?skills\s*:?\s*$", re.IGNORECASE | re.MULTILINE)
+# Words of the total-experience question; any other word names a skill or topic
+QUESTION_TOKEN_PATTERN = re.compile(r"[a-z0-9+#]+")
+GENERIC_EXPERIENCE_WORDS = {
+    "how", "many", "much", "what", "is", "are", "your", "you", "do", "have", "of", "in", "the", "a", "total",
+    "overall", "years", "year", "yrs", "work", "working", "professional", "relevant", "industry", "experience",
+    "please", "enter", "number",
+}
+SECTION_BREAK_PATTERN = re.compile(r"^\s*(?:other|education|certifications?|projects?|experience|languages)\b[^:]*$", re.IGNORECASE)
+
+
+def resume_years(resume_text, today=None):
+    """
+    Years of experience: the sum of "Mon YYYY – Mon YYYY/Present" ranges, or
+    failing that the largest "N years" figure the resume states; None if neither.
+    """
+    text = (resume_text or "").lower()
+    today = today or date.today()
+    months = 0
+    for start_mon, start_year, end_mon, end_year, ongoing in DATE_RANGE_PATTERN.findall(text):
+        if start_mon not in MONTHS or (end_mon and end_mon not in MONTHS):
+            continue
+        start = int(start_year) * 12 + MONTHS[start_mon]
+        end = today.year * 12 + today.month if ongoing else int(end_year) * 12 + MONTHS[end_mon]
+        months += max(end - start, 0)
+    if months:
+        return round(months / 12, 1)
+    years = re.findall(r"(\d+(?:\.\d+)?)\+?\s*(?:years?|yrs?)", text)
+    return max(float(y) for y in years) if years else None
+
+
+class ResumeManager:
+    """
+    Extracts a resume PDF once and caches the text and a structured profile
+    (headline, skills, roles, years of experience, summary) under the file's
+    sha256, so the filter and apply agents share one parse per resume version.
+
+        resume = ResumeManager("resume.pdf")
+        resume.text                # full text
+        resume.profile             # dict
+        resume.prompt_component()  # compact stand-in for the full text in LLM prompts
+    """
+
+    # Bump when build_profile's output changes, so cached profiles are rebuilt
+    PROFILE_VERSION = 2
+
+    def __init__(self, resume_path, cache_dir="state/resume"):
+        self.resume_path = resume_path
+        self.cache_dir = cache_dir
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self.file_hash = self._hash_file()
+        self.cache_path = os.path.join(self.cache_dir, f"{self.file_hash}.json")
+        self._data = self._load()
+
+    def _hash_file(self):
+        digest = hashlib.sha256()
+        with open(self.resume_path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def _load(self):
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") == self.PROFILE_VERSION:
+                return data
+        except (FileNotFoundError, json.JSONDecodeError):
+            pass
+        text = self.extract_text(self.resume_path)
+        data = {"version": self.PROFILE_VERSION, "text": text, "profile": self.build_profile(text)}
+        tmp_path = self.cache_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, self.cache_path)
+        print(f"📄 Parsed resume {os.path.basename(self.resume_path)} ({len(text)} chars)")
+        return data
+
+    @staticmethod
+    def extract_text(pdf_path):
+        """All text of a PDF, page by page."""
+        with fitz.open(pdf_path) as doc:
+            return "".join(page.get_text() for page in doc)
+
+    @property
+    def text(self):
+        return self._data["text"]
+
+    @property
+    def profile(self):
+        return self._data["profile"]
+
+    # ---------------- Profile ----------------
+    @staticmethod
+    def _skills(text):
+        """Items of the Skills section ("Label: a, b (c, d)" lines), in order, de-duplicated."""
+        match = SKILL_SECTION_PATTERN.search(text)
+        if not match:
+            return []
+        skills = []
+        for line in text[match.end():].splitlines():
+            if SECTION_BREAK_PATTERN.match(line):
+                break
+            items = line.split(":", 1)[-1]
+            for item in re.split(r"[,;()]", items):
+                item = item.strip(" -•\t")
+                if item and len(item) <= 40 and item.lower() not in (s.lower() for s in skills):
+                    skills.append(item)
+        return skills
+
+    @staticmethod
+    def _summary(text):
+        match = re.search(r"(?:professional\s+)?summary\s*\n(.+?)(?:\n[A-Z][A-Za-z &]+\n)", text, re.IGNORECASE | re.DOTALL)
+        return " ".join(match.group(1).split()) if match else ""
+
+    @classmethod
+    def build_profile(cls, text):
+        lines = [line.strip() for line in text.splitlines() if line.strip()]
+        roles = list(dict.fromkeys((title.strip(), company.strip()) for company, title in ROLE_PATTERN.findall(text)))
+        return {
+            "name": lines[0] if lines else "",
+            "headline": lines[1] if len(lines) > 1 else "",
+            "years_experience": resume_years(text),
+            "roles": [{"title": title, "company": company} for title, company in roles],
+            "titles": list(dict.fromkeys(title for title, _ in roles)),
+            "companies": list(dict.fromkeys(company for _, company in roles)),
+            "skills": cls._skills(text),
+            "summary": cls._summary(text),
+        }
+
+    def prompt_component(self, max_skills=40):
+        """A few lines carrying what job matching needs, in place of the full resume text."""
+        profile = self.profile
+        parts = [f"Candidate: {profile['headline']}"]
+        if profile["years_experience"] is not None:
+            parts.append(f"Experience: {profile['years_experience']} years")
+        if profile["roles"]:
+            roles = ", ".join(f"{role['title']} at {role['company']}" for role in profile["roles"])
+            parts.append(f"Roles: {roles}")
+        if profile["skills"]:
+            parts.append(f"Skills: {', '.join(profile['skills'][:max_skills])}")
+        if profile["summary"]:
+            parts.append(f"Summary: {profile['summary']}")
+        return "\n".join(parts)
+
+    def answer_for(self, question):
+        """
+        Answer for the generic "How many years of (work) experience do you have?"
+        question: total years, rounded. A question naming a skill or topic on
+        either side of "experience" ("Kubernetes experience", "experience with
+        SQL") gets None, since total years are not years spent on that skill.
+        """
+        q = (question or "").lower()
+        years = self.profile["years_experience"]
+        if years is None or "year" not in q or "experience" not in q:
+            return None
+        if any(t not in GENERIC_EXPERIENCE_WORDS for t in QUESTION_TOKEN_PATTERN.findall(q) if not t.isdigit()):
+            return None
+        return str(max(int(round(years)), 0))
@@ -0,0 +1,117 @@
+import time
+
+
+# One scroll step of the job list container. Resolves as soon as a MutationObserver
+# sees the card count grow, or after idleMs without new cards.
+# arguments: cardSelector, containerSelector, expected, expectedSelector (each may be null), idleMs, callback
+SCROLL_STEP_SCRIPT = """
+const [cardSelector, containerSelector, fixedExpected, expectedSelector, idleMs] = arguments;
+const done = arguments[arguments.length - 1];
+const count = () => document.querySelectorAll(cardSelector).length;
+
+const scrollableAncestor = (el) => {
+    for (let node = el; node && node !== document.body; node = node.parentElement) {
+        const overflowY = getComputedStyle(node).overflowY;
+        if ((overflowY === "auto" || overflowY === "scroll") && node.scrollHeight > node.clientHeight) {
+            return node;
+        }
+    }
+    return document.scrollingElement;
+};
+
+let container = containerSelector ? document.querySelector(containerSelector) : null;
+if (!container) {
+    const first = document.querySelector(cardSelector) || (expectedSelector && document.querySelector(expectedSelector));
+    container = first ? scrollableAncestor(first) : document.scrollingElement;
+}
+
+const before = count();
+const expected = fixedExpected || (expectedSelector ? document.querySelectorAll(expectedSelector).length : null);
+const atBottom = () => Math.ceil(container.scrollTop + container.clientHeight) >= container.scrollHeight;
+let timer = null;
+let observer = null;
+const finish = (appeared) => {
+    if (observer) observer.disconnect();
+    clearTimeout(timer);
+    done({
+        count: count(),
+        expected: expected,
+        appeared: appeared,
+        atBottom: atBottom()
+    });
+};
+
+if (expected && before >= expected) {
+    finish(false);
+    return;
+}
+
+observer = new MutationObserver(() => { if (count() > before) finish(true); });
+observer.observe(container === document.scrollingElement ? document.body : container, {childList: true, subtree: true});
+timer = setTimeout(() => finish(false), idleMs);
+container.scrollBy(0, Math.max(container.clientHeight * 0.8, 200));
+"""
+
+
+class ScrollLoader:
+    """
+    Loads an infinite-scroll job list by scrolling the list's own container
+    (not document.body) and stops as soon as the list is complete.
+
+    The list counts as complete when the number of loaded cards reaches
+    `expected` (a fixed number, or the count of `expected_selector` nodes, e.g.
+    LinkedIn's occludable placeholders), or when the container is at the bottom
+    and no new cards appeared within idle_ms.
+    """
+
+    def __init__(self, driver, card_selector, container_selector=None, expected=None,
+                 expected_selector=None, idle_ms=1500, max_iterations=60):
+        self.driver = driver
+        self.card_selector = card_selector
+        self.container_selector = container_selector
+        self.expected = expected
+        self.expected_selector = expected_selector
+        self.idle_ms = idle_ms
+        self.max_iterations = max_iterations
+
+    def load(self):
+        """
+        Scroll until the list is complete.
+        Returns {"cards", "expected", "iterations", "seconds", "complete"}.
+        The driver's async-script timeout is restored afterwards, since the driver is shared.
+        """
+        previous_timeout = self.driver.timeouts.script
+        self.driver.set_script_timeout(self.idle_ms / 1000 + 5)
+        try:
+            return self._scroll()
+        finally:
+            self.driver.set_script_timeout(previous_timeout)
+
+    def _scroll(self):
+        start = time.perf_counter()
+        iterations = 0
+        state = {"count": 0, "expected": None}
+        expected = self.expected
+        complete = False
+
+        while iterations < self.max_iterations:
+            iterations += 1
+            state = self.driver.execute_async_script(
+                SCROLL_STEP_SCRIPT, self.card_selector, self.container_selector,
+                self.expected, self.expected_selector, self.idle_ms,
+            )
+            expected = state["expected"]
+            if expected and state["count"] >= expected:
+                complete = True
+                break
+            if not state["appeared"] and state["atBottom"]:
+                complete = expected is None
+                break
+
+        return {
+            "cards": state["count"],
+            "expected": expected,
+            "iterations": iterations,
+            "seconds": time.perf_counter() - start,
+            "complete": complete,
+        }
@@ -1,5 +1,8 @@
 import json
 import os
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 class SessionManager:
     """
@@ -52,3 +55,35 @@ class SessionManager:
                 continue
         driver.refresh()
         return True
+
+    def build_http_session(self, platform_name, driver=None, pool_size=8):
+        """
+        Returns a pooled requests.Session carrying the browser's cookies and user agent.
+        Uses the live driver when given, otherwise the saved cookies file.
+        """
+        if driver is not None:
+            cookies = driver.get_cookies()
+            user_agent = driver.execute_script("return navigator.userAgent;")
+        else:
+            cookies_path = self.get_cookie_path(platform_name)
+            if not os.path.exists(cookies_path):
+                raise FileNotFoundError(f"No saved cookies for {platform_name}: {cookies_path}")
+            with open(cookies_path, "r") as f:
+                cookies = json.load(f)
+            user_agent = None
+
+        session = requests.Session()
+        retry = Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504])
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+
+        for cookie in cookies:
+            session.cookies.set(
+                cookie["name"], cookie["value"],
+                domain=cookie.get("domain"), path=cookie.get("path", "/"),
+            )
+        if user_agent:
+            session.headers["User-Agent"] = user_agent
+        session.headers["Accept-Language"] = "en-US,en;q=0.9"
+        return session
@@ -0,0 +1,34 @@
+import re
+
+
+class TitleMatcher:
+    """
+    Matches scraped job titles against the enabled titles of the config.
+
+    A card's title is enabled when any enabled config title occurs in it
+    (case-insensitive substring, as before). The enabled titles are compiled
+    once into a single alternation regex, so a match is one scan of the card
+    title no matter how many disabled titles the config has collected.
+
+        matcher = TitleMatcher(config_manager.get_titles_dict())
+        matcher.matches("Senior Python Developer")
+    """
+
+    def __init__(self, titles, version=None):
+        self.version = version
+        enabled = {t.lower() for t, on in titles.items() if on}
+        self.enabled = frozenset(enabled)
+        # Longest first so the alternation prefers the most specific title
+        alternatives = sorted((t for t in enabled if t), key=len, reverse=True)
+        self.pattern = re.compile("|".join(map(re.escape, alternatives))) if alternatives else None
+        self.match_all = "" in enabled  # an enabled empty title is a substring of everything
+
+    def matches(self, title):
+        if self.match_all:
+            return True
+        if self.pattern is None or not title:
+            return False
+        return self.pattern.search(title.lower()) is not None
+
+    def __len__(self):
+        return len(self.enabled)
@@ -0,0 +1,128 @@
+import time
+from collections import deque
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
+
+
+class WaitManager:
+    """
+    Condition-driven waits shared by all scrapers and agents.
+
+    Every wait blocks only until its DOM condition holds (element present, node
+    count changed, network idle, element stale, ...). Timeouts start from the
+    per-site defaults below and tighten towards the observed latencies of the
+    run, so a fast site stops paying for worst-case timeouts.
+    """
+
+    # Seconds. "default" fills in anything a site does not override.
+    SITE_TIMEOUTS = {
+        "default": {"page": 20, "element": 10, "change": 8, "network_idle": 10, "staleness": 10},
+        "linkedin": {"page": 15, "element": 10, "change": 6, "network_idle": 8, "staleness": 8},
+        "naukri": {"page": 20, "element": 12, "change": 8, "network_idle": 10, "staleness": 10},
+    }
+
+    MIN_TIMEOUT = 1.0      # never tighten below this
+    SAFETY_FACTOR = 3.0    # timeout = p95 of observed latencies * factor
+    HISTORY = 50           # latencies kept per wait kind
+
+    def __init__(self, driver, site="default", overrides=None, poll_frequency=0.2):
+        self.driver = driver
+        self.site = site
+        self.poll_frequency = poll_frequency
+
+        self.base_timeouts = dict(self.SITE_TIMEOUTS["default"])
+        self.base_timeouts.update(self.SITE_TIMEOUTS.get(site, {}))
+        self.base_timeouts.update(overrides or {})
+
+        self.latencies = {kind: deque(maxlen=self.HISTORY) for kind in self.base_timeouts}
+
+    # ---------------- Adaptive Timeouts ----------------
+    def timeout_for(self, kind):
+        """Current timeout for a wait kind: p95 of observed latencies with headroom, capped at the site default."""
+        base = self.base_timeouts[kind]
+        observed = self.latencies[kind]
+        if len(observed) < 5:
+            return base
+        p95 = sorted(observed)[int(len(observed) * 0.95) - 1]
+        return min(base, max(self.MIN_TIMEOUT, p95 * self.SAFETY_FACTOR))
+
+    def until(self, condition, kind="element", timeout=None):
+        """
+        Wait until condition(driver) is truthy and return its value.
+        Raises TimeoutException like WebDriverWait; a timeout is recorded as a
+        full-base-timeout observation so the next waits relax again.
+        """
+        timeout = timeout or self.timeout_for(kind)
+        start = time.perf_counter()
+        try:
+            result = WebDriverWait(self.driver, timeout, poll_frequency=self.poll_frequency).until(condition)
+        except TimeoutException:
+            self.latencies[kind].append(self.base_timeouts[kind])
+            raise
+        self.latencies[kind].append(time.perf_counter() - start)
+        return result
+
+    def stats(self):
+        """{kind: (samples, current timeout)} for logging."""
+        return {kind: (len(self.latencies[kind]), round(self.timeout_for(kind), 2)) for kind in self.base_timeouts}
+
+    # ---------------- Conditions ----------------
+    def for_page_ready(self):
+        """Wait for document.readyState == 'complete'."""
+        return self.until(
+            lambda d: d.execute_script("return document.readyState") == "complete", kind="page"
+        )
+
+    def for_element(self, selector, kind="element"):
+        """Wait for a CSS selector to be present and return the element."""
+        return self.until(EC.presence_of_element_located((By.CSS_SELECTOR, selector)), kind=kind)
+
+    def for_url(self, predicate):
+        """Wait until predicate(current_url) is true."""
+        return self.until(lambda d: predicate(d.current_url), kind="page")
+
+    def for_staleness(self, element):
+        """Wait for an element to be detached (page or list re-rendered)."""
+        return self.until(EC.staleness_of(element), kind="staleness")
+
+    def for_change(self, getter, previous):
+        """
+        Wait until getter(driver) returns something other than previous; returns the new value.
+        Returns previous unchanged (instead of raising) when nothing changes in time,
+        since "nothing more loaded" is an expected outcome for scroll-style waits.
+        """
+        state = {"value": previous}
+
+        def changed(d):
+            state["value"] = getter(d)
+            return state["value"] != previous
+
+        try:
+            self.until(changed, kind="change")
+        except TimeoutException:
+            pass
+        return state["value"]
+
+    def for_count_change(self, selector, previous_count):
+        """Wait for the number of nodes matching selector to change; returns the new count."""
+        script = "return document.querySelectorAll(arguments[0]).length;"
+        return self.for_change(lambda d: d.execute_script(script, selector), previous_count)
+
+    def for_network_idle(self, idle_ms=500):
+        """
+        Wait until no new resource requests have started for idle_ms.
+        Uses the Resource Timing buffer, so it sees XHR/fetch as well as images and scripts.
+        """
+        state = {"count": -1, "since": time.perf_counter()}
+
+        def idle(d):
+            count = d.execute_script("return performance.getEntriesByType('resource').length;")
+            now = time.perf_counter()
+            if count != state["count"]:
+                state["count"], state["since"] = count, now
+                return False
+            return (now - state["since"]) * 1000 >= idle_ms
+
+        return self.until(idle, kind="network_idle")
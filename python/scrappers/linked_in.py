@@ -1,22 +1,185 @@
 import os
-import time
 import re
 from urllib.parse import quote
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import (
+    TimeoutException, NoSuchElementException, StaleElementReferenceException, JavascriptException,
+    WebDriverException,
+)
 
 from managers.driver_manager import DriverManager
 from managers.config_manager import ConfigManager
 from managers.result_manager import ResultManager
+from managers.session_manager import SessionManager
+from managers.wait_manager import WaitManager
+from managers.pacing_manager import PacingManager
+from managers.scroll_manager import ScrollLoader
+from scrappers.linked_in_details import LinkedInDetailFetcher
 import hashlib
 
+# WebDriverExceptions that concern one job card; any other one means the browser session is gone
+CARD_ERRORS = (TimeoutException, NoSuchElementException, StaleElementReferenceException, JavascriptException)
+
+
+# ---------------- In-page Extraction ----------------
+# One script call per detail pane instead of ~10 find_element/.text round trips.
+# arguments[0] is the job card element (used for the footer, which lives on the card).
+JOB_DETAILS_SCRIPT = """
+const card = arguments[0];
+const text = (selector) => {
+    const el = document.querySelector(selector);
+    return el ? el.innerText.trim() : null;
+};
+const easyApplyButton = document.querySelector(".jobs-apply-button--top-card button");
+const jobTypeButtons = document.querySelectorAll(".job-details-fit-level-preferences button");
+const externalApply = document.querySelector("a[data-control-name='jobdetails_topcard_inapply']");
+const footer = card
+    ? Array.from(card.querySelectorAll(".job-card-list__footer-wrapper li"))
+        .map((li) => li.innerText.trim())
+        .filter(Boolean)
+    : [];
+return {
+    title: text(".job-details-jobs-unified-top-card__job-title h1"),
+    company: text(".job-details-jobs-unified-top-card__company-name"),
+    primary_description: text(".job-details-jobs-unified-top-card__primary-description-container"),
+    footer: footer,
+    easy_apply_text: easyApplyButton ? easyApplyButton.innerText : null,
+    job_type: jobTypeButtons.length > 1 ? jobTypeButtons[1].innerText.trim() : null,
+    description: text(".jobs-description__container"),
+    salary: text(".jobs-unified-top-card__salary-info, .salary-compensation__text"),
+    apply_link: externalApply ? externalApply.href : null,
+    url: window.location.href
+};
+"""
+
+# Returns the job IDs of all cards in one call.
+JOB_CARD_IDS_SCRIPT = "return arguments[0].map((card) => card.getAttribute('data-occludable-job-id'));"
+
+# Returns [{id, footer}] for all cards in one call (HTTP detail mode needs nothing else from the page).
+JOB_CARD_SUMMARY_SCRIPT = """
+return arguments[0].map((card) => ({
+    id: card.getAttribute("data-occludable-job-id"),
+    footer: Array.from(card.querySelectorAll(".job-card-list__footer-wrapper li"))
+        .map((li) => li.innerText.trim())
+        .filter(Boolean)
+}));
+"""
+
+# Clicks the card link in-page; returns false when the card has no link.
+CLICK_JOB_CARD_SCRIPT = """
+const link = arguments[0].querySelector("a.job-card-container__link");
+if (!link) return false;
+link.click();
+return true;
+"""
+
+
+def read_job_details_script(driver, card):
+    """Read the open detail pane with a single injected script call."""
+    return driver.execute_script(JOB_DETAILS_SCRIPT, card) or {}
+
+
+def read_job_details_webdriver(driver, card):
+    """Read the open detail pane field by field (one WebDriver round trip per lookup)."""
+    def text(selector):
+        try:
+            return driver.find_element(By.CSS_SELECTOR, selector).text.strip()
+        except:
+            return None
+
+    try:
+        footer = [elem.text.strip() for elem in card.find_elements(By.CSS_SELECTOR, ".job-card-list__footer-wrapper li")]
+        footer = [f for f in footer if f]
+    except:
+        footer = None
+
+    try:
+        easy_apply_button = driver.find_elements(By.CSS_SELECTOR, ".jobs-apply-button--top-card button")
+        easy_apply_text = easy_apply_button[0].text if easy_apply_button else None
+    except:
+        easy_apply_text = None
+
+    try:
+        external_btn = driver.find_element(By.CSS_SELECTOR, "a[data-control-name='jobdetails_topcard_inapply']")
+        apply_link = external_btn.get_attribute("href")
+    except:
+        apply_link = None
+
+    try:
+        job_type_buttons = driver.find_elements(By.CSS_SELECTOR, ".job-details-fit-level-preferences button")
+        job_type = job_type_buttons[1].text.strip() if len(job_type_buttons) > 1 else None
+    except:
+        job_type = None
+
+    return {
+        "title": text(".job-details-jobs-unified-top-card__job-title h1"),
+        "company": text(".job-details-jobs-unified-top-card__company-name"),
+        "primary_description": text(".job-details-jobs-unified-top-card__primary-description-container"),
+        "footer": footer,
+        "easy_apply_text": easy_apply_text,
+        "job_type": job_type,
+        "description": text(".jobs-description__container"),
+        "salary": text(".jobs-unified-top-card__salary-info, .salary-compensation__text"),
+        "apply_link": apply_link,
+        "url": driver.current_url,
+    }
+
+
+def parse_job_details(raw):
+    """
+    Turn the raw detail-pane payload into the normalized job fields.
+    Pure Python: no WebDriver calls happen here.
+    """
+    title = (raw.get("title") or "").strip() or "N/A"
+    company = (raw.get("company") or "").strip() or "N/A"
+
+    primary = raw.get("primary_description")
+    loc = primary.split("·")[0].strip() if primary else "N/A"
+
+    footer_items = raw.get("footer")
+    footer = " | ".join(footer_items) if footer_items is not None else "N/A"
+
+    easy_apply_text = raw.get("easy_apply_text")
+    easy_apply = "Yes" if easy_apply_text and "Easy Apply" in easy_apply_text else "No"
+
+    apply_link = "N/A"
+    if easy_apply == "No":
+        apply_link = raw.get("apply_link") or "N/A"
+
+    job_type = raw.get("job_type") or "N/A"
+    description = (raw.get("description") or "").strip() or "N/A"
+
+    experience = "N/A"
+    exp_match = re.search(r'(\d+)\+?\s*(?:year|yr)[s]?', description, re.IGNORECASE)
+    if exp_match:
+        experience = exp_match.group(1) + " years"
+
+    salary = (raw.get("salary") or "").strip() or "N/A"
+    if salary == "N/A":
+        sal_match = re.search(r'(\₹?\$?\d[\d,\.]+\s*(?:per\s*(month|year)|/year|/month)?)', description, re.IGNORECASE)
+        if sal_match:
+            salary = sal_match.group(1)
+
+    return {
+        "title": title,
+        "company": company,
+        "location": loc,
+        "footer": footer,
+        "easy_apply": easy_apply,
+        "job_type": job_type,
+        "description": description,
+        "experience": experience,
+        "salary": salary,
+        "apply_link": apply_link,
+        "job_url": raw.get("url") or "N/A",
+    }
 
 class LinkedInScraper:
-    def __init__(self):
+    def __init__(self, config_manager=None, driver_pool=None, result_manager=None):
         # --- Config ---
         self.platform = "linkedin"
-        self.config_manager = ConfigManager(self.platform)
+        self.config_manager = config_manager or ConfigManager(self.platform)
         self.config = self.config_manager.config
         self.platform_config = self.config_manager.get_platform_config(self.platform)
 
@@ -34,6 +197,13 @@ class LinkedInScraper:
         }
         self.f_TPR = last_posted_map.get(self.last_posted, "")
 
+        # "script" reads each detail pane in one injected call, "webdriver" field by field,
+        # "http" only collects job IDs in the browser and fetches the details over HTTP
+        self.detail_mode = self.platform_config.get("detail_mode", "script")
+        self.detail_workers = self.platform_config.get("detail_workers", 8)
+        # Where detail pages are fetched from in "http" mode (e.g. a local stub serving recorded pages)
+        self.detail_base_url = self.platform_config.get("detail_base_url", "https://www.linkedin.com")
+
         # --- Chrome profiles ---
         self.user_data_dir = os.path.expanduser("~/Library/Application Support/Google/Chrome")
         self.profiles = ["Default", "Profile 1", "Profile 2", "Profile 3", "Profile 4"]  # fallback
@@ -41,11 +211,17 @@ class LinkedInScraper:
 
         # --- Managers ---
         self.driver_manager = None
-        self.result_manager = ResultManager()
+        self.driver_pool = driver_pool  # optional DriverPool shared with later pipeline stages
+        self.result_manager = result_manager or ResultManager()  # shared by crawler workers
+        self.session_manager = SessionManager()
+        self.sink = None  # ResultSink while run() is streaming
+        self.pacing = PacingManager.from_config(self.platform_config)
+        self.detail_fetcher = None
 
         # Selenium driver and wait
         self.driver = None
         self.wait = None
+        self.waits = None
 
     # ---------------- Profile Selection ----------------
     def select_profile(self):
@@ -63,12 +239,17 @@ class LinkedInScraper:
 
     # ---------------- Setup Driver ----------------
     def setup_driver(self):
-        self.driver_manager = DriverManager(
-            user_data_dir=self.user_data_dir,
-            profile_name=self.selected_profile,
-        )
-        # self.driver_manager = DriverManager()
-        self.driver, self.wait = self.driver_manager.get_driver()
+        if self.driver_pool:
+            self.driver_manager = self.driver_pool.checkout()
+            self.driver, self.wait = self.driver_manager.driver, self.driver_manager.wait
+        else:
+            self.driver_manager = DriverManager(
+                user_data_dir=self.user_data_dir,
+                profile_name=self.selected_profile,
+            )
+            # self.driver_manager = DriverManager()
+            self.driver, self.wait = self.driver_manager.get_driver()
+        self.waits = WaitManager(self.driver, self.platform, self.platform_config.get("timeouts"))
 
     # ---------------- Ensure LinkedIn Tab ----------------
     def ensure_linkedin_tab(self):
@@ -89,7 +270,14 @@ class LinkedInScraper:
     def login(self):
         # Navigate to homepage first
         self.driver.get("https://www.linkedin.com/login")
-        time.sleep(3)
+        # Either the cookie redirect lands on feed/jobs or the login form renders
+        try:
+            self.waits.until(
+                lambda d: "feed" in d.current_url or "jobs" in d.current_url or d.find_elements(By.ID, "username"),
+                kind="page",
+            )
+        except TimeoutException:
+            pass
 
         # Chrome profile cookies may auto-login
         current_url = self.driver.current_url
@@ -121,13 +309,13 @@ class LinkedInScraper:
             return []
 
         search_keywords = " OR ".join(enabled_titles)
-        search_url = f"https://www.linkedin.com/jobs/search/?keywords={quote(search_keywords)}&location={quote(self.location)}"
-        if self.f_TPR:
-            search_url += f"&f_TPR={self.f_TPR}"
+        search_url = self.build_search_url(search_keywords, self.location)
 
         self.driver.get(search_url)
-
-        time.sleep(5)
+        try:
+            self.waits.for_element("li[data-occludable-job-id]", kind="page")
+        except TimeoutException:
+            print("⚠️ Job list did not load in time.")
         print(f"🔍 Searching jobs for '{', '.join(enabled_titles)}' in '{self.location}' with filter '{self.last_posted}'...")
 
         results = []
@@ -135,136 +323,20 @@ class LinkedInScraper:
         page = 1
 
         while len(results) < 100 and page <= 1:
-            time.sleep(3)
-            prev_height = self.driver.execute_script("return document.body.scrollHeight")
-            while True:
-                self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(2)
-                new_height = self.driver.execute_script("return document.body.scrollHeight")
-                if new_height == prev_height:
-                    break
-                prev_height = new_height
-
-            try:
-                job_cards = self.driver.find_elements(By.CSS_SELECTOR, "li[data-occludable-job-id]")
-            except:
-                print("⚠️ No job cards found on this page.")
+            self.pacing.pause()
+            if not self._scrape_current_page(processed_jobs, results, limit=100):
                 break
 
-            for card in job_cards:
-                if len(results) >= 100:
-                    break
-                try:
-                    job_id = card.get_attribute("data-occludable-job-id")
-                    if job_id in processed_jobs:
-                        continue
-                    processed_jobs.add(job_id)
-                except:
-                    continue
-
-                try:
-                    link = card.find_element(By.CSS_SELECTOR, "a.job-card-container__link")
-                    self.driver.execute_script("arguments[0].click();", link)
-                    time.sleep(2)
-                    self.wait.until(lambda d: d.find_element(By.CSS_SELECTOR, ".jobs-description__container"))
-                except:
-                    continue
-
-                # ---------------- Extract Job Data ----------------
-                try:
-                    title = self.driver.find_element(By.CSS_SELECTOR, ".job-details-jobs-unified-top-card__job-title h1").text.strip()
-                except:
-                    title = "N/A"
-
-                matched = False
-                for known_title in list(self.titles_dict.keys()):
-                    if known_title.lower() in title.lower() and self.titles_dict[known_title]:
-                        matched = True
-                        break
-
-                if not matched:
-                    if title not in self.titles_dict:
-                        print(f"⚠️ New title found: {title}, adding to config as false")
-                        self.titles_dict[title] = False
-                        self.config_manager.save_config()
-                    continue
-
-                try:
-                    company = self.driver.find_element(By.CSS_SELECTOR, ".job-details-jobs-unified-top-card__company-name").text.strip()
-                except:
-                    company = "N/A"
-
-                try:
-                    loc = self.driver.find_element(By.CSS_SELECTOR, ".job-details-jobs-unified-top-card__primary-description-container").text.strip().split("·")[0].strip()
-                except:
-                    loc = "N/A"
-
-                try:
-                    footer_elems = card.find_elements(By.CSS_SELECTOR, ".job-card-list__footer-wrapper li")
-                    footer = " | ".join([elem.text.strip() for elem in footer_elems if elem.text.strip()])
-                except:
-                    footer = "N/A"
-
-                try:
-                    easy_apply_button = self.driver.find_elements(By.CSS_SELECTOR, ".jobs-apply-button--top-card button")
-                    easy_apply = "Yes" if easy_apply_button and "Easy Apply" in easy_apply_button[0].text else "No"
-                except:
-                    easy_apply = "N/A"
-
-                apply_link = "N/A"
-                if easy_apply == "No":
-                    try:
-                        external_btn = self.driver.find_element(By.CSS_SELECTOR, "a[data-control-name='jobdetails_topcard_inapply']")
-                        apply_link = external_btn.get_attribute("href") or "N/A"
-                    except:
-                        apply_link = "N/A"
-
-                try:
-                    job_type_buttons = self.driver.find_elements(By.CSS_SELECTOR, ".job-details-fit-level-preferences button")
-                    job_type = job_type_buttons[1].text.strip() if len(job_type_buttons) > 1 else "N/A"
-                except:
-                    job_type = "N/A"
-
-                try:
-                    description = self.driver.find_element(By.CSS_SELECTOR, ".jobs-description__container").text.strip()
-                except:
-                    description = "N/A"
-
-                experience = "N/A"
-                exp_match = re.search(r'(\d+)\+?\s*(?:year|yr)[s]?', description, re.IGNORECASE)
-                if exp_match:
-                    experience = exp_match.group(1) + " years"
-
-                salary = "N/A"
-                try:
-                    salary_elem = self.driver.find_element(By.CSS_SELECTOR, ".jobs-unified-top-card__salary-info, .salary-compensation__text")
-                    salary = salary_elem.text.strip()
-                except:
-                    sal_match = re.search(r'(\₹?\$?\d[\d,\.]+\s*(?:per\s*(month|year)|/year|/month)?)', description, re.IGNORECASE)
-                    if sal_match:
-                        salary = sal_match.group(1)
-
-                scrap_from = "LINKEDIN"
-
-                job_url = self.driver.current_url
-                company_title_hash = hashlib.md5(f"{company}-{title}".encode("utf-8")).hexdigest()
-
-                print(f"{title} | {company} | {loc} | {footer} | Easy Apply: {easy_apply} | Job Type: {job_type} | "
-                      f"Exp: {experience} | Salary: {salary} | Apply Link: {apply_link} | Job ID: {job_id} | Job URL: {job_url}")
-             
-                results.append([
-                    title, company, loc, footer, easy_apply, job_type,
-                    description, experience, salary, apply_link,
-                    scrap_from, job_id, job_url, company_title_hash
-                ])
             # ---------------- Next Page ----------------
             if len(results) < 100 and page < 20:
                 try:
                     next_button = self.wait.until(lambda d: d.find_element(By.CSS_SELECTOR, f"button[aria-label='Page {page + 1}']"))
+                    first_card = self.driver.find_element(By.CSS_SELECTOR, "li[data-occludable-job-id]")
                     self.driver.execute_script("arguments[0].click();", next_button)
                     page += 1
                     print(f"➡️ Moving to page {page}...")
-                    time.sleep(5)
+                    self.waits.for_staleness(first_card)
+                    self.waits.for_element("li[data-occludable-job-id]", kind="page")
                 except:
                     print("⚠️ No more pages available.")
                     break
@@ -273,6 +345,187 @@ class LinkedInScraper:
 
         return results
 
+    def build_search_url(self, keywords, location, page=1):
+        """Search URL for one results page (LinkedIn pages by 25 via start=)."""
+        search_url = f"https://www.linkedin.com/jobs/search/?keywords={quote(keywords)}&location={quote(location)}"
+        if self.f_TPR:
+            search_url += f"&f_TPR={self.f_TPR}"
+        if page > 1:
+            search_url += f"&start={(page - 1) * 25}"
+        return search_url
+
+    def search_page(self, keywords, location, page, processed_jobs=None, limit=25, results=None):
+        """
+        Scrape a single results page for one query, addressed by URL.
+        Used by LinkedInCrawler, where each (title, location, page) is an independent unit.
+        Rows are appended to `results` as they are emitted, so a caller still has
+        them when the browser dies mid-page.
+        """
+        processed_jobs = processed_jobs if processed_jobs is not None else set()
+        results = results if results is not None else []
+        self.driver.get(self.build_search_url(keywords, location, page))
+        try:
+            self.waits.for_element("li[data-occludable-job-id]", kind="page")
+        except TimeoutException:
+            print(f"⚠️ No job list for '{keywords}' in '{location}' page {page}.")
+            return results
+        self._scrape_current_page(processed_jobs, results, limit)
+        return results
+
+    # ---------------- Detail Collection ----------------
+    def _scrape_current_page(self, processed_jobs, results, limit):
+        """Load every card on the current results page and collect its details; False if no cards."""
+        # Every card has an occludable placeholder up front; a card is loaded once its content renders
+        scroll = ScrollLoader(
+            self.driver,
+            card_selector="li[data-occludable-job-id] .job-card-container",
+            expected_selector="li[data-occludable-job-id]",
+        ).load()
+        print(f"📜 Loaded {scroll['cards']}/{scroll['expected']} job cards in "
+              f"{scroll['iterations']} scrolls ({scroll['seconds']:.1f}s).")
+
+        job_cards = self.driver.find_elements(By.CSS_SELECTOR, "li[data-occludable-job-id]")
+        if not job_cards:
+            print("⚠️ No job cards found on this page.")
+            return False
+
+        if self.detail_mode == "http":
+            self._collect_over_http(job_cards, processed_jobs, results, limit)
+        else:
+            self._collect_by_clicking(job_cards, processed_jobs, results, limit)
+        return True
+
+    def _collect_by_clicking(self, job_cards, processed_jobs, results, limit):
+        """
+        Click each card and read its detail pane in the browser. A card that goes
+        stale or times out is skipped; any other WebDriverException means the browser
+        is gone and propagates, so the crawler requeues the unit on a fresh one.
+        A card counts as processed only once its details were read.
+        """
+        if self.detail_mode == "script":
+            card_ids = self.driver.execute_script(JOB_CARD_IDS_SCRIPT, job_cards)
+        else:
+            card_ids = [None] * len(job_cards)
+
+        for card, job_id in zip(job_cards, card_ids):
+            if len(results) >= limit:
+                break
+            try:
+                if job_id is None:
+                    job_id = card.get_attribute("data-occludable-job-id")
+                if job_id in processed_jobs:
+                    continue
+
+                if self.detail_mode == "script":
+                    if not self.driver.execute_script(CLICK_JOB_CARD_SCRIPT, card):
+                        continue
+                else:
+                    link = card.find_element(By.CSS_SELECTOR, "a.job-card-container__link")
+                    self.driver.execute_script("arguments[0].click();", link)
+                # The detail pane is for this card once currentJobId in the URL points at it
+                self.waits.for_url(lambda url: f"currentJobId={job_id}" in url)
+                self.waits.for_element(".jobs-description__container")
+                self.pacing.pause(scale=0.5)
+            except CARD_ERRORS:
+                continue
+
+            try:
+                if self.detail_mode == "script":
+                    raw = read_job_details_script(self.driver, card)
+                else:
+                    raw = read_job_details_webdriver(self.driver, card)
+            except WebDriverException as e:
+                if not isinstance(e, CARD_ERRORS):
+                    raise
+                print(f"⚠️ Could not read job details for {job_id}: {e.msg}")
+                continue
+            except Exception as e:
+                print(f"⚠️ Could not read job details for {job_id}: {e}")
+                continue
+
+            row = self._build_row(job_id, raw)
+            processed_jobs.add(job_id)
+            if row:
+                self._emit(row, results)
+
+    def _collect_over_http(self, job_cards, processed_jobs, results, limit):
+        """
+        Collect job IDs from the cards, then fetch the detail pages concurrently over
+        HTTP, only as many as are left under limit. A job counts as processed only
+        once its details were fetched, so failed fetches are retried later.
+        """
+        summaries = self.driver.execute_script(JOB_CARD_SUMMARY_SCRIPT, job_cards)
+        footers = {}
+        for summary in summaries:
+            if len(footers) >= limit - len(results):
+                break
+            job_id = summary.get("id")
+            if job_id and job_id not in processed_jobs and job_id not in footers:
+                footers[job_id] = summary.get("footer")
+
+        if not footers:
+            return
+
+        if self.detail_fetcher is None:
+            session = self.session_manager.build_http_session(
+                self.platform, driver=self.driver, pool_size=self.detail_workers
+            )
+            self.detail_fetcher = LinkedInDetailFetcher(
+                session, base_url=self.detail_base_url, max_workers=self.detail_workers
+            )
+
+        details = self.detail_fetcher.fetch(list(footers))
+        print(f"🌐 Fetched {len(details)}/{len(footers)} job details over HTTP.")
+
+        # Keep the on-page card order
+        for job_id, footer in footers.items():
+            if len(results) >= limit:
+                break
+            raw = details.get(job_id)
+            if raw is None:
+                continue
+            raw["footer"] = footer
+            row = self._build_row(job_id, raw)
+            processed_jobs.add(job_id)
+            if row:
+                self._emit(row, results)
+
+    def _build_row(self, job_id, raw):
+        """Parse raw details into a result row; returns None when the title is not enabled."""
+        job = parse_job_details(raw)
+        title = job["title"]
+
+        if not self.config_manager.title_matcher().matches(title):
+            if title not in self.titles_dict:
+                print(f"⚠️ New title found: {title}, adding to config as false")
+                self.config_manager.update_title(title, False)
+                self.config_manager.save_config()
+            return None
+
+        company = job["company"]
+        scrap_from = "LINKEDIN"
+        company_title_hash = hashlib.md5(f"{company}-{title}".encode("utf-8")).hexdigest()
+
+        print(f"{title} | {company} | {job['location']} | {job['footer']} | Easy Apply: {job['easy_apply']} | "
+              f"Job Type: {job['job_type']} | Exp: {job['experience']} | Salary: {job['salary']} | "
+              f"Apply Link: {job['apply_link']} | Job ID: {job_id} | Job URL: {job['job_url']}")
+
+        row = [
+            title, company, job["location"], job["footer"], job["easy_apply"], job["job_type"],
+            job["description"], job["experience"], job["salary"], job["apply_link"],
+            scrap_from, job_id, job["job_url"], company_title_hash
+        ]
+        return row
+
+    def _emit(self, row, results):
+        """Persist a row as soon as it is scraped; with a sink, only its job ID stays in memory."""
+        if self.sink:
+            self.sink.push(row)
+            results.append(row[11])
+        else:
+            self.result_manager.add(row)
+            results.append(row)
+
     # ---------------- Save Results ----------------
     def save_results(self, results):
         self.result_manager.save_to_csv(results)
@@ -281,10 +534,16 @@ class LinkedInScraper:
 
     # ---------------- Run ----------------
     def run(self):
-        self.select_profile()
+        if not self.driver_pool:
+            self.select_profile()  # pooled browsers already have their profile
         self.setup_driver()
-        self.ensure_linkedin_tab()
-        self.login()
-        results = self.search_jobs()
-        if results:
-            self.save_results(results)
+        try:
+            self.ensure_linkedin_tab()
+            self.login()
+            # Rows are flushed to the store/CSV/JSONL while scraping, so there is nothing to save afterwards
+            with self.result_manager.open_sink(**self.platform_config.get("stream", {})) as self.sink:
+                self.search_jobs()
+            self.sink = None
+        finally:
+            if self.driver_pool:
+                self.driver_pool.checkin(self.driver_manager)
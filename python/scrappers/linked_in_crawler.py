@@ -0,0 +1,198 @@
+import os
+import json
+import queue
+import threading
+import time
+from collections import namedtuple
+from selenium.common.exceptions import WebDriverException
+
+from managers.config_manager import ConfigManager
+from managers.result_manager import ResultManager
+from scrappers.linked_in import LinkedInScraper
+
+# One independent piece of crawl work: a single results page of a single query
+CrawlUnit = namedtuple("CrawlUnit", ["title", "location", "page"])
+
+JOB_ID_INDEX = 11  # position of "Job ID" in a LinkedInScraper result row
+
+
+class LinkedInCrawler:
+    """
+    Splits a LinkedIn crawl into (title, location, page) units and runs them on a
+    pool of browsers, one LinkedInScraper (and so one isolated profile copy) per worker.
+
+    Finished units are appended to a JSONL state file as they complete, so an
+    interrupted crawl resumes where it stopped. A worker whose browser dies records
+    the rows it already emitted (without marking the unit done), puts the unit back
+    on the queue and restarts with a fresh browser.
+
+    Workers share one ResultManager, so near-duplicates found by different workers
+    are collapsed and the stored history is loaded once.
+    """
+
+    def __init__(self, workers=3, pages=5, locations=None, min_interval=15.0,
+                 state_path="state/crawl/linkedin.jsonl", profile_name="Default",
+                 max_restarts=3, max_attempts=3):
+        self.platform = "linkedin"
+        self.config_manager = ConfigManager(self.platform)
+        self.platform_config = self.config_manager.get_platform_config(self.platform)
+
+        self.workers = workers
+        self.pages = pages
+        self.locations = locations or [self.platform_config.get("location", "")]
+        self.min_interval = min_interval  # seconds between two units on the same worker
+        self.profile_name = profile_name
+        self.max_restarts = max_restarts
+        self.max_attempts = max_attempts
+
+        self.state_path = state_path
+        os.makedirs(os.path.dirname(self.state_path) or ".", exist_ok=True)
+
+        self.result_manager = ResultManager()
+        self._state_lock = threading.Lock()
+        self._processed_jobs = set()  # shared across workers so cards seen by one are skipped by others
+
+    # ---------------- Planning ----------------
+    def plan_units(self):
+        """Every enabled title x location x page."""
+        titles = [k for k, v in self.config_manager.get_titles_dict().items() if v]
+        return [
+            CrawlUnit(title, location, page)
+            for title in titles
+            for location in self.locations
+            for page in range(1, self.pages + 1)
+        ]
+
+    def _unit_key(self, unit):
+        return f"{unit.title}|{unit.location}|{unit.page}"
+
+    # ---------------- State ----------------
+    def load_state(self):
+        """Returns ({done unit keys}, [rows]) from earlier (possibly interrupted) runs."""
+        done, rows = set(), []
+        if not os.path.exists(self.state_path):
+            return done, rows
+        with open(self.state_path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # torn last line from a crash
+                if not record.get("partial"):
+                    done.add(record["unit"])
+                rows.extend(record["rows"])
+        return done, rows
+
+    def _record_unit(self, unit, rows, partial=False):
+        """Append a unit's rows; a partial record keeps the rows without marking the unit done."""
+        record = {"unit": self._unit_key(unit), "rows": rows}
+        if partial:
+            record["partial"] = True
+        with self._state_lock:
+            with open(self.state_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+
+    def reset_state(self):
+        """Forget progress so the next run starts from scratch."""
+        if os.path.exists(self.state_path):
+            os.remove(self.state_path)
+
+    # ---------------- Workers ----------------
+    def _start_scraper(self):
+        scraper = LinkedInScraper(config_manager=self.config_manager, result_manager=self.result_manager)
+        scraper.selected_profile = self.profile_name
+        scraper.setup_driver()
+        scraper.login()
+        return scraper
+
+    def _worker(self, worker_id, units):
+        restarts = 0
+        scraper = None
+        last_start = 0.0
+
+        while True:
+            try:
+                unit, attempt = units.get_nowait()
+            except queue.Empty:
+                break
+
+            rows = []  # filled as rows are emitted, so a dead browser does not lose them
+            try:
+                if scraper is None:
+                    scraper = self._start_scraper()
+
+                # Per-worker rate limit
+                wait = self.min_interval - (time.monotonic() - last_start)
+                if wait > 0:
+                    time.sleep(wait)
+                last_start = time.monotonic()
+
+                scraper.search_page(unit.title, unit.location, unit.page, self._processed_jobs, results=rows)
+                self._record_unit(unit, rows)
+                print(f"🧵 Worker {worker_id}: {len(rows)} jobs from '{unit.title}' in '{unit.location}' page {unit.page}")
+
+            except WebDriverException as e:
+                # Browser died: hand the unit back and come back with a fresh browser
+                print(f"⚠️ Worker {worker_id} lost its browser on {self._unit_key(unit)}: {e.msg}")
+                if rows:
+                    self._record_unit(unit, rows, partial=True)  # the retry skips these jobs as processed
+                if attempt + 1 < self.max_attempts:
+                    units.put((unit, attempt + 1))
+                if scraper is not None:
+                    try:
+                        scraper.driver_manager.quit()
+                    except Exception:
+                        pass
+                    scraper = None
+                restarts += 1
+                if restarts > self.max_restarts:
+                    print(f"⛔ Worker {worker_id} gave up after {restarts} restarts.")
+                    break
+            except Exception as e:
+                print(f"⚠️ Worker {worker_id} failed on {self._unit_key(unit)}: {e}")
+                if rows:
+                    self._record_unit(unit, rows, partial=True)
+                if attempt + 1 < self.max_attempts:
+                    units.put((unit, attempt + 1))
+
+        if scraper is not None:
+            scraper.driver_manager.quit()
+
+    # ---------------- Run ----------------
+    def run(self):
+        """Crawl every pending unit and return the merged rows, de-duplicated on job ID."""
+        done, previous_rows = self.load_state()
+        pending = [u for u in self.plan_units() if self._unit_key(u) not in done]
+        print(f"🗺️ {len(pending)} crawl units pending ({len(done)} already done), {self.workers} workers.")
+
+        for row in previous_rows:
+            self._processed_jobs.add(row[JOB_ID_INDEX])
+
+        units = queue.Queue()
+        for unit in pending:
+            units.put((unit, 0))
+
+        threads = [
+            threading.Thread(target=self._worker, args=(i + 1, units), daemon=True)
+            for i in range(min(self.workers, len(pending)))
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        if not units.empty():
+            print(f"⚠️ {units.qsize()} units left unfinished; re-run to resume.")
+
+        _, rows = self.load_state()
+        merged = {}
+        for row in rows:
+            merged.setdefault(row[JOB_ID_INDEX], row)
+        results = list(merged.values())
+        print(f"✅ Crawl finished: {len(results)} unique jobs from {len(rows)} scraped rows.")
+        return results
+
+    def save_results(self, results):
+        self.result_manager.save_to_csv(results)
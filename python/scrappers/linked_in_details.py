@@ -0,0 +1,100 @@
+import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from bs4 import BeautifulSoup, Comment
+
+
+class LinkedInDetailFetcher:
+    """
+    Fetches LinkedIn job detail pages over HTTP by job ID and parses them offline.
+
+    The browser only has to collect job IDs; the pages are downloaded concurrently
+    through a pooled requests.Session (see SessionManager.build_http_session), so
+    no card has to be clicked and waited on.
+    """
+
+    DETAIL_PATH = "/jobs-guest/jobs/api/jobPosting/{job_id}"
+
+    def __init__(self, session, base_url="https://www.linkedin.com", max_workers=8, timeout=15):
+        self.session = session
+        self.base_url = base_url.rstrip("/")
+        self.max_workers = max_workers
+        self.timeout = timeout
+
+    def detail_url(self, job_id):
+        return f"{self.base_url}{self.DETAIL_PATH.format(job_id=job_id)}"
+
+    def job_url(self, job_id):
+        return f"{self.base_url}/jobs/view/{job_id}/"
+
+    # ---------------- Fetch ----------------
+    def fetch_html(self, job_id):
+        """Download the raw detail page for one job."""
+        response = self.session.get(self.detail_url(job_id), timeout=self.timeout)
+        response.raise_for_status()
+        return response.text
+
+    def fetch(self, job_ids):
+        """
+        Fetch and parse many jobs concurrently.
+        Returns {job_id: raw details}; jobs that fail to download are left out.
+        """
+        details = {}
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            futures = {pool.submit(self.fetch_html, job_id): job_id for job_id in job_ids}
+            for future in as_completed(futures):
+                job_id = futures[future]
+                try:
+                    details[job_id] = self.parse(future.result(), job_id)
+                except Exception as e:
+                    print(f"⚠️ Could not fetch job {job_id}: {e}")
+        return details
+
+    # ---------------- Parse ----------------
+    def parse(self, html, job_id):
+        """
+        Parse a detail page into the same raw shape the in-page extraction script
+        returns, so scrappers.linked_in.parse_job_details handles both.
+        """
+        soup = BeautifulSoup(html, "html.parser")
+
+        def text(selector):
+            el = soup.select_one(selector)
+            return el.get_text(" ", strip=True) if el else None
+
+        job_type = None
+        for item in soup.select(".description__job-criteria-item"):
+            header = item.select_one(".description__job-criteria-subheader")
+            if header and "employment type" in header.get_text(strip=True).lower():
+                value = item.select_one(".description__job-criteria-text")
+                job_type = value.get_text(strip=True) if value else None
+                break
+
+        description_el = soup.select_one(".show-more-less-html__markup, .description__text")
+        description = description_el.get_text("\n", strip=True) if description_el else None
+
+        return {
+            "title": text(".top-card-layout__title, .topcard__title"),
+            "company": text(".topcard__org-name-link, .topcard__flavor"),
+            "primary_description": text(".topcard__flavor--bullet"),
+            "footer": None,
+            "easy_apply_text": text(".top-card-layout__cta-container"),
+            "job_type": job_type,
+            "description": description,
+            "salary": text(".salary.compensation__salary, .compensation__salary"),
+            "apply_link": self._apply_link(soup),
+            "url": self.job_url(job_id),
+        }
+
+    def _apply_link(self, soup):
+        """External apply URL: an apply anchor, or the commented-out URL inside <code id="applyUrl">."""
+        anchor = soup.select_one("a.apply-button[href], a[data-tracking-control-name*='apply-link'][href]")
+        if anchor:
+            return anchor["href"]
+
+        code = soup.find("code", id="applyUrl")
+        if code:
+            comment = code.find(string=lambda s: isinstance(s, Comment))
+            match = re.search(r'"(https?://[^"]+)"', comment or "")
+            if match:
+                return match.group(1)
+        return None
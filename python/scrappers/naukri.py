@@ -1,4 +1,3 @@
-import time
 import re
 import random
 from urllib.parse import quote
@@ -16,11 +15,16 @@ from selenium.webdriver.chrome.options import Options
 from managers.driver_manager import DriverManager
 from managers.config_manager import ConfigManager
 from managers.result_manager import ResultManager
+from managers.wait_manager import WaitManager
+from managers.pacing_manager import PacingManager
+from managers.scroll_manager import ScrollLoader
 
 from utility.logger import logger
 
 
 class NaukriScraper:
+    HEADERS = ["Job Title", "Company", "Location", "Experience Required", "Salary Mentioned", "Apply Link", "Scrap From", "Job ID"]
+
     def __init__(self):
         self.platform = "naukri"
         self.config_manager = ConfigManager(self.platform)
@@ -30,6 +34,7 @@ class NaukriScraper:
         self.email = self.platform_config.get("email")
         self.password = self.platform_config.get("password")
         self.titles_dict = self.config_manager.get_titles_dict()
+        self.page_size = self.platform_config.get("page_size", 20)  # job cards per results page
 
         # Chrome profile
         self.user_data_dir = "~/Library/Application Support/Google/Chrome"
@@ -39,9 +44,12 @@ class NaukriScraper:
         # Managers
         self.driver_manager = None
         self.result_manager = ResultManager()
+        self.sink = None  # ResultSink while run() is streaming
+        self.pacing = PacingManager.from_config(self.platform_config)
 
         self.driver = None
         self.wait = None
+        self.waits = None
 
       
         logger.info("Initialized NaukriScraper.")
@@ -75,6 +83,7 @@ class NaukriScraper:
             profile_name=self.selected_profile,
         )
         self.driver, self.wait = self.driver_manager.get_driver()
+        self.waits = WaitManager(self.driver, self.platform, self.platform_config.get("timeouts"))
         logger.info("WebDriver initialized successfully.")
 
     # ---------------- Simulate Human Interaction ----------------
@@ -83,7 +92,7 @@ class NaukriScraper:
             actions = ActionChains(self.driver)
             # Move mouse to a random position
             actions.move_by_offset(random.randint(100, 500), random.randint(100, 500)).perform()
-            time.sleep(random.uniform(0.5, 2))
+            self.pacing.pause()
             logger.info("Simulated human interaction (mouse movement).")
         except Exception as e:
             print(f"⚠️ Failed to simulate human interaction: {e}")
@@ -111,7 +120,15 @@ class NaukriScraper:
     def login(self):
         logger.info("Attempting to log in to Naukri.")
         self.driver.get("https://www.naukri.com/nlogin/login")
-        time.sleep(random.uniform(2, 5))  # Allow redirect to load
+        # Allow the cookie redirect to land, or the login form / CAPTCHA to render
+        try:
+            self.waits.until(
+                lambda d: "homepage" in d.current_url or "jobs" in d.current_url
+                or d.find_elements(By.ID, "usernameField") or "challenges.cloudflare.com" in d.page_source,
+                kind="page",
+            )
+        except TimeoutException:
+            logger.warning("Login page did not settle in time.")
     
         # Chrome profile cookies may auto-login
         current_url = self.driver.current_url
@@ -177,7 +194,10 @@ class NaukriScraper:
         search_keywords = "+".join([quote(title.lower()) for title in enabled_titles])
         search_url = f"https://www.naukri.com/{search_keywords}-jobs"
         self.driver.get(search_url)
-        time.sleep(random.uniform(3, 6))
+        try:
+            self.waits.for_element(".srp-jobtuple-wrapper", kind="page")
+        except TimeoutException:
+            logger.warning("Job list did not load in time.")
         logger.info(f"Searching jobs with URL: {search_url}")
 
         print(f"🔍 Searching jobs for '{', '.join(enabled_titles)}'...")
@@ -187,19 +207,13 @@ class NaukriScraper:
         page = 1
 
         while page <= 20 and len(results) < 2:
-            time.sleep(random.uniform(2, 4))
+            self.pacing.pause()
 
             # Scroll to load more jobs
             try:
-                prev_height = self.driver.execute_script("return document.body.scrollHeight")
-                while True:
-                    self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                    time.sleep(random.uniform(1, 3))
-                    new_height = self.driver.execute_script("return document.body.scrollHeight")
-                    if new_height == prev_height:
-                        break
-                    prev_height = new_height
-                logger.info("Scrolled to load all job cards.")
+                scroll = ScrollLoader(self.driver, card_selector=".srp-jobtuple-wrapper", expected=self.page_size).load()
+                print(f"📜 Loaded {scroll['cards']} job cards in {scroll['iterations']} scrolls ({scroll['seconds']:.1f}s).")
+                logger.info(f"Scrolled to load job cards: {scroll}")
             except Exception as e:
                 print(f"⚠️ Error during scrolling: {e}")
                 logger.error(f"Error during scrolling: {e}")
@@ -236,7 +250,14 @@ class NaukriScraper:
                     print(f"{title} | {company} | {loc} | Exp: {experience} | Salary: {salary} | Apply: {apply_link}")
                     logger.info(f"Scraped job: {title} | {company} | {loc}")
 
-                    results.append([title, company, loc, experience, salary, apply_link, scrap_from])
+                    row = [title, company, loc, experience, salary, apply_link, scrap_from, job_id]
+                    # Persisted as soon as it is scraped; with a sink only the job ID stays in memory
+                    if self.sink:
+                        self.sink.push(row, self.HEADERS)
+                        results.append(job_id)
+                    else:
+                        self.result_manager.add(row, self.HEADERS)
+                        results.append(row)
 
                 except Exception as e:
                     print(f"⚠️ Error processing job card: {e}")
@@ -257,11 +278,13 @@ class NaukriScraper:
                     logger.info("No more pages available.")
                     break
 
+                first_card = self.driver.find_element(By.CSS_SELECTOR, ".srp-jobtuple-wrapper")
                 self.driver.execute_script("arguments[0].click();", next_btn)
                 page += 1
                 print(f"➡️ Moving to page {page}...")
                 logger.info(f"Moving to page {page}.")
-                time.sleep(random.uniform(3, 6))
+                self.waits.for_staleness(first_card)
+                self.waits.for_element(".srp-jobtuple-wrapper", kind="page")
 
             except (NoSuchElementException, TimeoutException):
                 print("⚠️ No more pages available.")
@@ -285,21 +308,17 @@ class NaukriScraper:
             return "N/A"
 
     def _is_enabled_title(self, title):
-        matched = False
-        for known_title, enabled in self.titles_dict.items():
-            if known_title.lower() in title.lower() and enabled:
-                matched = True
-                break
+        matched = self.config_manager.title_matcher().matches(title)
         if not matched and title not in self.titles_dict:
             print(f"⚠️ New title found: {title}, adding as false")
             logger.info(f"New title found: {title}, added to config as false")
-            self.titles_dict[title] = False
+            self.config_manager.update_title(title, False)
             self.config_manager.save_config()
         return matched
 
     # ---------------- Save Results ----------------
     def save_results(self, results):
-        self.result_manager.save_to_csv(results)
+        self.result_manager.save_to_csv(results, self.HEADERS)
         self.config_manager.save_config()
         logger.info(f"Saved {len(results)} job listings to CSV.")
 
@@ -309,9 +328,11 @@ class NaukriScraper:
             self.select_profile()
             self.setup_driver()
             self.login()
-            results = self.search_jobs()
-            if results:
-                self.save_results(results)
+            with self.result_manager.open_sink(**self.platform_config.get("stream", {})) as self.sink:
+                results = self.search_jobs()
+            self.sink = None
+            logger.info(f"Streamed {len(results)} job listings to CSV.")
+            self.config_manager.save_config()
         except Exception as e:
             print(f"⛔ Script failed: {e}")
             logger.error(f"Script failed: {e}")
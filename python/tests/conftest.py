@@ -0,0 +1,90 @@
+import os
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import re
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+
+class LLMStub:
+    """
+    Local OpenAI-compatible chat endpoint. Answers single-job prompts with one
+    verdict and batch prompts ([J1], [J2], ...) with an array in reverse order;
+    broken_batches answers batches with text that is not JSON, rate_limit_every
+    answers every n-th request with a 429.
+    """
+
+    def __init__(self):
+        self.requests = 0
+        self.broken_batches = False
+        self.rate_limit_every = 0
+        self._lock = threading.Lock()
+
+    def verdict(self, label=None):
+        verdict = {
+            "Skills Matched": ["python"], "Job Description Matched": "yes", "Work Experience Matched": "yes",
+            "Reasoning": "stub", "Final Opinion": 7,
+        }
+        return dict(verdict, Job=label) if label else verdict
+
+    def answer(self, prompt):
+        labels = re.findall(r"^\[(J\d+)\]$", prompt, re.M)
+        if not labels:
+            return json.dumps(self.verdict())
+        if self.broken_batches:
+            return "Sorry, here are the verdicts: J1 looks good."
+        return json.dumps([self.verdict(label) for label in reversed(labels)])
+
+
+@pytest.fixture
+def llm_stub():
+    stub = LLMStub()
+
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
+
+        def _send(self, status, payload):
+            data = json.dumps(payload).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def do_POST(self):
+            body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            with stub._lock:
+                stub.requests += 1
+                limited = stub.rate_limit_every and stub.requests % stub.rate_limit_every == 0
+            if limited:
+                self._send(429, {"error": {"message": "slow down"}})
+                return
+            content = stub.answer(body["messages"][0]["content"])
+            self._send(200, {
+                "id": "stub", "object": "chat.completion", "created": 0, "model": body["model"],
+                "choices": [{"index": 0, "finish_reason": "stop", "message": {"role": "assistant", "content": content}}],
+            })
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    stub.base_url = f"http://127.0.0.1:{server.server_address[1]}/v1"
+    yield stub
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def linkedin_config(tmp_path, monkeypatch):
+    """A scratch config.json (CONFIG_PATH) with one enabled title; state files go under tmp_path."""
+    config = {"linkedin": {"location": "India", "pacing": {"enabled": False}}, "titles": {"Backend Engineer": True}}
+    path = tmp_path / "config.json"
+    path.write_text(json.dumps(config))
+    monkeypatch.setenv("CONFIG_PATH", str(path))
+    monkeypatch.chdir(tmp_path)
+    return config
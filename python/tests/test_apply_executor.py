@@ -0,0 +1,164 @@
+import time
+
+import pandas as pd
+import pytest
+from selenium.common.exceptions import TimeoutException, WebDriverException
+
+from ai_agents.LinkedIn.easy_apply_agent.apply_executor import ApplyExecutor, HourlyBudget
+from ai_agents.LinkedIn.easy_apply_agent.easy_apply_agent import LinkedInAutoApply
+from managers.apply_ledger import ApplyLedger
+from managers.pacing_manager import PacingManager
+
+
+class FakePool:
+    size = 1
+
+
+class FakeAgent:
+    """Stands in for LinkedInAutoApply: outcomes[job_id] is consumed one per attempt; "dead" kills the browser."""
+
+    def __init__(self, outcomes, started):
+        self.outcomes = outcomes
+        self.applied_jobs = []
+        self.alive = True
+        self.closed = False
+        started.append(self)
+
+    def apply_job(self, job_id, job_url, row):
+        assert self.alive, "a job was sent to a dead browser"
+        outcome = self.outcomes[job_id].pop(0)
+        if outcome == "dead":
+            self.alive = False
+            raise WebDriverException("chrome not reachable")
+        if outcome == "applied":
+            self.applied_jobs.append({"Job ID": job_id})
+        return outcome
+
+    def browser_alive(self):
+        return self.alive
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    pd.DataFrame({
+        "Job ID": ["1", "2", "3", "4", "5"],
+        "Job URL": [f"https://www.linkedin.com/jobs/view/{n}" for n in range(1, 6)],
+        "Final Opinion": [8, 7, 9, 6, 3],
+    }).to_csv("filtered_jobs.csv", index=False)
+    return tmp_path
+
+
+def executor(monkeypatch, outcomes, started):
+    monkeypatch.setattr(ApplyExecutor, "_start_agent", lambda self: FakeAgent(outcomes, started))
+    return ApplyExecutor("user", "secret", FakePool(), applications_per_hour=100)
+
+
+def test_retries_dead_browsers_and_reruns(workdir, monkeypatch):
+    started = []
+    outcomes = {"1": ["applied"], "2": ["error", "applied"], "3": ["dead", "applied"], "4": ["error"] * 3}
+    run = executor(monkeypatch, outcomes, started)
+    run.run()
+
+    ledger = run.ledger
+    assert {job_id: ledger.outcome(job_id) for job_id in outcomes} == {
+        "1": "applied", "2": "applied", "3": "applied", "4": "error",
+    }
+    assert ledger.conn.execute("SELECT attempts FROM outcomes WHERE job_id = '4'").fetchone()[0] == 3
+    assert len(started) == 2 and all(agent.closed for agent in started)  # one replacement for the dead browser
+    assert sorted(job["Job ID"] for job in run.applied_jobs) == ["1", "2", "3"]
+    assert all(not jobs for jobs in outcomes.values())  # nothing retried past its outcomes
+
+    # A re-run only picks up the job that never succeeded ("5" is rated too low)
+    rerun = executor(monkeypatch, {"4": ["applied"]}, [])
+    assert [job_id for job_id, _, _ in rerun.pending_jobs()] == ["4"]
+
+
+def test_budget_waits_for_the_window(tmp_path):
+    ledger = ApplyLedger(str(tmp_path / "ledger.db"))
+    for job_id in ("1", "2"):
+        ledger.record(job_id, None, "applied")
+    budget = HourlyBudget(ledger, per_hour=3, window=1.5)
+
+    budget.acquire()  # third slot of the window
+    started = time.monotonic()
+    budget.acquire()  # waits until the first two applications leave the window
+    assert time.monotonic() - started >= 1.0
+    budget.release()
+    budget.release()
+
+
+class DyingDriver:
+    """Opens pages until the form breaks, then answers nothing."""
+
+    def __init__(self):
+        self.alive = True
+
+    def get(self, url):
+        pass
+
+    @property
+    def current_url(self):
+        if not self.alive:
+            raise WebDriverException("invalid session id")
+        return "https://www.linkedin.com/jobs/view/1"
+
+
+class EasyApplyButton:
+    text = "Easy Apply"
+
+    def click(self):
+        pass
+
+
+class Waits:
+    def for_element(self, selector, kind="element"):
+        return EasyApplyButton()
+
+
+@pytest.mark.parametrize("alive, expected", [(True, "error"), (False, WebDriverException)])
+def test_form_error_on_a_dead_browser_raises(alive, expected):
+    agent = LinkedInAutoApply.__new__(LinkedInAutoApply)
+    agent.driver, agent.waits, agent.pacing = DyingDriver(), Waits(), PacingManager(enabled=False)
+
+    def broken_form(job_id, job_url=None):
+        agent.driver.alive = alive
+        return "error"  # the form swallows the WebDriver error itself
+
+    agent.handle_easy_apply_form = broken_form
+    if alive:
+        assert agent.apply_job("1", "https://www.linkedin.com/jobs/view/1", {}) == expected
+    else:
+        with pytest.raises(expected):
+            agent.apply_job("1", "https://www.linkedin.com/jobs/view/1", {})
+
+
+class ButtonWaits:
+    def __init__(self, label):
+        self.label = label
+
+    def for_element(self, selector, kind="element"):
+        if self.label is None:
+            raise TimeoutException("slow page")
+        button = EasyApplyButton()
+        button.text = self.label
+        return button
+
+
+def test_slow_page_is_retried_and_external_apply_is_logged(tmp_path, monkeypatch):
+    log_path = tmp_path / "jobs_without_easyapply.csv"
+    monkeypatch.setattr("ai_agents.LinkedIn.easy_apply_agent.easy_apply_agent.NO_EASY_APPLY_CSV", str(log_path))
+    agent = LinkedInAutoApply.__new__(LinkedInAutoApply)
+    agent.driver, agent.pacing = DyingDriver(), PacingManager(enabled=False)
+
+    agent.waits = ButtonWaits(None)
+    assert agent.apply_job("1", "https://www.linkedin.com/jobs/view/1", {"Job ID": "1"}) == "error"
+    assert not log_path.exists()
+
+    agent.waits = ButtonWaits("Apply")
+    for job_id in ("2", "3"):
+        assert agent.apply_job(job_id, f"https://www.linkedin.com/jobs/view/{job_id}", {"Job ID": job_id}) == "no_easy_apply"
+    assert pd.read_csv(log_path, dtype=str)["Job ID"].tolist() == ["2", "3"]
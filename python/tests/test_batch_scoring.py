@@ -0,0 +1,47 @@
+from urllib.parse import urlparse
+
+import pandas as pd
+
+from ai_agents.LinkedIn.filter_job_agent.filter_job_agent import process_jobs, score_in_batches
+from ai_agents.LinkedIn.filter_job_agent.score_cache import ScoreCache
+from ai_agents.LinkedIn.filter_job_agent.scoring_engine import ScoringEngine, TokenBucket
+
+RESUME = "Python developer, five years of Django and PostgreSQL."
+
+
+def tight_rate_limit(stub):
+    # Every request waits on the shared bucket, in the batch pass and in the fallback pass
+    ScoringEngine._buckets[urlparse(stub.base_url).netloc] = TokenBucket(rate=10, capacity=1)
+
+
+def test_broken_batches_fall_back_to_single_jobs(llm_stub):
+    llm_stub.broken_batches = True
+    tight_rate_limit(llm_stub)
+    jobs = {f"job-{i}": (f"Backend Engineer {i}", "Python services " * 20) for i in range(12)}
+
+    verdicts = score_in_batches(RESUME, jobs, max_jobs=4, base_url=llm_stub.base_url, concurrency=4)
+
+    assert set(verdicts) == set(jobs)
+    assert all(v["Final Opinion"] == 7 for v in verdicts.values())
+    assert llm_stub.requests == 3 + 12
+
+
+def test_process_jobs_scores_every_row_with_broken_batches(llm_stub, tmp_path):
+    llm_stub.broken_batches = True
+    llm_stub.rate_limit_every = 5
+    tight_rate_limit(llm_stub)
+    jobs_csv, output_csv = tmp_path / "jobs.csv", tmp_path / "filtered.csv"
+    pd.DataFrame({
+        "Job Title": [f"Backend Engineer {i}" for i in range(10)],
+        "Description": [f"Build Python service number {i}" for i in range(10)],
+    }).to_csv(jobs_csv, index=False)
+
+    process_jobs(
+        RESUME, str(jobs_csv), str(output_csv), cache=ScoreCache(str(tmp_path / "cache.db")),
+        batch_tokens=6000, max_jobs=4, base_url=llm_stub.base_url, concurrency=4,
+    )
+
+    scored = pd.read_csv(output_csv)
+    assert len(scored) == 10
+    assert scored["Final Opinion"].notna().all()
+    assert (scored["Final Opinion"] == 7).all()
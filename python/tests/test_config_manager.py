@@ -0,0 +1,61 @@
+import gc
+import json
+import multiprocessing
+import os
+import weakref
+
+from managers.config_manager import ConfigManager
+
+
+def titles_on_disk():
+    with open(os.environ["CONFIG_PATH"]) as f:
+        return json.load(f)["titles"]
+
+
+def test_many_title_updates_are_written_once(linkedin_config, monkeypatch):
+    writes = []
+    replace = os.replace
+    monkeypatch.setattr("managers.config_manager.os.replace", lambda src, dst: writes.append(dst) or replace(src, dst))
+    manager = ConfigManager("linkedin", flush_interval=60)
+
+    for i in range(200):
+        manager.update_title(f"Title {i}", False)
+        manager.save_config()
+    manager.flush()
+
+    assert len(writes) == 1
+    assert len(titles_on_disk()) == 201  # the configured title plus the 200 new ones
+
+
+def write_titles(prefix):
+    manager = ConfigManager("linkedin", flush_interval=0)
+    for i in range(30):
+        manager.update_title(f"{prefix} {i}", False)
+        manager.save_config()
+
+
+def test_concurrent_writers_keep_each_others_titles(linkedin_config):
+    context = multiprocessing.get_context("fork")
+    writers = [context.Process(target=write_titles, args=(prefix,)) for prefix in ("First", "Second")]
+    for writer in writers:
+        writer.start()
+    for writer in writers:
+        writer.join()
+
+    titles = titles_on_disk()
+    assert all(writer.exitcode == 0 for writer in writers)
+    assert {f"{p} {i}" for p in ("First", "Second") for i in range(30)} <= set(titles)
+    assert titles["Backend Engineer"] is True
+
+
+def test_instances_are_not_kept_alive_for_the_exit_flush(linkedin_config):
+    manager = ConfigManager("linkedin")
+    manager.update_title("Pending Title", False)
+    manager.save_config()
+    ConfigManager.flush_all()
+    assert "Pending Title" in titles_on_disk()
+
+    ref = weakref.ref(manager)
+    del manager
+    gc.collect()
+    assert ref() is None
@@ -0,0 +1,48 @@
+from managers.dedup_manager import DedupIndex
+from managers.job_store import JobStore
+from managers.result_manager import ResultManager
+
+DESCRIPTION = "We are looking for a backend engineer to build Python services on AWS with Postgres and Kafka."
+
+
+def job(job_id, title, company="Acme"):
+    return {"Job Title": title, "Company": company, "Description": DESCRIPTION, "Job ID": job_id}
+
+
+def manager(tmp_path):
+    return ResultManager(csv_path=str(tmp_path / "job_results.csv"), db_path=str(tmp_path / "jobs.db"))
+
+
+def count_hashing(monkeypatch):
+    calls = []
+    prepare = DedupIndex._prepare
+    monkeypatch.setattr(DedupIndex, "_prepare", lambda self, j: calls.append(j) or prepare(self, j))
+    return calls
+
+
+def test_stored_history_is_not_rehashed(tmp_path, monkeypatch):
+    # History stored without signatures (e.g. before dedup): hashed once, on the first load
+    store = JobStore(str(tmp_path / "jobs.db"))
+    store.upsert_many([job("1", "Backend Engineer"), job("2", "Backend Engineer - Remote"), job("3", "Designer", "Other")])
+    store.close()
+    calls = count_hashing(monkeypatch)
+
+    first = manager(tmp_path)
+    assert len(calls) == 3
+    assert [j["Job ID"] for j in first.unique_jobs()] == ["1", "3"]
+    first.save_to_csv([job("4", "Data Analyst", "Third")])
+    assert len(calls) == 4
+
+    calls.clear()
+    second = manager(tmp_path)
+    assert [j["Job ID"] for j in second.unique_jobs()] == ["1", "3", "4"]
+    assert not second.add(job("5", "Sr. Backend Engineer"))  # still caught from the stored signatures
+    assert len(calls) == 1  # only the new row
+
+
+def test_signature_settings_change_rehashes(tmp_path, monkeypatch):
+    manager(tmp_path).save_to_csv([job("1", "Backend Engineer")])
+    monkeypatch.setattr(DedupIndex, "version", property(lambda self: "other-settings"))
+    calls = count_hashing(monkeypatch)
+    manager(tmp_path)
+    assert len(calls) == 1
@@ -0,0 +1,63 @@
+import pytest
+
+from managers import driver_manager
+from managers.driver_manager import DriverManager
+
+
+@pytest.fixture
+def chrome(tmp_path, monkeypatch):
+    """Fake Chrome version probe and webdriver_manager installer; `installs` counts network resolutions."""
+    monkeypatch.chdir(tmp_path)
+    for name in ("CHROMEDRIVER_BIN", "CHROMEDRIVER_OFFLINE", "CHROME_BIN"):
+        monkeypatch.delenv(name, raising=False)
+    state = {"version": "141.0.7390.54", "installs": 0, "online": True}
+
+    class FakeInstaller:
+        def install(self):
+            if not state["online"]:
+                raise ConnectionError("no network")
+            state["installs"] += 1
+            path = tmp_path / f"chromedriver-{state['version']}"
+            path.write_text("")
+            return str(path)
+
+    monkeypatch.setattr(driver_manager, "ChromeDriverManager", FakeInstaller)
+    monkeypatch.setattr(DriverManager, "_chrome_version", lambda self: state["version"])
+    return state
+
+
+def test_driver_is_resolved_once_per_chrome_version(chrome):
+    first = DriverManager()._resolve_driver_path()
+    assert DriverManager()._resolve_driver_path() == first
+    assert chrome["installs"] == 1  # the second launch used the cache
+
+    chrome["version"] = "142.0.7444.10"
+    assert DriverManager()._resolve_driver_path().endswith("chromedriver-142.0.7444.10")
+    assert chrome["installs"] == 2
+
+
+def test_chromedriver_bin_wins(chrome, tmp_path, monkeypatch):
+    binary = tmp_path / "my-chromedriver"
+    binary.write_text("")
+    monkeypatch.setenv("CHROMEDRIVER_BIN", str(binary))
+
+    assert DriverManager()._resolve_driver_path() == str(binary)
+    assert chrome["installs"] == 0
+
+
+def test_offline_mode_uses_the_last_cached_driver(chrome, monkeypatch):
+    monkeypatch.setenv("CHROMEDRIVER_OFFLINE", "1")
+    with pytest.raises(RuntimeError):
+        DriverManager()._resolve_driver_path()  # nothing cached yet
+
+    last = DriverManager(offline=False)._resolve_driver_path()
+    chrome["version"] = "142.0.7444.10"
+    assert DriverManager()._resolve_driver_path() == last
+    assert chrome["installs"] == 1  # never asked webdriver_manager for the new version
+
+
+def test_network_failure_falls_back_to_the_last_driver(chrome):
+    last = DriverManager()._resolve_driver_path()
+    chrome["version"], chrome["online"] = "142.0.7444.10", False
+
+    assert DriverManager()._resolve_driver_path() == last
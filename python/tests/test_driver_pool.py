@@ -0,0 +1,73 @@
+import threading
+import time
+
+import pytest
+
+from managers import driver_manager
+from managers.driver_manager import DriverPool
+
+
+class FakeDriver:
+    window_handles = ["main"]
+
+
+class FakeDriverManager:
+    launched = 0
+    lock = threading.Lock()
+
+    def __init__(self, **kwargs):
+        self.driver = None
+        self.startup_seconds = 0.05
+
+    def get_driver(self):
+        time.sleep(0.05)  # a slow cold start widens any check-then-launch race
+        with FakeDriverManager.lock:
+            FakeDriverManager.launched += 1
+        self.driver = FakeDriver()
+        return self.driver, None
+
+    def quit(self):
+        self.driver = None
+
+
+@pytest.fixture
+def fake_browsers(monkeypatch):
+    FakeDriverManager.launched = 0
+    monkeypatch.setattr(driver_manager, "DriverManager", FakeDriverManager)
+
+
+def test_concurrent_checkouts_never_launch_past_size(fake_browsers):
+    pool = DriverPool(size=2, prelaunch=False)
+    barrier = threading.Barrier(8)
+    errors = []
+
+    def worker():
+        barrier.wait()
+        try:
+            manager = pool.checkout(timeout=5)
+            time.sleep(0.02)
+            pool.checkin(manager, reset=False)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert not errors
+    assert FakeDriverManager.launched == 2
+    assert pool.stats()["browsers"] == 2
+    assert pool.checkouts == 8 and pool.warm_checkouts == 6
+
+
+def test_discarded_browser_frees_a_slot_for_a_waiting_checkout(fake_browsers):
+    pool = DriverPool(size=1)
+    manager = pool.checkout()
+    manager.quit()  # dies while checked out
+    pool.checkin(manager, reset=False)
+
+    replacement = pool.checkout(timeout=5)
+    assert replacement is not manager and replacement.driver is not None
+    assert FakeDriverManager.launched == 2
@@ -0,0 +1,40 @@
+import json
+
+from ai_agents.LinkedIn.easy_apply_agent.easy_apply_agent import LinkedInAutoApply
+from managers.config_manager import ConfigManager
+
+
+class FakeManager:
+    driver = object()
+    wait = None
+
+
+class FakePool:
+    def checkout(self):
+        return FakeManager()
+
+
+def test_agent_waits_and_pacing_follow_the_linkedin_config(linkedin_config, tmp_path):
+    linkedin_config["linkedin"].update(
+        timeouts={"page": 40, "element": 4},
+        pacing={"enabled": True, "min_delay": 0.1, "max_delay": 0.3, "budget": 30},
+    )
+    (tmp_path / "config.json").write_text(json.dumps(linkedin_config))
+
+    agent = LinkedInAutoApply("user", "secret", driver_pool=FakePool(), config_manager=ConfigManager("linkedin"))
+
+    assert agent.waits.site == "linkedin"
+    assert agent.waits.base_timeouts["page"] == 40 and agent.waits.base_timeouts["element"] == 4
+    assert agent.waits.base_timeouts["staleness"] == 8  # LinkedIn default where the config is silent
+    assert (agent.pacing.min_delay, agent.pacing.max_delay, agent.pacing.budget) == (0.1, 0.3, 30)
+
+
+def test_agent_without_a_config_file_uses_defaults(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("CONFIG_PATH", raising=False)
+    monkeypatch.setattr("managers.config_manager.load_dotenv", lambda: None)  # ignore a developer's .env
+
+    agent = LinkedInAutoApply("user", "secret", driver_pool=FakePool())
+
+    assert agent.waits.base_timeouts["page"] == 15
+    assert agent.pacing.enabled and agent.pacing.budget == 120.0
@@ -0,0 +1,40 @@
+from ai_agents.LinkedIn.easy_apply_agent.form_snapshot import FILL_SCRIPT, SNAPSHOT_SCRIPT, FormSnapshot
+
+
+class ScriptDriver:
+    """Records script calls; fill succeeds for field ids it knows."""
+
+    def __init__(self, known=()):
+        self.known = set(known)
+        self.calls = []
+
+    def execute_script(self, script, *args):
+        self.calls.append((script, args))
+        if script == FILL_SCRIPT:
+            return [field_id in self.known for field_id, _ in args[1]]
+        if script == SNAPSHOT_SCRIPT:
+            return {"fields": [], "buttons": {name: None for name in args[1]}}
+        raise AssertionError("unexpected script")
+
+
+def test_fill_applies_every_answer_in_one_call():
+    driver = ScriptDriver(known={"f0", "f2"})
+    snapshot = FormSnapshot(driver)
+
+    assert snapshot.fill("modal", [("f0", "5"), ("f1", "Yes"), ("f2", "Pune")]) == [True, False, True]
+    assert driver.calls == [(FILL_SCRIPT, ("modal", [["f0", "5"], ["f1", "Yes"], ["f2", "Pune"]]))]
+    assert snapshot.fill("modal", []) == []
+    assert len(driver.calls) == 1  # nothing to fill: no round trip
+
+
+def test_take_asks_for_every_navigation_button():
+    driver = ScriptDriver()
+    assert FormSnapshot(driver).take("modal")["buttons"] == {"next": None, "review": None, "submit": None}
+    assert driver.calls == [(SNAPSHOT_SCRIPT, ("modal", FormSnapshot.BUTTONS))]
+
+
+def test_match_option_by_text_or_value_ignoring_case():
+    field = {"options": [{"value": "opt-1", "text": "Yes"}, {"value": "opt-2", "text": "No"}]}
+    assert FormSnapshot.match_option(field, " yes ") == "opt-1"
+    assert FormSnapshot.match_option(field, "OPT-2") == "opt-2"
+    assert FormSnapshot.match_option(field, "Maybe") is None
@@ -0,0 +1,68 @@
+import threading
+import time
+
+import pandas as pd
+import pytest
+
+from managers.job_store import JobStore
+
+
+def job(job_id, title="Backend Engineer", company="Acme"):
+    return {"Job Title": title, "Company": company, "Job ID": job_id}
+
+
+def test_batch_is_not_committed_half_written(tmp_path):
+    store = JobStore(str(tmp_path / "jobs.db"))
+    other = threading.Thread(target=store.upsert, args=(job("99", "Designer", "Other"),))
+
+    def batch():
+        yield job("1")
+        other.start()  # another writer (e.g. the sink's flush thread) commits while the batch is open
+        time.sleep(0.2)
+        raise RuntimeError("scraper failed mid-batch")
+
+    with pytest.raises(RuntimeError):
+        store.upsert_batch(batch())
+    other.join()
+
+    assert [j["Job ID"] for j in JobStore(str(tmp_path / "jobs.db")).all()] == ["99"]
+
+
+def test_cursor_moves_only_when_advanced(tmp_path):
+    store = JobStore(str(tmp_path / "jobs.db"))
+    store.upsert_many([job("1"), job("2", "Designer")])
+
+    jobs, seq = store.read_new("filter")
+    assert [j["Job ID"] for j in jobs] == ["1", "2"]
+    assert [j["Job ID"] for j in store.read_new("filter")[0]] == ["1", "2"]  # not advanced: read again
+    store.advance("filter", seq)
+    store.upsert_many([job("3", "Data Analyst")])
+    assert [j["Job ID"] for j in store.read_new("filter")[0]] == ["3"]
+    assert len(store.read_new("apply")[0]) == 3  # cursors are per stage
+
+
+def test_filter_stage_scores_only_new_jobs(llm_stub, tmp_path):
+    from ai_agents.LinkedIn.filter_job_agent.filter_job_agent import process_jobs
+    from ai_agents.LinkedIn.filter_job_agent.score_cache import ScoreCache
+    from managers.result_manager import ResultManager
+
+    results = ResultManager(csv_path=str(tmp_path / "job_results.csv"), db_path=str(tmp_path / "jobs.db"))
+    output_csv = tmp_path / "filtered_jobs.csv"
+    score = lambda output: process_jobs(
+        "Python developer", None, str(output), cache=ScoreCache(str(tmp_path / "cache.db")),
+        result_manager=results, base_url=llm_stub.base_url, requests_per_minute=600,
+    )
+    results.save_to_csv([dict(job("1"), Description="Python APIs"), dict(job("2", "Designer"), Description="Figma")])
+
+    (tmp_path / "unwritable.csv").mkdir()
+    with pytest.raises(OSError):
+        score(tmp_path / "unwritable.csv")  # scored, but the output cannot be written: the cursor stays put
+    score(output_csv)
+    results.save_to_csv([dict(job("3", "Data Analyst"), Description="SQL reports")])
+    requests = llm_stub.requests
+    score(output_csv)
+
+    assert llm_stub.requests == requests + 1
+    assert pd.read_csv(output_csv, dtype=str)["Job ID"].tolist() == ["1", "2", "3"]
+    score(output_csv)
+    assert llm_stub.requests == requests + 1
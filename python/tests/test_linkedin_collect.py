@@ -0,0 +1,70 @@
+import pytest
+from selenium.common.exceptions import TimeoutException, WebDriverException
+
+from scrappers.linked_in import CLICK_JOB_CARD_SCRIPT, JOB_CARD_IDS_SCRIPT, JOB_DETAILS_SCRIPT, LinkedInScraper
+
+
+class FakeDriver:
+    """Answers the card scripts for job IDs 1..n; dies (or times out) when a given card is clicked."""
+
+    def __init__(self, ids, die_on=None, slow=()):
+        self.ids = ids
+        self.die_on = die_on
+        self.slow = set(slow)
+        self.current = None
+
+    def execute_script(self, script, *args):
+        if script == JOB_CARD_IDS_SCRIPT:
+            return list(self.ids)
+        if script == CLICK_JOB_CARD_SCRIPT:
+            if args[0] == self.die_on:
+                raise WebDriverException("chrome not reachable")
+            self.current = args[0]
+            return True
+        if script == JOB_DETAILS_SCRIPT:
+            return {
+                "title": "Backend Engineer", "company": f"Company {self.current}", "primary_description": "Pune",
+                "description": "Build services", "url": f"https://www.linkedin.com/jobs/view/{self.current}",
+            }
+        raise AssertionError("unexpected script")
+
+
+class FakeWaits:
+    def __init__(self, driver):
+        self.driver = driver
+
+    def for_url(self, predicate):
+        if self.driver.current in self.driver.slow:
+            raise TimeoutException("detail pane did not load")
+
+    def for_element(self, selector, kind="element"):
+        pass
+
+
+def scraper_with(driver):
+    scraper = LinkedInScraper()
+    scraper.driver, scraper.waits = driver, FakeWaits(driver)
+    return scraper
+
+
+def test_dead_browser_propagates_and_leaves_cards_unprocessed(linkedin_config):
+    ids = ["1", "2", "3", "4"]
+    scraper = scraper_with(FakeDriver(ids, die_on="3"))
+    processed, results = set(), []
+
+    with pytest.raises(WebDriverException):
+        scraper._collect_by_clicking(ids, processed, results, limit=25)
+
+    assert processed == {"1", "2"}  # 3 and 4 stay open for the requeued unit
+    assert [row[11] for row in results] == ["1", "2"]
+
+
+def test_card_that_times_out_is_skipped(linkedin_config):
+    ids = ["1", "2", "3"]
+    scraper = scraper_with(FakeDriver(ids, slow=["2"]))
+    processed, results = set(), []
+
+    scraper._collect_by_clicking(ids, processed, results, limit=25)
+
+    assert processed == {"1", "3"}
+    assert [row[11] for row in results] == ["1", "3"]
@@ -0,0 +1,53 @@
+from selenium.common.exceptions import WebDriverException
+
+from scrappers.linked_in import LinkedInScraper
+from scrappers.linked_in_crawler import JOB_ID_INDEX, LinkedInCrawler
+
+
+def row(job_id):
+    values = ["Backend Engineer", f"Company {job_id}"] + [""] * 12
+    values[JOB_ID_INDEX] = job_id
+    return values
+
+
+class DyingScraper:
+    """Emits jobs 1..3 for the unit, but its browser dies after the second one on the first attempt."""
+
+    attempts = 0
+
+    def __init__(self):
+        self.driver_manager = self
+
+    def search_page(self, keywords, location, page, processed_jobs, results):
+        DyingScraper.attempts += 1
+        for job_id in ("1", "2", "3"):
+            if job_id in processed_jobs:
+                continue
+            if DyingScraper.attempts == 1 and job_id == "3":
+                raise WebDriverException("chrome not reachable")
+            processed_jobs.add(job_id)
+            results.append(row(job_id))
+        return results
+
+    def quit(self):
+        pass
+
+
+def test_rows_emitted_before_a_dead_browser_are_kept(linkedin_config, monkeypatch):
+    crawler = LinkedInCrawler(workers=1, pages=1, min_interval=0)
+    monkeypatch.setattr(crawler, "_start_scraper", DyingScraper)
+
+    results = crawler.run()
+
+    assert sorted(r[JOB_ID_INDEX] for r in results) == ["1", "2", "3"]
+    done, _ = crawler.load_state()
+    assert done == {"Backend Engineer|India|1"}
+
+
+def test_workers_share_the_crawlers_result_manager(linkedin_config, monkeypatch):
+    monkeypatch.setattr(LinkedInScraper, "setup_driver", lambda self: None)
+    monkeypatch.setattr(LinkedInScraper, "login", lambda self: None)
+    crawler = LinkedInCrawler(workers=2)
+
+    assert crawler._start_scraper().result_manager is crawler.result_manager
+    assert crawler._start_scraper().result_manager is crawler.result_manager
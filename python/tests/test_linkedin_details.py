@@ -0,0 +1,120 @@
+import os
+import re
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from managers.session_manager import SessionManager
+from scrappers.linked_in import JOB_CARD_SUMMARY_SCRIPT, LinkedInScraper, parse_job_details
+from scrappers.linked_in_details import LinkedInDetailFetcher
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures")
+USER_AGENT = "Mozilla/5.0 (fixture)"
+
+
+@pytest.fixture
+def detail_stub():
+    """Serves tests/fixtures/linkedin_job_<id>.html at the guest jobPosting path; the first hit on each page is a 503."""
+    seen = {"paths": [], "user_agents": set()}
+    failed_once = set()
+
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
+
+        def do_GET(self):
+            seen["paths"].append(self.path)
+            seen["user_agents"].add(self.headers.get("User-Agent"))
+            match = re.fullmatch(r"/jobs-guest/jobs/api/jobPosting/(\d+)", self.path)
+            path = match and os.path.join(FIXTURES, f"linkedin_job_{match.group(1)}.html")
+            if not path or not os.path.exists(path):
+                self.send_response(404)
+                self.end_headers()
+                return
+            if path not in failed_once:
+                failed_once.add(path)
+                self.send_response(503)
+                self.end_headers()
+                return
+            with open(path, "rb") as f:
+                body = f.read()
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    seen["base_url"] = f"http://127.0.0.1:{server.server_address[1]}"
+    yield seen
+    server.shutdown()
+    server.server_close()
+
+
+class CardsDriver:
+    """Just enough of a WebDriver for the HTTP detail mode: card summaries, cookies, user agent."""
+
+    def execute_script(self, script, *args):
+        if script == JOB_CARD_SUMMARY_SCRIPT:
+            return [{"id": job_id, "footer": ["Easy Apply"]} for job_id in args[0]]
+        if "userAgent" in script:
+            return USER_AGENT
+        raise AssertionError("unexpected script")
+
+    def get_cookies(self):
+        return [{"name": "li_at", "value": "token", "domain": ".linkedin.com", "path": "/"}]
+
+
+def test_fetcher_parses_recorded_pages(detail_stub, tmp_path):
+    session = SessionManager(cookies_dir=str(tmp_path)).build_http_session("linkedin", driver=CardsDriver())
+    fetcher = LinkedInDetailFetcher(session, base_url=detail_stub["base_url"], max_workers=4)
+
+    details = fetcher.fetch(["4301000001", "4301000002", "4301000999"])
+
+    assert set(details) == {"4301000001", "4301000002"}  # the unknown job 404s and is left out
+    easy = parse_job_details(details["4301000001"])
+    assert (easy["title"], easy["company"]) == ("Machine Learning Engineer", "Veltris")
+    assert easy["location"] == "Pune, Maharashtra, India"
+    assert (easy["easy_apply"], easy["job_type"], easy["experience"]) == ("Yes", "Full-time", "3 years")
+    external = parse_job_details(details["4301000002"])
+    assert (external["easy_apply"], external["job_type"]) == ("No", "Contract")
+    assert external["apply_link"] == "https://careers.quantiphi.com/jobs/data-scientist-4301000002?source=linkedin"
+    assert external["salary"].startswith("₹18,00,000.00/yr")
+    assert detail_stub["user_agents"] == {USER_AGENT}
+
+
+def test_scraper_fetches_details_from_the_configured_base_url(detail_stub, linkedin_config, tmp_path):
+    linkedin_config["linkedin"].update(detail_mode="http", detail_base_url=detail_stub["base_url"])
+    linkedin_config["titles"].update({"Machine Learning Engineer": True, "Data Scientist": True})
+    (tmp_path / "config.json").write_text(json.dumps(linkedin_config))
+    scraper = LinkedInScraper()
+    scraper.driver = CardsDriver()
+    processed, results = set(), []
+
+    scraper._collect_over_http(["4301000001", "4301000002"], processed, results, limit=25)
+
+    assert [(row[0], row[1], row[11]) for row in results] == [
+        ("Machine Learning Engineer", "Veltris", "4301000001"), ("Data Scientist", "Quantiphi", "4301000002"),
+    ]
+    assert all(path.startswith("/jobs-guest/jobs/api/jobPosting/") for path in detail_stub["paths"])
+
+
+def test_scraper_fetches_only_open_slots_and_keeps_failed_ids(detail_stub, linkedin_config, tmp_path):
+    linkedin_config["linkedin"].update(detail_mode="http", detail_base_url=detail_stub["base_url"])
+    linkedin_config["titles"].update({"Machine Learning Engineer": True, "Data Scientist": True})
+    (tmp_path / "config.json").write_text(json.dumps(linkedin_config))
+    scraper = LinkedInScraper()
+    scraper.driver = CardsDriver()
+    processed, results = set(), []
+
+    # Two slots: 4301000999 (a 404, so not processed) and 4301000001; 4301000002 is not fetched at all
+    scraper._collect_over_http(["4301000999", "4301000001", "4301000002"], processed, results, limit=2)
+    assert processed == {"4301000001"}
+    assert not any(path.endswith("4301000002") for path in detail_stub["paths"])
+
+    scraper._collect_over_http(["4301000999", "4301000001", "4301000002"], processed, results, limit=25)
+    assert [row[11] for row in results] == ["4301000001", "4301000002"]
+    assert processed == {"4301000001", "4301000002"}
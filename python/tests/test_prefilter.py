@@ -0,0 +1,45 @@
+import os
+
+import pandas as pd
+
+from ai_agents.LinkedIn.filter_job_agent.prefilter import PreFilter
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures")
+TITLES = {"Backend Engineer": True, "Sales Executive": False}
+
+
+def labelled():
+    with open(os.path.join(FIXTURES, "prefilter_resume.txt")) as f:
+        resume_text = f.read()
+    jobs_df = pd.read_csv(os.path.join(FIXTURES, "prefilter_labelled_jobs.csv"))
+    return resume_text, jobs_df, jobs_df["Final Opinion"] > 5
+
+
+def precision_recall(keep, positive):
+    true_positives = int((keep & positive).sum())
+    return true_positives / int(keep.sum()), true_positives / int(positive.sum())
+
+
+def test_signals():
+    resume_text, jobs_df, _ = labelled()
+    prefilter = PreFilter(resume_text, titles=TITLES, saturation=5)
+    scores = prefilter.score(jobs_df)
+
+    assert prefilter.years == 4.9
+    assert scores["Skill Overlap"].tolist() == [1, 1, 1, 0, 0, 1, 0, 0]
+    # 12 years required is beyond 4.9 + 2 years of slack; a blank requirement counts as a fit
+    assert scores["Experience Fit"].tolist() == [1, 1, 0, 1, 1, 1, 1, 1]
+    # Enabled title, disabled title, anything else
+    assert scores["Title Match"].tolist() == [1, 0.5, 1, 0, 0.5, 0.5, 0.5, 0.5]
+    assert scores["Prefilter Score"].round(2).tolist() == [1.0, 0.85, 0.8, 0.2, 0.35, 0.85, 0.35, 0.35]
+
+
+def test_threshold_against_labels():
+    resume_text, jobs_df, positive = labelled()
+
+    keep = PreFilter(resume_text, titles=TITLES, saturation=5).select(jobs_df)
+    assert precision_recall(keep, positive) == (0.75, 1.0)  # only the 12-year role slips through
+    keep = PreFilter(resume_text, titles=TITLES, saturation=5, threshold=0.85).select(jobs_df)
+    assert precision_recall(keep, positive) == (1.0, 1.0)
+    keep = PreFilter(resume_text, titles=TITLES, saturation=5, top_k=2).select(jobs_df)
+    assert keep.sum() == 2 and keep[0]
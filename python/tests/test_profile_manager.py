@@ -0,0 +1,175 @@
+import os
+import json
+import tempfile
+
+import pytest
+
+from managers.profile_manager import ProfileSnapshotManager
+
+
+@pytest.fixture
+def profile(tmp_path):
+    """A tiny Chrome user-data-dir: cookies, Local State, a Local Storage leveldb and an untracked cache."""
+    root = tmp_path / "chrome"
+    (root / "Default" / "Network").mkdir(parents=True)
+    (root / "Default" / "Local Storage" / "leveldb").mkdir(parents=True)
+    (root / "Default" / "Cache").mkdir()
+    (root / "Default" / "Network" / "Cookies").write_bytes(b"cookies-v1")
+    (root / "Default" / "Preferences").write_text("{}")
+    (root / "Default" / "Local Storage" / "leveldb" / "000003.log").write_bytes(b"storage")
+    (root / "Default" / "Local Storage" / "leveldb" / "LOCK").write_bytes(b"")
+    (root / "Default" / "Cache" / "data_0").write_bytes(b"x" * 1024)
+    (root / "Local State").write_text('{"os_crypt": {}}')
+    return root
+
+
+@pytest.fixture
+def manager(profile, tmp_path):
+    return ProfileSnapshotManager(str(profile), snapshots_dir=str(tmp_path / "snapshots"))
+
+
+@pytest.fixture
+def hash_calls(manager, monkeypatch):
+    calls = []
+    original = manager._hash_file
+
+    def spy(path):
+        calls.append(os.path.relpath(path, manager.user_data_dir))
+        return original(path)
+
+    monkeypatch.setattr(manager, "_hash_file", spy)
+    return calls
+
+
+def bump_mtime(path, seconds=10):
+    stat = os.stat(path)
+    os.utime(path, (stat.st_atime + seconds, stat.st_mtime + seconds))
+
+
+def test_first_prepare_copies_only_tracked_files(manager):
+    report = manager.prepare()
+
+    snapshot = manager.snapshot_dir
+    assert report["rebuilt"] and report["copied_files"] == 4
+    assert os.path.exists(os.path.join(snapshot, "Default", "Network", "Cookies"))
+    assert os.path.exists(os.path.join(snapshot, "Local State"))
+    assert os.path.exists(os.path.join(snapshot, "Default", "Local Storage", "leveldb", "000003.log"))
+    assert not os.path.exists(os.path.join(snapshot, "Default", "Local Storage", "leveldb", "LOCK"))
+    assert not os.path.exists(os.path.join(snapshot, "Default", "Cache"))
+
+
+def test_unchanged_profile_is_reused_without_hashing(manager, hash_calls):
+    manager.prepare()
+    hash_calls.clear()
+
+    report = manager.prepare()
+
+    assert not report["rebuilt"] and report["copied_files"] == 0
+    assert hash_calls == []  # mtime and size matched, so no file was read
+
+
+def test_touched_but_identical_file_is_hashed_not_copied(manager, profile, hash_calls):
+    manager.prepare()
+    hash_calls.clear()
+    cookies = profile / "Default" / "Network" / "Cookies"
+    bump_mtime(cookies)
+
+    report = manager.prepare()
+
+    assert not report["rebuilt"] and report["copied_files"] == 0
+    assert hash_calls == [os.path.join("Default", "Network", "Cookies")]
+    with open(manager.manifest_path) as f:
+        entry = json.load(f)[os.path.join("Default", "Network", "Cookies")]
+    assert entry["mtime"] == os.stat(cookies).st_mtime  # recorded, so the next run skips the hash
+
+    hash_calls.clear()
+    manager.prepare()
+    assert hash_calls == []
+
+
+def test_changed_file_is_copied_even_at_the_same_size(manager, profile):
+    manager.prepare()
+    cookies = profile / "Default" / "Network" / "Cookies"
+    cookies.write_bytes(b"cookies-v2")
+    bump_mtime(cookies)
+
+    report = manager.prepare()
+
+    assert report["rebuilt"] and report["copied_files"] == 1
+    with open(os.path.join(manager.snapshot_dir, "Default", "Network", "Cookies"), "rb") as f:
+        assert f.read() == b"cookies-v2"
+
+
+def test_deleted_source_is_removed_from_snapshot_and_manifest(manager, profile):
+    manager.prepare()
+    (profile / "Default" / "Local Storage" / "leveldb" / "000003.log").unlink()
+
+    report = manager.prepare()
+
+    rel = os.path.join("Default", "Local Storage", "leveldb", "000003.log")
+    assert report["rebuilt"] and report["copied_files"] == 0
+    assert not os.path.exists(os.path.join(manager.snapshot_dir, rel))
+    with open(manager.manifest_path) as f:
+        assert rel not in json.load(f)
+
+
+def test_missing_snapshot_file_is_copied_again(manager):
+    manager.prepare()
+    os.remove(os.path.join(manager.snapshot_dir, "Local State"))
+
+    report = manager.prepare()
+
+    assert report["copied_files"] == 1
+    assert os.path.exists(os.path.join(manager.snapshot_dir, "Local State"))
+
+
+@pytest.fixture
+def temp_root(tmp_path, monkeypatch):
+    root = tmp_path / "tmp"
+    root.mkdir()
+    monkeypatch.setattr(tempfile, "tempdir", str(root))
+    return root
+
+
+def test_launch_copy_is_seeded_from_snapshot_and_released(manager, temp_root):
+    manager.prepare()
+
+    path, report = manager.launch_copy()
+
+    assert os.path.dirname(path) == str(temp_root)
+    assert os.path.exists(os.path.join(path, "Default", "Network", "Cookies"))
+    assert not os.path.exists(os.path.join(path, "manifest.json"))
+    with open(os.path.join(path, ProfileSnapshotManager.OWNER_FILE)) as f:
+        assert f.read() == str(os.getpid())
+    assert report["bytes"] > 0
+
+    ProfileSnapshotManager.release(path)
+    assert not os.path.exists(path)
+
+
+def make_working_copy(temp_root, name, owner=None, age_hours=0):
+    path = temp_root / (ProfileSnapshotManager.TEMP_PREFIX + name)
+    path.mkdir()
+    if owner is not None:
+        (path / ProfileSnapshotManager.OWNER_FILE).write_text(str(owner))
+    if age_hours:
+        bump_mtime(path, -age_hours * 3600)
+    return path
+
+
+def test_collect_garbage_reaps_dead_owners_and_old_orphans(temp_root, monkeypatch):
+    live_pid, dead_pid = 1111, 2222
+    monkeypatch.setattr("managers.profile_manager.psutil.pid_exists", lambda pid: pid == live_pid)
+    live = make_working_copy(temp_root, "live", owner=live_pid, age_hours=48)
+    dead = make_working_copy(temp_root, "dead", owner=dead_pid)
+    fresh_orphan = make_working_copy(temp_root, "fresh")
+    old_orphan = make_working_copy(temp_root, "old", age_hours=13)
+    unrelated = temp_root / "someone-else"
+    unrelated.mkdir()
+    bump_mtime(unrelated, -48 * 3600)
+
+    removed = ProfileSnapshotManager.collect_garbage(max_age_hours=12)
+
+    assert removed == 2
+    assert live.exists() and fresh_orphan.exists() and unrelated.exists()
+    assert not dead.exists() and not old_orphan.exists()
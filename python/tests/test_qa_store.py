@@ -0,0 +1,60 @@
+import json
+import os
+
+from managers.qa_store import QAStore
+
+SPONSORSHIP = "Will you now or in the future require sponsorship for employment visa status?"
+
+
+def store(tmp_path, answers):
+    qa = QAStore(str(tmp_path / "answers.json"))
+    for question, answer in answers.items():
+        qa.put(question, answer, "choice")
+    return qa
+
+
+def test_reworded_question_matches(tmp_path):
+    qa = store(tmp_path, {SPONSORSHIP: "No"})
+    match = qa.lookup("Will you, now or in future, require visa sponsorship for employment status?")
+    assert match is not None and match.answer == "No"
+
+
+def test_negated_question_does_not_match_the_plain_one(tmp_path):
+    qa = store(tmp_path, {SPONSORSHIP: "Yes"})
+    assert qa.lookup("Will you now or in the future NOT require sponsorship for employment visa status?") is None
+    assert qa.lookup("Won't you now or in the future require sponsorship for employment visa status?") is None
+
+
+def test_negated_questions_match_each_other(tmp_path):
+    qa = store(tmp_path, {"Do you not require sponsorship for employment visa status?": "Yes"})
+    match = qa.lookup("Do you not require visa sponsorship for employment status?")
+    assert match is not None and match.answer == "Yes"
+    assert qa.lookup("Do you require sponsorship for employment visa status?") is None
+
+
+def test_journaled_answers_survive_a_crash_with_a_torn_line(tmp_path):
+    path = str(tmp_path / "answers.json")
+    qa = QAStore(path, compact_every=100)
+    qa.record(SPONSORSHIP, "No", "choice")
+    qa.record("How many years of Python experience do you have?", 4, "number")
+    with open(qa.journal_path, "a") as f:
+        f.write('{"q": "Notice period?", "a": "30 da')  # crash mid-append
+
+    recovered = QAStore(path)
+
+    assert recovered.get(SPONSORSHIP) == "No"
+    assert recovered.lookup("How many years of Python experience do you have?").kind == "number"
+    assert "Notice period?" not in recovered
+    assert os.path.getsize(recovered.journal_path) == 0  # folded into the snapshot on load
+    with open(path) as f:
+        assert json.load(f)[SPONSORSHIP] == {"answer": "No", "type": "choice"}
+
+
+def test_journal_is_compacted_every_compact_every_answers(tmp_path):
+    qa = QAStore(str(tmp_path / "answers.json"), compact_every=3)
+    for i in range(4):
+        qa.record(f"Question {i}?", f"Answer {i}")
+
+    with open(qa.journal_path) as f:
+        assert [json.loads(line)["q"] for line in f] == ["Question 3?"]
+    assert len(QAStore(str(tmp_path / "answers.json"))) == 4
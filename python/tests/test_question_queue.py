@@ -0,0 +1,51 @@
+from managers.qa_store import QAStore
+from managers.question_queue import QuestionQueue
+
+NOTICE = ("Notice period in days?", "number", [])
+RELOCATE = ("Are you willing to relocate?", "choice", [{"value": "Yes", "text": "Yes"}, {"value": "No", "text": "No"}])
+ROW = {"Job ID": "42", "Job Title": "Backend Engineer"}
+
+
+def test_job_is_ready_once_every_question_is_answered(tmp_path):
+    queue = QuestionQueue(str(tmp_path / "pending.db"))
+    queue.park("42", "https://www.linkedin.com/jobs/view/42", ROW, [NOTICE, RELOCATE])
+    assert queue.parked_ids() == {"42"}
+    assert {q["question"] for q in queue.pending_questions()} == {NOTICE[0], RELOCATE[0]}
+
+    queue.answer(NOTICE[0], "30")
+    assert queue.ready_jobs() == []
+    queue.answer(RELOCATE[0], "Yes")
+    assert queue.ready_jobs() == [("42", "https://www.linkedin.com/jobs/view/42", ROW)]
+
+    queue.mark_resumed("42")
+    assert queue.parked_ids() == set()
+    assert queue.ready_jobs() == []
+    assert queue.counts() == {"parked": 0, "resumed": 1, "questions": 0}
+
+
+def test_questions_known_to_the_qa_store_do_not_block(tmp_path):
+    queue = QuestionQueue(str(tmp_path / "pending.db"))
+    qa_store = QAStore(str(tmp_path / "answers.json"))
+    queue.park("42", "https://www.linkedin.com/jobs/view/42", ROW, [NOTICE, RELOCATE])
+    qa_store.record(RELOCATE[0], "No", "choice")
+    known = lambda question, kind, options: qa_store.lookup(question, kind=kind, options=options) is not None
+
+    assert queue.ready_jobs(known) == []
+    qa_store.record(NOTICE[0], "60", "number")
+    assert [job_id for job_id, _, _ in queue.ready_jobs(known)] == ["42"]
+
+
+def test_answer_interactively_records_valid_answers_only(tmp_path, monkeypatch):
+    queue = QuestionQueue(str(tmp_path / "pending.db"))
+    qa_store = QAStore(str(tmp_path / "answers.json"))
+    queue.park("42", "https://www.linkedin.com/jobs/view/42", ROW, [NOTICE, RELOCATE])
+    queue.park("43", "https://www.linkedin.com/jobs/view/43", dict(ROW, **{"Job ID": "43"}), [NOTICE])
+    assert [q["jobs"] for q in queue.pending_questions()] == [2, 1]  # most-blocking first: notice, relocate
+    replies = iter(["thirty", "30", "3", "2"])  # an invalid number, then an option out of range
+    monkeypatch.setattr("builtins.input", lambda prompt: next(replies))
+
+    assert queue.answer_interactively(qa_store) == 2
+
+    assert qa_store.get(NOTICE[0]) == "30"
+    assert qa_store.get(RELOCATE[0]) == "No"
+    assert sorted(job_id for job_id, _, _ in queue.ready_jobs()) == ["42", "43"]
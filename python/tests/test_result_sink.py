@@ -0,0 +1,70 @@
+import csv
+
+from managers.result_manager import ResultManager
+
+
+def job(n, location="Pune"):
+    return {
+        "Job Title": f"Engineer {n}", "Company": f"Company {n}", "Location": location,
+        "Description": f"Role number {n} building services", "Scrap From": "LinkedIn", "Job ID": str(n),
+    }
+
+
+def read_rows(path):
+    with open(path, newline="", encoding="utf-8") as f:
+        return list(csv.reader(f))[1:]
+
+
+def manager(tmp_path):
+    return ResultManager(csv_path=str(tmp_path / "job_results.csv"), db_path=str(tmp_path / "jobs.db"))
+
+
+def test_sink_after_export_does_not_truncate_mid_row(tmp_path):
+    rm = manager(tmp_path)
+    with rm.open_sink(flush_rows=2) as sink:
+        for n in range(5):
+            sink.push(job(n))
+
+    # A batch save rewrites the whole CSV; the old checkpoint offsets no longer apply
+    rm.save_to_csv([job(n) for n in range(5, 9)])
+    with rm.open_sink(flush_rows=2) as sink:
+        sink.push(job(9))
+
+    rows = read_rows(rm.csv_path)
+    assert all(len(row) == len(ResultManager.HEADERS) for row in rows)
+    assert sorted(row[11] for row in rows) == [str(n) for n in range(10)]
+
+
+def test_sink_refuses_to_truncate_a_file_edited_since_the_checkpoint(tmp_path):
+    rm = manager(tmp_path)
+    with rm.open_sink(flush_rows=1) as sink:
+        for n in range(3):
+            sink.push(job(n))
+
+    with open(rm.csv_path, "w", newline="", encoding="utf-8") as f:
+        csv.writer(f).writerow(ResultManager.HEADERS)
+
+    with rm.open_sink() as sink:
+        pass
+    assert sorted(row[11] for row in read_rows(rm.csv_path)) == ["0", "1", "2"]
+
+
+def test_rescraped_rows_reach_the_csv(tmp_path):
+    rm = manager(tmp_path)
+    with rm.open_sink(flush_rows=1) as sink:
+        sink.push(job(1))
+        sink.push(job(1, location="Remote"))
+    assert [row[2] for row in read_rows(rm.csv_path)] == ["Remote"]
+
+
+def test_update_survives_a_crash_before_close(tmp_path):
+    rm = manager(tmp_path)
+    with rm.open_sink(flush_rows=1) as sink:
+        sink.push(job(1))
+
+    crashed = rm.open_sink(flush_rows=1)
+    crashed.push(job(1, location="Remote"))  # flushed, never closed
+
+    with manager(tmp_path).open_sink() as sink:
+        pass
+    assert [row[2] for row in read_rows(rm.csv_path)] == ["Remote"]
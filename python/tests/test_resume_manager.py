@@ -0,0 +1,56 @@
+import fitz
+
+from managers.resume_manager import ResumeManager
+
+RESUME = """Jane Doe
+Backend Engineer
+Experience
+Acme - Software Engineer (Jan 2019 - Dec 2019)
+Globex - Senior Engineer (Jan 2020 - Dec 2021)
+Initech - Software Engineer (Jan 2022 - Dec 2023)
+Skills
+Languages: Python, SQL, C++
+Education
+B.E. Computer Engineering
+"""
+
+
+def resume(tmp_path):
+    pdf_path = tmp_path / "resume.pdf"
+    with fitz.open() as doc:
+        doc.new_page().insert_text((40, 60), RESUME, fontsize=10)
+        doc.save(str(pdf_path))
+    return ResumeManager(str(pdf_path), cache_dir=str(tmp_path / "cache"))
+
+
+def test_roles_keep_title_and_company_together(tmp_path):
+    component = resume(tmp_path).prompt_component()
+    assert "Roles: Software Engineer at Acme, Senior Engineer at Globex, Software Engineer at Initech" in component
+
+
+def test_years_answer_only_for_total_experience(tmp_path):
+    manager = resume(tmp_path)
+    assert manager.answer_for("How many years of work experience do you have?") == "5"
+    assert manager.answer_for("Total years of professional experience") == "5"
+    # Total years are not years on a skill, whichever side of "experience" it is named
+    assert manager.answer_for("How many years of work experience do you have with SQL?") is None
+    assert manager.answer_for("How many years of Kubernetes experience do you have?") is None
+    assert manager.answer_for("Years of Python experience") is None
+
+
+def test_resume_answers_are_not_learned(tmp_path, linkedin_config):
+    from ai_agents.LinkedIn.easy_apply_agent.easy_apply_agent import LinkedInAutoApply
+    from managers.qa_store import QAStore
+
+    class FakePool:
+        def checkout(self):
+            return type("Manager", (), {"driver": object(), "wait": None})()
+
+    qa_store = QAStore(str(tmp_path / "answers.json"))
+    agent = LinkedInAutoApply("user", "secret", driver_pool=FakePool(), qa_store=qa_store)
+    agent.resume = resume(tmp_path)
+    field = {"question": "How many years of work experience do you have?", "placeholder": "", "type": "text",
+             "inputmode": "numeric", "value": ""}
+
+    assert agent.answer_text(field) == "5"
+    assert len(qa_store) == 0
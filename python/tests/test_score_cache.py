@@ -0,0 +1,69 @@
+import pandas as pd
+
+from ai_agents.LinkedIn.filter_job_agent import filter_job_agent, score_cache
+from ai_agents.LinkedIn.filter_job_agent.score_cache import ScoreCache
+
+VERDICT = {"Final Opinion": 7, "Reasoning": "stub"}
+
+
+class Clock:
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+
+    def time(self):
+        return self.now
+
+
+def cache_with_clock(tmp_path, monkeypatch, **kwargs):
+    clock = Clock()
+    monkeypatch.setattr(score_cache, "time", clock)
+    return ScoreCache(str(tmp_path / "cache.db"), **kwargs), clock
+
+
+def test_entries_expire_after_ttl(tmp_path, monkeypatch):
+    cache, clock = cache_with_clock(tmp_path, monkeypatch, ttl_days=1)
+    cache.put("old", VERDICT)
+    clock.now += 86400 - 1
+    assert cache.get("old") == VERDICT
+
+    clock.now += 2
+    assert cache.get("old") is None  # expired even though it was just read
+    cache.put("new", VERDICT)
+    assert cache.stats()["entries"] == 1  # the expired row is deleted on the next write
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path, monkeypatch):
+    cache, clock = cache_with_clock(tmp_path, monkeypatch, max_entries=2)
+    for key in ("a", "b"):
+        cache.put(key, VERDICT)
+        clock.now += 1
+    cache.get("a")  # "b" is now the least recently used
+    clock.now += 1
+    cache.put("c", VERDICT)
+
+    assert set(cache.get_many(["a", "b", "c"])) == {"a", "c"}
+    assert cache.stats() == {"hits": 3, "misses": 1, "hit_rate": 0.75, "entries": 2}
+
+
+def test_key_covers_resume_job_model_and_prompt_version():
+    key = ScoreCache.make_key("resume", "job", "model", "1")
+    assert key == ScoreCache.make_key("resume", "job", "model", "1")
+    assert len({key, ScoreCache.make_key("resume", "job", "model", "2"), ScoreCache.make_key("resume", "job", "other", "1"),
+                ScoreCache.make_key("resum", "ejob", "model", "1")}) == 4
+
+
+def test_prompt_version_bump_rescores_jobs(llm_stub, tmp_path, monkeypatch):
+    jobs_csv, output_csv = tmp_path / "jobs.csv", tmp_path / "filtered.csv"
+    pd.DataFrame({"Job Title": ["Backend Engineer"], "Description": ["Python services"]}).to_csv(jobs_csv, index=False)
+    cache = ScoreCache(str(tmp_path / "cache.db"))
+    score = lambda: filter_job_agent.process_jobs(
+        "Python developer", str(jobs_csv), str(output_csv), cache=cache,
+        base_url=llm_stub.base_url, requests_per_minute=600,
+    )
+
+    score()
+    score()
+    assert llm_stub.requests == 1
+    monkeypatch.setattr(filter_job_agent, "PROMPT_VERSION", "2")
+    score()
+    assert llm_stub.requests == 2
@@ -0,0 +1,44 @@
+import asyncio
+import time
+from urllib.parse import urlparse
+
+from ai_agents.LinkedIn.filter_job_agent import scoring_engine
+from ai_agents.LinkedIn.filter_job_agent.scoring_engine import ScoringEngine, TokenBucket
+
+
+def test_bucket_is_shared_across_event_loops():
+    bucket = TokenBucket(rate=100, capacity=1)
+
+    async def contend():
+        await asyncio.gather(*(bucket.acquire() for _ in range(3)))
+
+    asyncio.run(contend())
+    started = time.monotonic()
+    asyncio.run(contend())  # a new loop; waiters must not be tied to the first one
+    assert time.monotonic() - started >= 0.025
+
+
+def test_engine_scores_on_every_run(llm_stub):
+    engine = ScoringEngine(base_url=llm_stub.base_url, concurrency=4)
+    ScoringEngine._buckets[urlparse(llm_stub.base_url).netloc] = TokenBucket(rate=20, capacity=1)  # force waits
+    for run in range(3):
+        items = [(f"{run}-{i}", f"Title: job {i}") for i in range(4)]
+        outputs = engine.run(items)
+        assert all(outputs[key] != "{}" for key, _ in items)
+    assert llm_stub.requests == 12
+
+
+def test_each_answer_is_fsynced_and_skipped_on_resume(llm_stub, tmp_path, monkeypatch):
+    synced = []
+    real_fsync = scoring_engine.os.fsync
+    monkeypatch.setattr(scoring_engine.os, "fsync", lambda fd: synced.append(fd) or real_fsync(fd))
+    results_path = tmp_path / "scores.jsonl"
+    engine = ScoringEngine(base_url=llm_stub.base_url, requests_per_minute=600, results_path=str(results_path))
+    items = [(f"batch-{i}", f"Title: job {i}") for i in range(3)]
+
+    engine.run(items)
+
+    assert len(synced) == 3  # one per answered batch, before the next can be lost
+    assert set(engine.load_results()) == {"batch-0", "batch-1", "batch-2"}
+    engine.run(items)
+    assert llm_stub.requests == 3
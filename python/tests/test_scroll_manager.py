@@ -0,0 +1,60 @@
+from types import SimpleNamespace
+
+import pytest
+from selenium.common.exceptions import WebDriverException
+
+from managers.scroll_manager import SCROLL_STEP_SCRIPT, ScrollLoader
+
+
+class ScrollingDriver:
+    """Each scroll step loads `per_step` more cards, up to `total`; the list ends at `total`."""
+
+    def __init__(self, total, per_step=7, expected=None, fail_on_step=None):
+        self.total, self.per_step, self.expected, self.fail_on_step = total, per_step, expected, fail_on_step
+        self.cards = 0
+        self.steps = 0
+        self.timeouts = SimpleNamespace(script=30)
+
+    def set_script_timeout(self, seconds):
+        self.timeouts.script = seconds
+
+    def execute_async_script(self, script, *args):
+        assert script == SCROLL_STEP_SCRIPT
+        self.steps += 1
+        if self.steps == self.fail_on_step:
+            raise WebDriverException("chrome not reachable")
+        before = self.cards
+        if not (self.expected and before >= self.expected):
+            self.cards = min(self.cards + self.per_step, self.total)
+        return {"count": self.cards, "expected": self.expected, "appeared": self.cards > before,
+                "atBottom": self.cards == self.total}
+
+
+def test_stops_at_the_expected_count():
+    driver = ScrollingDriver(total=100, expected=25)
+
+    result = ScrollLoader(driver, "li", expected=25).load()
+
+    assert result["complete"] and result["cards"] >= 25
+    assert driver.steps == 4  # 7, 14, 21, 28: no scrolling on towards the 100 cards
+    assert driver.timeouts.script == 30
+
+
+def test_stops_when_nothing_new_appears_at_the_bottom():
+    driver = ScrollingDriver(total=20)
+
+    result = ScrollLoader(driver, "li", idle_ms=100).load()
+
+    assert result == dict(result, cards=20, expected=None, complete=True)
+    assert driver.steps == 4  # 7, 14, 20, then one idle step at the bottom
+    assert driver.timeouts.script == 30
+
+
+def test_incomplete_list_and_errors_restore_the_script_timeout():
+    driver = ScrollingDriver(total=20, expected=25)
+    assert not ScrollLoader(driver, "li", expected=25).load()["complete"]  # bottom reached short of expected
+
+    driver = ScrollingDriver(total=100, fail_on_step=2)
+    with pytest.raises(WebDriverException):
+        ScrollLoader(driver, "li").load()
+    assert driver.timeouts.script == 30
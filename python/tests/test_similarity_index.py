@@ -0,0 +1,54 @@
+import os
+
+import pandas as pd
+import pytest
+
+from ai_agents.LinkedIn.filter_job_agent.filter_job_agent import process_jobs
+from ai_agents.LinkedIn.filter_job_agent.score_cache import ScoreCache
+from ai_agents.LinkedIn.filter_job_agent.similarity_index import HashingEmbedder, SimilarityIndex, make_embedder
+
+RESUME = "Python developer: Django, PostgreSQL, AWS Lambda, ETL pipelines."
+
+
+def test_embedder_is_an_explicit_choice(tmp_path):
+    assert isinstance(SimilarityIndex(str(tmp_path)).embedder, HashingEmbedder)
+    with pytest.raises(ValueError):
+        make_embedder("word2vec")
+
+
+def test_index_rebuilds_when_keys_file_is_missing(tmp_path):
+    index = SimilarityIndex(str(tmp_path))
+    index.add(["a", "b"], ["python django", "java spring"])
+    os.remove(index.keys_path)
+
+    reopened = SimilarityIndex(str(tmp_path))
+    assert len(reopened) == 0
+    assert reopened.add(["a"], ["python django"]) == 1
+    assert reopened.rank(RESUME)[0][0] == "a"
+    assert len(SimilarityIndex(str(tmp_path))) == 1
+
+
+def test_process_jobs_sends_only_the_most_similar_jobs(llm_stub, tmp_path):
+    jobs_csv, output_csv = tmp_path / "jobs.csv", tmp_path / "filtered.csv"
+    pd.DataFrame({
+        "Job Title": ["Python Developer", "Sales Executive", "Backend Engineer", "Graphic Designer"],
+        "Description": [
+            "Django and PostgreSQL services on AWS Lambda",
+            "Cold calling and field sales targets",
+            "Python ETL pipelines and AWS Lambda",
+            "Photoshop, branding and print layouts",
+        ],
+    }).to_csv(jobs_csv, index=False)
+    index = SimilarityIndex(str(tmp_path / "similarity"))
+
+    process_jobs(
+        RESUME, str(jobs_csv), str(output_csv), cache=ScoreCache(str(tmp_path / "cache.db")),
+        similarity=index, similarity_top_k=2, base_url=llm_stub.base_url,
+    )
+
+    scored = pd.read_csv(output_csv)
+    assert llm_stub.requests == 2
+    assert len(index) == 4
+    assert scored["Similarity Score"].notna().all()
+    assert scored["Final Opinion"].tolist() == [7, 0, 7, 0]
+    assert scored.loc[1, "Reasoning"].startswith("Skipped by similarity ranking")
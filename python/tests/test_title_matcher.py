@@ -0,0 +1,41 @@
+import pytest
+
+from managers.config_manager import ConfigManager
+from managers.title_matcher import TitleMatcher
+
+TITLES = {
+    "Backend Engineer": True, "Python Developer": True, "C++ Developer": True, "ML Engineer (NLP)": True,
+    "Engineer": False, "Sales Executive": False, "Java Developer": False,
+}
+SCRAPED = [
+    "Senior Backend Engineer", "backend engineer - remote", "Python Developer II", "Lead C++ Developer",
+    "C Developer", "ML Engineer (NLP) - Bangalore", "ML Engineer", "Engineer", "Java Developer",
+    "Sales Executive", "", "PYTHON DEVELOPER",
+]
+
+
+def loop_match(titles, title):
+    """The per-title loop the scraper used before the compiled matcher."""
+    return any(known.lower() in title.lower() and enabled for known, enabled in titles.items())
+
+
+@pytest.mark.parametrize("titles", [TITLES, {"Data Scientist": False}, {}, dict(TITLES, **{"": True})])
+def test_matches_like_the_per_title_loop(titles):
+    matcher = TitleMatcher(titles)
+    assert [matcher.matches(t) for t in SCRAPED] == [loop_match(titles, t) for t in SCRAPED]
+
+
+def test_matcher_rebuilds_only_when_enabled_titles_change(linkedin_config):
+    config = ConfigManager("linkedin", flush_interval=60)
+    matcher = config.title_matcher()
+    assert not matcher.matches("Data Scientist")
+
+    config.update_title("Senior Data Scientist at Acme", False)  # a new disabled title is not compiled in
+    assert config.title_matcher() is matcher
+
+    config.update_title("Data Scientist", True)
+    rebuilt = config.title_matcher()
+    assert rebuilt is not matcher and rebuilt.matches("Lead Data Scientist")
+
+    config.update_title("Backend Engineer", False)
+    assert not config.title_matcher().matches("Backend Engineer")